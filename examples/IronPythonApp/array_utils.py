@@ -0,0 +1,85 @@
+"""Bulk conversion of sheet values for IronPython and pythonnet scripts.
+
+Each function receives values from the library in one call
+instead of reading Cell.Value of each cell.
+NumPy functions work only in CPython with pythonnet and NumPy installed.
+"""
+from System import Array, Double, Int64, IntPtr, String
+from System.Runtime.InteropServices import Marshal
+from SynSys.GSpreadsheetEasyAccess.Data import SheetModel
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def sheet_to_lists(sheet):
+    # type: (SheetModel) -> list[list[str]]
+    """Return all cell values of the sheet as a list of rows."""
+    values = sheet.ToArray()
+    row_count = values.GetLength(0)
+    column_count = values.GetLength(1)
+    # A two-dimensional array is enumerated row by row.
+    flat = list(values)
+    return [flat[i * column_count:(i + 1) * column_count] for i in range(row_count)]
+
+
+def lists_to_array(rows):
+    # type: (list[list[str]]) -> Array[str]
+    """Return a two-dimensional array string[,] for SheetModel.SetValues and SheetModel.AddRows.
+
+    Rows shorter than the longest row are padded with empty strings.
+    """
+    row_count = len(rows)
+    column_count = max(len(row) for row in rows) if rows else 0
+    values = Array.CreateInstance(String, row_count, column_count)
+    for i, row in enumerate(rows):
+        for j in range(column_count):
+            values[i, j] = row[j] if j < len(row) else ''
+    return values
+
+
+def sheet_to_numpy(sheet):
+    """Return all cell values of the sheet as a two-dimensional NumPy array of strings."""
+    _check_numpy()
+    values = sheet.ToArray()
+    return numpy.array(list(values), dtype=object).reshape(values.GetLength(0), values.GetLength(1))
+
+
+def double_column_to_numpy(sheet, column):
+    """Return a numeric column as a float64 NumPy array.
+
+    Values are copied from SheetModel.GetDoubleColumn with one Marshal.Copy call,
+    empty and non-numeric cells are NaN.
+
+    Args:
+        column (str | int): Column title or zero-based column index.
+    """
+    _check_numpy()
+    values = sheet.GetDoubleColumn(column)
+    result = numpy.empty(values.Length, dtype=numpy.float64)
+    if values.Length > 0:
+        Marshal.Copy(values, 0, _pointer(result), values.Length)
+    return result
+
+
+def numpy_to_double_array(values):
+    """Return a double[] for SheetModel.SetDoubleColumn copied from a one-dimensional array-like
+    with one Marshal.Copy call.
+    """
+    _check_numpy()
+    source = numpy.ascontiguousarray(values, dtype=numpy.float64)
+    result = Array.CreateInstance(Double, len(source))
+    if len(source) > 0:
+        Marshal.Copy(_pointer(source), result, 0, len(source))
+    return result
+
+
+def _pointer(array):
+    return IntPtr.__overloads__[Int64](array.ctypes.data)
+
+
+def _check_numpy():
+    if numpy is None:
+        raise ImportError('NumPy is required. Run the script with pythonnet in CPython with NumPy installed.')
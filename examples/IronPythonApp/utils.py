@@ -35,10 +35,12 @@ def print_sheet(sheet, status):
     print '| '  # type: ignore
     print ' {:>3}'.format(''),  # type: ignore
     print '|{}'.format('-' * 8) * len(sheet.Head) + '|'  # type: ignore
-    for row in sheet.Rows:
+    # All values are received in one call instead of reading each cell.
+    values = sheet.ToArray()
+    for i, row in enumerate(sheet.Rows):
         print '|{:>3}'.format(row.Number),  # type: ignore
-        for cell in row.Cells:
-            print '|{:>7}'.format(cell.Value),  # type: ignore
+        for j in range(values.GetLength(1)):
+            print '|{:>7}'.format(values[i, j]),  # type: ignore
         print '| {}'.format(row.Status)  # type: ignore
 
 
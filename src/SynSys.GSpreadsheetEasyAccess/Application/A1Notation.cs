@@ -0,0 +1,64 @@
+using System.Text;
+
+namespace SynSys.GSpreadsheetEasyAccess.Application
+{
+    /// <summary>
+    /// Provides methods for composing ranges in A1 notation.
+    /// <a href="https://developers.google.com/sheets/api/guides/concepts#cell">A1 notation</a>.
+    /// </summary>
+    internal static class A1Notation
+    {
+        /// <summary>
+        /// Get column letters by zero-based column index.
+        /// </summary>
+        /// <returns>A for 0, Z for 25, AA for 26 and so on.</returns>
+        internal static string GetColumnLetter(int columnIndex)
+        {
+            var letters = new StringBuilder();
+            int number = columnIndex + 1;
+
+            while (number > 0)
+            {
+                int remainder = (number - 1) % 26;
+                letters.Insert(0, (char)('A' + remainder));
+                number = (number - 1) / 26;
+            }
+
+            return letters.ToString();
+        }
+
+        /// <summary>
+        /// Get the whole column range, for example 'Sheet 1'!C:C.
+        /// </summary>
+        internal static string GetColumnRange(string sheetTitle, int columnIndex)
+        {
+            string letter = GetColumnLetter(columnIndex);
+            return $"{QuoteSheetTitle(sheetTitle)}!{letter}:{letter}";
+        }
+
+        /// <summary>
+        /// Get the range of whole rows, for example 'Sheet 1'!2:10.
+        /// </summary>
+        internal static string GetRowRange(string sheetTitle, int firstRowNumber, int lastRowNumber)
+        {
+            return $"{QuoteSheetTitle(sheetTitle)}!{firstRowNumber}:{lastRowNumber}";
+        }
+
+        /// <summary>
+        /// Get the first cell of the row, for example 'Sheet 1'!A2.
+        /// </summary>
+        internal static string GetRowStartCell(string sheetTitle, int rowNumber)
+        {
+            return $"{QuoteSheetTitle(sheetTitle)}!A{rowNumber}";
+        }
+
+        /// <summary>
+        /// Sheet title in single quotes so that titles with spaces and special characters
+        /// are correctly recognized in ranges.
+        /// </summary>
+        internal static string QuoteSheetTitle(string sheetTitle)
+        {
+            return $"'{sheetTitle.Replace("'", "''")}'";
+        }
+    }
+}
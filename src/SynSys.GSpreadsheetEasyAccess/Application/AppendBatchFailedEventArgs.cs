@@ -0,0 +1,28 @@
+using System;
+using System.Collections.Generic;
+
+namespace SynSys.GSpreadsheetEasyAccess.Application
+{
+    /// <summary>
+    /// Provides data for the SheetAppender.BatchFailed event.
+    /// </summary>
+    public class AppendBatchFailedEventArgs : EventArgs
+    {
+        /// <summary>
+        /// Rows that were not appended to the Google spreadsheet sheet.
+        /// </summary>
+        public IList<IList<object>> Rows { get; }
+
+        /// <summary>
+        /// The reason why the rows were not appended.
+        /// </summary>
+        public Exception Exception { get; }
+
+
+        internal AppendBatchFailedEventArgs(IList<IList<object>> rows, Exception exception)
+        {
+            Rows = rows;
+            Exception = exception;
+        }
+    }
+}
@@ -1,15 +1,21 @@
 using Google;
 using Google.Apis.Sheets.v4;
 using Google.Apis.Sheets.v4.Data;
+using Google.Apis.Util;
 using SynSys.GSpreadsheetEasyAccess.Application.Exceptions;
 using SynSys.GSpreadsheetEasyAccess.Authentication;
 using SynSys.GSpreadsheetEasyAccess.Authentication.Exceptions;
 using SynSys.GSpreadsheetEasyAccess.Data;
 using SynSys.GSpreadsheetEasyAccess.Data.Exceptions;
 using System;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
+using System.IO;
 using System.Linq;
 using System.Net;
+using System.Runtime.ExceptionServices;
+using System.Threading;
+using System.Threading.Tasks;
 
 namespace SynSys.GSpreadsheetEasyAccess.Application
 {
@@ -27,6 +33,35 @@ namespace SynSys.GSpreadsheetEasyAccess.Application
         private SheetsService _sheetsService;
         private Principal _principal;
 
+        /// <summary>
+        /// Determines how cell values are rendered when receiving sheets.
+        /// </summary>
+        /// <remarks>
+        /// ValueRenderMode.Unformatted is recommended for sheets with numeric columns,
+        /// which are read by the SheetModel.GetDoubleColumn and SheetModel.GetLongColumn methods.
+        /// </remarks>
+        public ValueRenderMode ValueRenderMode { get; set; } = ValueRenderMode.Formatted;
+
+        /// <summary>
+        /// Determines whether equal cell values of received sheets are stored as one string instance.
+        /// </summary>
+        /// <remarks>
+        /// Recommended for large sheets with columns that contain few distinct values,
+        /// see SheetModel.EnableValuePool.
+        /// </remarks>
+        public bool PoolCellValues { get; set; }
+
+        /// <summary>
+        /// Determines whether UpdateSheet writes appended rows into the slots of deleted rows
+        /// when this requires fewer operations than appending and deleting them separately.
+        /// </summary>
+        /// <remarks>
+        /// The order of rows in the sheet changes: appended rows take the places of deleted rows.<br/>
+        /// Appended Row instances whose data was moved are removed from the SheetModel.<br/>
+        /// Rows are not reused in sheets received with only some of the columns.
+        /// </remarks>
+        public bool ReuseDeletedRows { get; set; }
+
         /// <summary>
         /// To gain access to the Google Sheets API, you must be authenticated.
         /// It is necessary to specify who is authenticating.
@@ -57,6 +92,7 @@ namespace SynSys.GSpreadsheetEasyAccess.Application
         /// </returns>
         /// <exception cref="InvalidOperationException"/>
         /// <exception cref="UserAccessDeniedException"/>
+        /// <exception cref="OAuthSheetsScopeException"/>
         /// <exception cref="SpreadsheetNotFoundException"/>
         /// <exception cref="SheetExistsException"/>
         public SheetModel CreateSheet(string spreadsheetId, string sheetTitle)
@@ -64,54 +100,99 @@ namespace SynSys.GSpreadsheetEasyAccess.Application
             CheckSheetService();
             CheckPrincipal("Create sheet");
 
-            Spreadsheet spreadsheet = GetGoogleSpreadsheet(spreadsheetId);
+            return AddSheets(spreadsheetId, new[] { sheetTitle }, null, SheetMode.Simple, string.Empty)[0];
+        }
 
-            if (IsSheetExists(spreadsheet, sheetTitle))
+        /// <summary>
+        /// Creating Google spreadsheet sheet and get it's representation as an instance of the SheetModel type.
+        /// </summary>
+        /// <param name="spreadsheetId"></param>
+        /// <param name="sheetTitle"></param>
+        /// <param name="head"></param>
+        /// <remarks>
+        /// After creating a sheet, you can immediately work with it.
+        /// </remarks>
+        /// <returns>
+        /// SheetModel is a list of Rows without first row.<br/>
+        /// First row is a header of sheet.<br/>
+        /// Each row has the same number of cells.<br/>
+        /// Each cell has a string value and title,
+        /// which matches the column heading for the given cell.
+        /// </returns>
+        /// <exception cref="InvalidOperationException"/>
+        /// <exception cref="UserAccessDeniedException"/>
+        /// <exception cref="OAuthSheetsScopeException"/>
+        /// <exception cref="SpreadsheetNotFoundException"/>
+        /// <exception cref="InvalidSheetHeadException"/>
+        /// <exception cref="SheetExistsException"/>
+        public SheetModel CreateSheetWithHead(string spreadsheetId, string sheetTitle, IEnumerable<string> head)
+        {
+            if (!head.Any())
             {
-                throw new SheetExistsException()
-                {
-                    SpreadsheetId = spreadsheetId,
-                    SpreadsheetTitle = spreadsheet.Properties.Title,
-                    SheetTitle = sheetTitle
-                };
+                throw new InvalidSheetHeadException();
             }
 
-            try
+            CheckSheetService();
+            CheckPrincipal("Create sheet");
+
+            return AddSheets(spreadsheetId, new[] { sheetTitle }, head.ToList(), SheetMode.Head, string.Empty)[0];
+        }
+
+        /// <summary>
+        /// Creating Google spreadsheet sheet and get it's representation as an instance of the SheetModel type.
+        /// </summary>
+        /// <param name="spreadsheetId"></param>
+        /// <param name="sheetTitle"></param>
+        /// <param name="head"></param>
+        /// <param name="keyName"></param>
+        /// <remarks>
+        /// After creating a sheet, you can immediately work with it.
+        /// </remarks>
+        /// <returns>
+        /// SheetModel is a list of Rows without first row.<br/>
+        /// First row is a header of sheet.<br/>
+        /// Each row has the same number of cells and has key column.<br/>
+        /// Each cell has a string value and title,
+        /// which matches the column heading for the given cell.
+        /// </returns>
+        /// <exception cref="InvalidOperationException"/>
+        /// <exception cref="UserAccessDeniedException"/>
+        /// <exception cref="OAuthSheetsScopeException"/>
+        /// <exception cref="SpreadsheetNotFoundException"/>
+        /// <exception cref="InvalidSheetHeadException"/>
+        /// <exception cref="SheetKeyNotFoundException"/>
+        /// <exception cref="SheetExistsException"/>
+        public SheetModel CreateSheetWithHeadAndKey(string spreadsheetId, string sheetTitle, IEnumerable<string> head, string keyName)
+        {
+            if (!head.Any())
             {
-                CreateAddSheetRequest(spreadsheetId, sheetTitle).Execute();
+                throw new InvalidSheetHeadException();
             }
-            catch (Exception e)
+
+            if (!head.Contains(keyName))
             {
-                throw new CreatingSheetException("Couldn't add sheet to google spreadsheet", e)
-                {
-                    SpreadsheetId = spreadsheetId,
-                    SpreadsheetTitle = spreadsheet.Properties.Title,
-                    SheetTitle = sheetTitle,
-                };
+                throw new SheetKeyNotFoundException();
             }
 
-            var sheetModel = new SheetModel()
-            {
-                SpreadsheetTitle = spreadsheet.Properties.Title,
-                SpreadsheetId = spreadsheetId,
-                Title = sheetTitle,
-                Mode = SheetMode.Simple,
-                KeyName = string.Empty
-            };
+            CheckSheetService();
+            CheckPrincipal("Create sheet");
 
-            return sheetModel;
+            return AddSheets(spreadsheetId, new[] { sheetTitle }, head.ToList(), SheetMode.HeadAndKey, keyName)[0];
         }
 
         /// <summary>
-        /// Creating Google spreadsheet sheet and get it's representation as an instance of the SheetModel type.
+        /// Creating several Google spreadsheet sheets with the same head in one request
+        /// and get their representations as instances of the SheetModel type.
         /// </summary>
         /// <param name="spreadsheetId"></param>
-        /// <param name="sheetTitle"></param>
+        /// <param name="sheetTitles"></param>
         /// <param name="head"></param>
         /// <remarks>
-        /// After creating a sheet, you can immediately work with it.
+        /// After creating sheets, you can immediately work with them.<br/>
+        /// Either all sheets are created or none of them.
         /// </remarks>
         /// <returns>
+        /// SheetModels in the order of sheetTitles.<br/>
         /// SheetModel is a list of Rows without first row.<br/>
         /// First row is a header of sheet.<br/>
         /// Each row has the same number of cells.<br/>
@@ -120,37 +201,41 @@ namespace SynSys.GSpreadsheetEasyAccess.Application
         /// </returns>
         /// <exception cref="InvalidOperationException"/>
         /// <exception cref="UserAccessDeniedException"/>
+        /// <exception cref="OAuthSheetsScopeException"/>
         /// <exception cref="SpreadsheetNotFoundException"/>
         /// <exception cref="InvalidSheetHeadException"/>
         /// <exception cref="SheetExistsException"/>
-        public SheetModel CreateSheetWithHead(string spreadsheetId, string sheetTitle, IEnumerable<string> head)
+        /// <exception cref="ArgumentNullException"/>
+        /// <exception cref="ArgumentException"/>
+        public IList<SheetModel> CreateSheetsWithHead(string spreadsheetId, IEnumerable<string> sheetTitles, IEnumerable<string> head)
         {
             if (!head.Any())
             {
                 throw new InvalidSheetHeadException();
             }
 
-            var sheetModel = CreateSheet(spreadsheetId, sheetTitle);
-
-            sheetModel.Mode = SheetMode.Head;
+            List<string> titles = CheckSheetTitles(sheetTitles);
 
-            AddHead(sheetModel, head);
-            UpdateSheet(sheetModel);
+            CheckSheetService();
+            CheckPrincipal("Create sheets");
 
-            return sheetModel;
+            return AddSheets(spreadsheetId, titles, head.ToList(), SheetMode.Head, string.Empty);
         }
 
         /// <summary>
-        /// Creating Google spreadsheet sheet and get it's representation as an instance of the SheetModel type.
+        /// Creating several Google spreadsheet sheets with the same head in one request
+        /// and get their representations as instances of the SheetModel type.
         /// </summary>
         /// <param name="spreadsheetId"></param>
-        /// <param name="sheetTitle"></param>
+        /// <param name="sheetTitles"></param>
         /// <param name="head"></param>
         /// <param name="keyName"></param>
         /// <remarks>
-        /// After creating a sheet, you can immediately work with it.
+        /// After creating sheets, you can immediately work with them.<br/>
+        /// Either all sheets are created or none of them.
         /// </remarks>
         /// <returns>
+        /// SheetModels in the order of sheetTitles.<br/>
         /// SheetModel is a list of Rows without first row.<br/>
         /// First row is a header of sheet.<br/>
         /// Each row has the same number of cells and has key column.<br/>
@@ -159,11 +244,14 @@ namespace SynSys.GSpreadsheetEasyAccess.Application
         /// </returns>
         /// <exception cref="InvalidOperationException"/>
         /// <exception cref="UserAccessDeniedException"/>
+        /// <exception cref="OAuthSheetsScopeException"/>
         /// <exception cref="SpreadsheetNotFoundException"/>
         /// <exception cref="InvalidSheetHeadException"/>
         /// <exception cref="SheetKeyNotFoundException"/>
         /// <exception cref="SheetExistsException"/>
-        public SheetModel CreateSheetWithHeadAndKey(string spreadsheetId, string sheetTitle, IEnumerable<string> head, string keyName)
+        /// <exception cref="ArgumentNullException"/>
+        /// <exception cref="ArgumentException"/>
+        public IList<SheetModel> CreateSheetsWithHeadAndKey(string spreadsheetId, IEnumerable<string> sheetTitles, IEnumerable<string> head, string keyName)
         {
             if (!head.Any())
             {
@@ -175,15 +263,12 @@ namespace SynSys.GSpreadsheetEasyAccess.Application
                 throw new SheetKeyNotFoundException();
             }
 
-            var sheetModel = CreateSheet(spreadsheetId, sheetTitle);
+            List<string> titles = CheckSheetTitles(sheetTitles);
 
-            sheetModel.Mode = SheetMode.HeadAndKey;
-            sheetModel.KeyName = keyName;
-
-            AddHead(sheetModel, head);
-            UpdateSheet(sheetModel);
+            CheckSheetService();
+            CheckPrincipal("Create sheets");
 
-            return sheetModel;
+            return AddSheets(spreadsheetId, titles, head.ToList(), SheetMode.HeadAndKey, keyName);
         }
 
         /// <summary>
@@ -231,6 +316,7 @@ namespace SynSys.GSpreadsheetEasyAccess.Application
 
             var sheetModel = new SheetModel()
             {
+                IsValuePoolEnabled = PoolCellValues,
                 SpreadsheetId = spreadsheetId,
                 Gid = gid
             };
@@ -270,6 +356,7 @@ namespace SynSys.GSpreadsheetEasyAccess.Application
 
             var sheetModel = new SheetModel()
             {
+                IsValuePoolEnabled = PoolCellValues,
                 SpreadsheetId = spreadsheetId,
                 Title = sheetTitle
             };
@@ -336,6 +423,7 @@ namespace SynSys.GSpreadsheetEasyAccess.Application
 
             var sheetModel = new SheetModel()
             {
+                IsValuePoolEnabled = PoolCellValues,
                 SpreadsheetId = spreadsheetId,
                 Gid = gid
             };
@@ -379,6 +467,7 @@ namespace SynSys.GSpreadsheetEasyAccess.Application
 
             var sheetModel = new SheetModel()
             {
+                IsValuePoolEnabled = PoolCellValues,
                 SpreadsheetId = spreadsheetId,
                 Title = sheetTitle
             };
@@ -398,6 +487,140 @@ namespace SynSys.GSpreadsheetEasyAccess.Application
             return sheetModel;
         }
 
+        /// <summary>
+        /// Receiving data of some columns from a Google spreadsheet sheet as an instance of the SheetModel type.
+        /// </summary>
+        /// <remarks>
+        /// Only the head and the given columns are downloaded.<br/>
+        /// Changes of the received sheet are written back to the same columns.<br/>
+        /// Rows after the last non-empty cell of the given columns are not included.
+        /// </remarks>
+        /// <param name="uri"></param>
+        /// <param name="columns"></param>
+        /// <returns>
+        /// SheetModel is a list of Rows without first row.<br/>
+        /// First row is a header of sheet and contains only the given columns.<br/>
+        /// Each row has the same number of cells.<br/>
+        /// Each cell has a string value and title, 
+        /// which matches the column heading for the given cell.
+        /// </returns>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="InvalidApiKeyException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="SpreadsheetNotFoundException"></exception>
+        /// <exception cref="SheetNotFoundException"></exception>
+        /// <exception cref="EmptySheetException"></exception>
+        /// <exception cref="InvalidSheetHeadException"></exception>
+        /// <exception cref="ArgumentException"></exception>
+        public SheetModel GetSheetWithHead(string uri, IEnumerable<string> columns)
+        {
+            return GetSheetWithHead(
+                HttpUtils.GetSpreadsheetIdFromUri(uri),
+                HttpUtils.GetGidFromUri(uri),
+                columns
+            );
+        }
+
+        /// <summary>
+        /// Receiving data of some columns from a Google spreadsheet sheet as an instance of the SheetModel type.
+        /// </summary>
+        /// <remarks>
+        /// Only the head and the given columns are downloaded.<br/>
+        /// Changes of the received sheet are written back to the same columns.<br/>
+        /// Rows after the last non-empty cell of the given columns are not included.
+        /// </remarks>
+        /// <param name="spreadsheetId"></param>
+        /// <param name="gid"></param>
+        /// <param name="columns"></param>
+        /// <returns>
+        /// SheetModel is a list of Rows without first row.<br/>
+        /// First row is a header of sheet and contains only the given columns.<br/>
+        /// Each row has the same number of cells.<br/>
+        /// Each cell has a string value and title, 
+        /// which matches the column heading for the given cell.
+        /// </returns>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="InvalidApiKeyException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="SpreadsheetNotFoundException"></exception>
+        /// <exception cref="SheetNotFoundException"></exception>
+        /// <exception cref="EmptySheetException"></exception>
+        /// <exception cref="InvalidSheetHeadException"></exception>
+        /// <exception cref="ArgumentException"></exception>
+        public SheetModel GetSheetWithHead(string spreadsheetId, int gid, IEnumerable<string> columns)
+        {
+            CheckSheetService();
+
+            var sheetModel = new SheetModel()
+            {
+                IsValuePoolEnabled = PoolCellValues,
+                SpreadsheetId = spreadsheetId,
+                Gid = gid
+            };
+
+            Spreadsheet spreadsheet = GetGoogleSpreadsheet(spreadsheetId);
+            Sheet sheet = GetGoogleSheet(spreadsheet, gid);
+
+            sheetModel.SpreadsheetTitle = spreadsheet.Properties.Title;
+            sheetModel.Title = sheet.Properties.Title;
+            sheetModel.Mode = SheetMode.Head;
+            sheetModel.KeyName = string.Empty;
+
+            FillColumns(sheetModel, columns);
+
+            return sheetModel;
+        }
+
+        /// <summary>
+        /// Receiving data of some columns from a Google spreadsheet sheet as an instance of the SheetModel type.
+        /// </summary>
+        /// <remarks>
+        /// Only the head and the given columns are downloaded.<br/>
+        /// Changes of the received sheet are written back to the same columns.<br/>
+        /// Rows after the last non-empty cell of the given columns are not included.
+        /// </remarks>
+        /// <param name="spreadsheetId"></param>
+        /// <param name="sheetTitle"></param>
+        /// <param name="columns"></param>
+        /// <returns>
+        /// SheetModel is a list of Rows without first row.<br/>
+        /// First row is a header of sheet and contains only the given columns.<br/>
+        /// Each row has the same number of cells.<br/>
+        /// Each cell has a string value and title, 
+        /// which matches the column heading for the given cell.
+        /// </returns>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="InvalidApiKeyException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="SpreadsheetNotFoundException"></exception>
+        /// <exception cref="SheetNotFoundException"></exception>
+        /// <exception cref="EmptySheetException"></exception>
+        /// <exception cref="InvalidSheetHeadException"></exception>
+        /// <exception cref="ArgumentException"></exception>
+        public SheetModel GetSheetWithHead(string spreadsheetId, string sheetTitle, IEnumerable<string> columns)
+        {
+            CheckSheetService();
+
+            var sheetModel = new SheetModel()
+            {
+                IsValuePoolEnabled = PoolCellValues,
+                SpreadsheetId = spreadsheetId,
+                Title = sheetTitle
+            };
+
+            Spreadsheet spreadsheet = GetGoogleSpreadsheet(spreadsheetId);
+            Sheet sheet = GetGoogleSheet(spreadsheet, sheetTitle);
+
+            sheetModel.SpreadsheetTitle = spreadsheet.Properties.Title;
+            sheetModel.Gid = sheet.Properties.SheetId.Value;
+            sheetModel.Mode = SheetMode.Head;
+            sheetModel.KeyName = string.Empty;
+
+            FillColumns(sheetModel, columns);
+
+            return sheetModel;
+        }
+
         /// <summary>
         /// Receiving data from a Google spreadsheet sheet as an instance of the SheetModel type.
         /// </summary>
@@ -452,6 +675,7 @@ namespace SynSys.GSpreadsheetEasyAccess.Application
 
             var sheetModel = new SheetModel()
             {
+                IsValuePoolEnabled = PoolCellValues,
                 SpreadsheetId = spreadsheetId,
                 Gid = gid
             };
@@ -497,6 +721,7 @@ namespace SynSys.GSpreadsheetEasyAccess.Application
 
             var sheetModel = new SheetModel()
             {
+                IsValuePoolEnabled = PoolCellValues,
                 SpreadsheetId = spreadsheetId,
                 Title = sheetTitle
             };
@@ -517,213 +742,2099 @@ namespace SynSys.GSpreadsheetEasyAccess.Application
         }
 
         /// <summary>
-        /// Update the Google spreadsheet sheet based on the modified instance of the SheetModel type.
+        /// Receiving data of some columns from a Google spreadsheet sheet as an instance of the SheetModel type.
         /// </summary>
         /// <remarks>
-        /// The method changes the data in the cells,
-        /// adds rows to the end of the sheet and removes the selected rows.<br />
-        /// All these actions are based on requests to Google.
+        /// Only the head and the given columns are downloaded.<br/>
+        /// Changes of the received sheet are written back to the same columns.<br/>
+        /// The key column is always included.<br/>
+        /// Rows after the last non-empty cell of the given columns are not included.
         /// </remarks>
-        /// <param name="sheetModel">Google spreadsheet sheet model</param>
+        /// <param name="uri"></param>
+        /// <param name="keyName"></param>
+        /// <param name="columns"></param>
+        /// <returns>
+        /// SheetModel is a list of Rows without first row.<br/>
+        /// First row is a header of sheet and contains only the given columns.<br/>
+        /// Each row has the same number of cells and has key column.<br/>
+        /// Each cell has a string value and title, 
+        /// which matches the column heading for the given cell.
+        /// </returns>
         /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="InvalidApiKeyException"></exception>
         /// <exception cref="UserAccessDeniedException"></exception>
-        /// <exception cref="OAuthSheetsScopeException"></exception>
-        public void UpdateSheet(SheetModel sheetModel)
+        /// <exception cref="SpreadsheetNotFoundException"></exception>
+        /// <exception cref="SheetNotFoundException"></exception>
+        /// <exception cref="SheetKeyNotFoundException"></exception>
+        /// <exception cref="EmptySheetException"></exception>
+        /// <exception cref="InvalidSheetHeadException"></exception>
+        /// <exception cref="ArgumentException"></exception>
+        public SheetModel GetSheetWithHeadAndKey(string uri, string keyName, IEnumerable<string> columns)
         {
-            CheckSheetService();
-            CheckPrincipal("Update sheet");
-
-            try
-            {
-                CreateAppendRequest(sheetModel)?.Execute();
-                CreateUpdateRequest(sheetModel)?.Execute();
-                CreateDeleteRequest(sheetModel)?.Execute();
+            return GetSheetWithHeadAndKey(
+                HttpUtils.GetSpreadsheetIdFromUri(uri),
+                HttpUtils.GetGidFromUri(uri),
+                keyName,
+                columns
+            );
+        }
 
-                sheetModel.ClearDeletedRows();
-                sheetModel.RenumberRows();
-                sheetModel.ResetRowStatuses();
-            }
-            catch (GoogleApiException e) when (e.HttpStatusCode == HttpStatusCode.Forbidden && e.Error.Message.Contains("insufficient authentication scopes"))
-            {
-                throw new OAuthSheetsScopeException(e.Error.Message, e);
-            }
-            catch (GoogleApiException e) when (e.HttpStatusCode == HttpStatusCode.Forbidden && e.Error.Message.Contains("does not have permission"))
-            {
+        /// <summary>
+        /// Receiving data of some columns from a Google spreadsheet sheet as an instance of the SheetModel type.
+        /// </summary>
+        /// <remarks>
+        /// Only the head and the given columns are downloaded.<br/>
+        /// Changes of the received sheet are written back to the same columns.<br/>
+        /// The key column is always included.<br/>
+        /// Rows after the last non-empty cell of the given columns are not included.
+        /// </remarks>
+        /// <param name="spreadsheetId"></param>
+        /// <param name="gid"></param>
+        /// <param name="keyName"></param>
+        /// <param name="columns"></param>
+        /// <returns>
+        /// SheetModel is a list of Rows without first row.<br/>
+        /// First row is a header of sheet and contains only the given columns.<br/>
+        /// Each row has the same number of cells and has key column.<br/>
+        /// Each cell has a string value and title, 
+        /// which matches the column heading for the given cell.
+        /// </returns>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="InvalidApiKeyException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="SpreadsheetNotFoundException"></exception>
+        /// <exception cref="SheetNotFoundException"></exception>
+        /// <exception cref="SheetKeyNotFoundException"></exception>
+        /// <exception cref="EmptySheetException"></exception>
+        /// <exception cref="InvalidSheetHeadException"></exception>
+        /// <exception cref="ArgumentException"></exception>
+        public SheetModel GetSheetWithHeadAndKey(string spreadsheetId, int gid, string keyName, IEnumerable<string> columns)
+        {
+            CheckSheetService();
+
+            var sheetModel = new SheetModel()
+            {
+                IsValuePoolEnabled = PoolCellValues,
+                SpreadsheetId = spreadsheetId,
+                Gid = gid
+            };
+
+            Spreadsheet spreadsheet = GetGoogleSpreadsheet(spreadsheetId);
+            Sheet sheet = GetGoogleSheet(spreadsheet, gid);
+
+            sheetModel.SpreadsheetTitle = spreadsheet.Properties.Title;
+            sheetModel.Title = sheet.Properties.Title;
+            sheetModel.Mode = SheetMode.HeadAndKey;
+            sheetModel.KeyName = keyName;
+
+            FillColumns(sheetModel, columns);
+
+            return sheetModel;
+        }
+
+        /// <summary>
+        /// Receiving data of some columns from a Google spreadsheet sheet as an instance of the SheetModel type.
+        /// </summary>
+        /// <remarks>
+        /// Only the head and the given columns are downloaded.<br/>
+        /// Changes of the received sheet are written back to the same columns.<br/>
+        /// The key column is always included.<br/>
+        /// Rows after the last non-empty cell of the given columns are not included.
+        /// </remarks>
+        /// <param name="spreadsheetId"></param>
+        /// <param name="sheetTitle"></param>
+        /// <param name="keyName"></param>
+        /// <param name="columns"></param>
+        /// <returns>
+        /// SheetModel is a list of Rows without first row.<br/>
+        /// First row is a header of sheet and contains only the given columns.<br/>
+        /// Each row has the same number of cells and has key column.<br/>
+        /// Each cell has a string value and title, 
+        /// which matches the column heading for the given cell.
+        /// </returns>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="InvalidApiKeyException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="SpreadsheetNotFoundException"></exception>
+        /// <exception cref="SheetNotFoundException"></exception>
+        /// <exception cref="SheetKeyNotFoundException"></exception>
+        /// <exception cref="EmptySheetException"></exception>
+        /// <exception cref="InvalidSheetHeadException"></exception>
+        /// <exception cref="ArgumentException"></exception>
+        public SheetModel GetSheetWithHeadAndKey(string spreadsheetId, string sheetTitle, string keyName, IEnumerable<string> columns)
+        {
+            CheckSheetService();
+
+            var sheetModel = new SheetModel()
+            {
+                IsValuePoolEnabled = PoolCellValues,
+                SpreadsheetId = spreadsheetId,
+                Title = sheetTitle
+            };
+
+            Spreadsheet spreadsheet = GetGoogleSpreadsheet(spreadsheetId);
+            Sheet sheet = GetGoogleSheet(spreadsheet, sheetTitle);
+
+            sheetModel.SpreadsheetTitle = spreadsheet.Properties.Title;
+            sheetModel.Gid = sheet.Properties.SheetId.Value;
+            sheetModel.Mode = SheetMode.HeadAndKey;
+            sheetModel.KeyName = keyName;
+
+            FillColumns(sheetModel, columns);
+
+            return sheetModel;
+        }
+
+        /// <summary>
+        /// Receiving a window of rows from a Google spreadsheet sheet as an instance of the SheetModel type.
+        /// </summary>
+        /// <remarks>
+        /// Only rows from firstRowNumber to lastRowNumber inclusive are downloaded.<br/>
+        /// Row numbers match the row numbers of the Google spreadsheet sheet.<br/>
+        /// Rows can be appended only if lastRowNumber reaches the end of the sheet.
+        /// </remarks>
+        /// <param name="spreadsheetId"></param>
+        /// <param name="gid"></param>
+        /// <param name="firstRowNumber">Number of the first row of the window</param>
+        /// <param name="lastRowNumber">Number of the last row of the window</param>
+        /// <returns>
+        /// SheetModel is a list of Rows of the window.<br/>
+        /// Header is absent.<br/>
+        /// Each row has the same number of cells.<br/>
+        /// Each cell has a string value.
+        /// </returns>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="InvalidApiKeyException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="SpreadsheetNotFoundException"></exception>
+        /// <exception cref="SheetNotFoundException"></exception>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        public SheetModel GetSheet(string spreadsheetId, int gid, int firstRowNumber, int lastRowNumber)
+        {
+            CheckSheetService();
+
+            var sheetModel = new SheetModel()
+            {
+                IsValuePoolEnabled = PoolCellValues,
+                SpreadsheetId = spreadsheetId,
+                Gid = gid
+            };
+
+            Spreadsheet spreadsheet = GetGoogleSpreadsheet(spreadsheetId);
+            Sheet sheet = GetGoogleSheet(spreadsheet, gid);
+
+            sheetModel.SpreadsheetTitle = spreadsheet.Properties.Title;
+            sheetModel.Title = sheet.Properties.Title;
+            sheetModel.Mode = SheetMode.Simple;
+            sheetModel.KeyName = string.Empty;
+
+            FillRowWindow(sheetModel, sheet, firstRowNumber, lastRowNumber);
+
+            return sheetModel;
+        }
+
+        /// <summary>
+        /// Receiving a window of rows from a Google spreadsheet sheet as an instance of the SheetModel type.
+        /// </summary>
+        /// <remarks>
+        /// Only rows from firstRowNumber to lastRowNumber inclusive are downloaded.<br/>
+        /// Row numbers match the row numbers of the Google spreadsheet sheet.<br/>
+        /// Rows can be appended only if lastRowNumber reaches the end of the sheet.
+        /// </remarks>
+        /// <param name="spreadsheetId"></param>
+        /// <param name="sheetTitle"></param>
+        /// <param name="firstRowNumber">Number of the first row of the window</param>
+        /// <param name="lastRowNumber">Number of the last row of the window</param>
+        /// <returns>
+        /// SheetModel is a list of Rows of the window.<br/>
+        /// Header is absent.<br/>
+        /// Each row has the same number of cells.<br/>
+        /// Each cell has a string value.
+        /// </returns>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="InvalidApiKeyException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="SpreadsheetNotFoundException"></exception>
+        /// <exception cref="SheetNotFoundException"></exception>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        public SheetModel GetSheet(string spreadsheetId, string sheetTitle, int firstRowNumber, int lastRowNumber)
+        {
+            CheckSheetService();
+
+            var sheetModel = new SheetModel()
+            {
+                IsValuePoolEnabled = PoolCellValues,
+                SpreadsheetId = spreadsheetId,
+                Title = sheetTitle
+            };
+
+            Spreadsheet spreadsheet = GetGoogleSpreadsheet(spreadsheetId);
+            Sheet sheet = GetGoogleSheet(spreadsheet, sheetTitle);
+
+            sheetModel.SpreadsheetTitle = spreadsheet.Properties.Title;
+            sheetModel.Gid = sheet.Properties.SheetId.Value;
+            sheetModel.Mode = SheetMode.Simple;
+            sheetModel.KeyName = string.Empty;
+
+            FillRowWindow(sheetModel, sheet, firstRowNumber, lastRowNumber);
+
+            return sheetModel;
+        }
+
+        /// <summary>
+        /// Receiving a window of rows from a Google spreadsheet sheet as an instance of the SheetModel type.
+        /// </summary>
+        /// <remarks>
+        /// Only the head and rows from firstRowNumber to lastRowNumber inclusive are downloaded.<br/>
+        /// Row numbers match the row numbers of the Google spreadsheet sheet.<br/>
+        /// Rows can be appended only if lastRowNumber reaches the end of the sheet.
+        /// </remarks>
+        /// <param name="spreadsheetId"></param>
+        /// <param name="gid"></param>
+        /// <param name="firstRowNumber">Number of the first row of the window</param>
+        /// <param name="lastRowNumber">Number of the last row of the window</param>
+        /// <returns>
+        /// SheetModel is a list of Rows of the window.<br/>
+        /// First row is a header of sheet.<br/>
+        /// Each row has the same number of cells.<br/>
+        /// Each cell has a string value and title, 
+        /// which matches the column heading for the given cell.
+        /// </returns>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="InvalidApiKeyException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="SpreadsheetNotFoundException"></exception>
+        /// <exception cref="SheetNotFoundException"></exception>
+        /// <exception cref="EmptySheetException"></exception>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        public SheetModel GetSheetWithHead(string spreadsheetId, int gid, int firstRowNumber, int lastRowNumber)
+        {
+            CheckSheetService();
+
+            var sheetModel = new SheetModel()
+            {
+                IsValuePoolEnabled = PoolCellValues,
+                SpreadsheetId = spreadsheetId,
+                Gid = gid
+            };
+
+            Spreadsheet spreadsheet = GetGoogleSpreadsheet(spreadsheetId);
+            Sheet sheet = GetGoogleSheet(spreadsheet, gid);
+
+            sheetModel.SpreadsheetTitle = spreadsheet.Properties.Title;
+            sheetModel.Title = sheet.Properties.Title;
+            sheetModel.Mode = SheetMode.Head;
+            sheetModel.KeyName = string.Empty;
+
+            FillRowWindow(sheetModel, sheet, firstRowNumber, lastRowNumber);
+
+            return sheetModel;
+        }
+
+        /// <summary>
+        /// Receiving a window of rows from a Google spreadsheet sheet as an instance of the SheetModel type.
+        /// </summary>
+        /// <remarks>
+        /// Only the head and rows from firstRowNumber to lastRowNumber inclusive are downloaded.<br/>
+        /// Row numbers match the row numbers of the Google spreadsheet sheet.<br/>
+        /// Rows can be appended only if lastRowNumber reaches the end of the sheet.
+        /// </remarks>
+        /// <param name="spreadsheetId"></param>
+        /// <param name="sheetTitle"></param>
+        /// <param name="firstRowNumber">Number of the first row of the window</param>
+        /// <param name="lastRowNumber">Number of the last row of the window</param>
+        /// <returns>
+        /// SheetModel is a list of Rows of the window.<br/>
+        /// First row is a header of sheet.<br/>
+        /// Each row has the same number of cells.<br/>
+        /// Each cell has a string value and title, 
+        /// which matches the column heading for the given cell.
+        /// </returns>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="InvalidApiKeyException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="SpreadsheetNotFoundException"></exception>
+        /// <exception cref="SheetNotFoundException"></exception>
+        /// <exception cref="EmptySheetException"></exception>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        public SheetModel GetSheetWithHead(string spreadsheetId, string sheetTitle, int firstRowNumber, int lastRowNumber)
+        {
+            CheckSheetService();
+
+            var sheetModel = new SheetModel()
+            {
+                IsValuePoolEnabled = PoolCellValues,
+                SpreadsheetId = spreadsheetId,
+                Title = sheetTitle
+            };
+
+            Spreadsheet spreadsheet = GetGoogleSpreadsheet(spreadsheetId);
+            Sheet sheet = GetGoogleSheet(spreadsheet, sheetTitle);
+
+            sheetModel.SpreadsheetTitle = spreadsheet.Properties.Title;
+            sheetModel.Gid = sheet.Properties.SheetId.Value;
+            sheetModel.Mode = SheetMode.Head;
+            sheetModel.KeyName = string.Empty;
+
+            FillRowWindow(sheetModel, sheet, firstRowNumber, lastRowNumber);
+
+            return sheetModel;
+        }
+
+        /// <summary>
+        /// Receiving a window of rows from a Google spreadsheet sheet as an instance of the SheetModel type.
+        /// </summary>
+        /// <remarks>
+        /// Only the head and rows from firstRowNumber to lastRowNumber inclusive are downloaded.<br/>
+        /// Row numbers match the row numbers of the Google spreadsheet sheet.<br/>
+        /// Rows can be appended only if lastRowNumber reaches the end of the sheet.
+        /// </remarks>
+        /// <param name="spreadsheetId"></param>
+        /// <param name="gid"></param>
+        /// <param name="keyName"></param>
+        /// <param name="firstRowNumber">Number of the first row of the window</param>
+        /// <param name="lastRowNumber">Number of the last row of the window</param>
+        /// <returns>
+        /// SheetModel is a list of Rows of the window.<br/>
+        /// First row is a header of sheet.<br/>
+        /// Each row has the same number of cells and has key column.<br/>
+        /// Each cell has a string value and title, 
+        /// which matches the column heading for the given cell.
+        /// </returns>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="InvalidApiKeyException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="SpreadsheetNotFoundException"></exception>
+        /// <exception cref="SheetNotFoundException"></exception>
+        /// <exception cref="SheetKeyNotFoundException"></exception>
+        /// <exception cref="EmptySheetException"></exception>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        public SheetModel GetSheetWithHeadAndKey(string spreadsheetId, int gid, string keyName, int firstRowNumber, int lastRowNumber)
+        {
+            CheckSheetService();
+
+            var sheetModel = new SheetModel()
+            {
+                IsValuePoolEnabled = PoolCellValues,
+                SpreadsheetId = spreadsheetId,
+                Gid = gid
+            };
+
+            Spreadsheet spreadsheet = GetGoogleSpreadsheet(spreadsheetId);
+            Sheet sheet = GetGoogleSheet(spreadsheet, gid);
+
+            sheetModel.SpreadsheetTitle = spreadsheet.Properties.Title;
+            sheetModel.Title = sheet.Properties.Title;
+            sheetModel.Mode = SheetMode.HeadAndKey;
+            sheetModel.KeyName = keyName;
+
+            FillRowWindow(sheetModel, sheet, firstRowNumber, lastRowNumber);
+
+            return sheetModel;
+        }
+
+        /// <summary>
+        /// Receiving a window of rows from a Google spreadsheet sheet as an instance of the SheetModel type.
+        /// </summary>
+        /// <remarks>
+        /// Only the head and rows from firstRowNumber to lastRowNumber inclusive are downloaded.<br/>
+        /// Row numbers match the row numbers of the Google spreadsheet sheet.<br/>
+        /// Rows can be appended only if lastRowNumber reaches the end of the sheet.
+        /// </remarks>
+        /// <param name="spreadsheetId"></param>
+        /// <param name="sheetTitle"></param>
+        /// <param name="keyName"></param>
+        /// <param name="firstRowNumber">Number of the first row of the window</param>
+        /// <param name="lastRowNumber">Number of the last row of the window</param>
+        /// <returns>
+        /// SheetModel is a list of Rows of the window.<br/>
+        /// First row is a header of sheet.<br/>
+        /// Each row has the same number of cells and has key column.<br/>
+        /// Each cell has a string value and title, 
+        /// which matches the column heading for the given cell.
+        /// </returns>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="InvalidApiKeyException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="SpreadsheetNotFoundException"></exception>
+        /// <exception cref="SheetNotFoundException"></exception>
+        /// <exception cref="SheetKeyNotFoundException"></exception>
+        /// <exception cref="EmptySheetException"></exception>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        public SheetModel GetSheetWithHeadAndKey(string spreadsheetId, string sheetTitle, string keyName, int firstRowNumber, int lastRowNumber)
+        {
+            CheckSheetService();
+
+            var sheetModel = new SheetModel()
+            {
+                IsValuePoolEnabled = PoolCellValues,
+                SpreadsheetId = spreadsheetId,
+                Title = sheetTitle
+            };
+
+            Spreadsheet spreadsheet = GetGoogleSpreadsheet(spreadsheetId);
+            Sheet sheet = GetGoogleSheet(spreadsheet, sheetTitle);
+
+            sheetModel.SpreadsheetTitle = spreadsheet.Properties.Title;
+            sheetModel.Gid = sheet.Properties.SheetId.Value;
+            sheetModel.Mode = SheetMode.HeadAndKey;
+            sheetModel.KeyName = keyName;
+
+            FillRowWindow(sheetModel, sheet, firstRowNumber, lastRowNumber);
+
+            return sheetModel;
+        }
+
+        /// <summary>
+        /// Receiving rows following the given row from a Google spreadsheet sheet as an instance of the SheetModel type.
+        /// </summary>
+        /// <remarks>
+        /// Intended for sheets to which rows are only appended.<br/>
+        /// Only new rows are downloaded, their numbers match the row numbers of the Google spreadsheet sheet.<br/>
+        /// If there are no new rows, the sheet is empty.
+        /// </remarks>
+        /// <param name="spreadsheetId"></param>
+        /// <param name="gid"></param>
+        /// <param name="lastKnownRowNumber">Number of the last row that was already received</param>
+        /// <returns>
+        /// SheetModel is a list of Rows of the window.<br/>
+        /// Header is absent.<br/>
+        /// Each row has the same number of cells.<br/>
+        /// Each cell has a string value.
+        /// </returns>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="InvalidApiKeyException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="SpreadsheetNotFoundException"></exception>
+        /// <exception cref="SheetNotFoundException"></exception>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        public SheetModel GetSheetTail(string spreadsheetId, int gid, int lastKnownRowNumber)
+        {
+            CheckSheetService();
+
+            var sheetModel = new SheetModel()
+            {
+                IsValuePoolEnabled = PoolCellValues,
+                SpreadsheetId = spreadsheetId,
+                Gid = gid
+            };
+
+            Spreadsheet spreadsheet = GetGoogleSpreadsheet(spreadsheetId);
+            Sheet sheet = GetGoogleSheet(spreadsheet, gid);
+
+            sheetModel.SpreadsheetTitle = spreadsheet.Properties.Title;
+            sheetModel.Title = sheet.Properties.Title;
+            sheetModel.Mode = SheetMode.Simple;
+            sheetModel.KeyName = string.Empty;
+
+            FillRowWindow(sheetModel, sheet, lastKnownRowNumber + 1, int.MaxValue);
+
+            return sheetModel;
+        }
+
+        /// <summary>
+        /// Receiving rows following the given row from a Google spreadsheet sheet as an instance of the SheetModel type.
+        /// </summary>
+        /// <remarks>
+        /// Intended for sheets to which rows are only appended.<br/>
+        /// Only new rows are downloaded, their numbers match the row numbers of the Google spreadsheet sheet.<br/>
+        /// If there are no new rows, the sheet is empty.
+        /// </remarks>
+        /// <param name="spreadsheetId"></param>
+        /// <param name="sheetTitle"></param>
+        /// <param name="lastKnownRowNumber">Number of the last row that was already received</param>
+        /// <returns>
+        /// SheetModel is a list of Rows of the window.<br/>
+        /// Header is absent.<br/>
+        /// Each row has the same number of cells.<br/>
+        /// Each cell has a string value.
+        /// </returns>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="InvalidApiKeyException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="SpreadsheetNotFoundException"></exception>
+        /// <exception cref="SheetNotFoundException"></exception>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        public SheetModel GetSheetTail(string spreadsheetId, string sheetTitle, int lastKnownRowNumber)
+        {
+            CheckSheetService();
+
+            var sheetModel = new SheetModel()
+            {
+                IsValuePoolEnabled = PoolCellValues,
+                SpreadsheetId = spreadsheetId,
+                Title = sheetTitle
+            };
+
+            Spreadsheet spreadsheet = GetGoogleSpreadsheet(spreadsheetId);
+            Sheet sheet = GetGoogleSheet(spreadsheet, sheetTitle);
+
+            sheetModel.SpreadsheetTitle = spreadsheet.Properties.Title;
+            sheetModel.Gid = sheet.Properties.SheetId.Value;
+            sheetModel.Mode = SheetMode.Simple;
+            sheetModel.KeyName = string.Empty;
+
+            FillRowWindow(sheetModel, sheet, lastKnownRowNumber + 1, int.MaxValue);
+
+            return sheetModel;
+        }
+
+        /// <summary>
+        /// Receiving rows following the given row from a Google spreadsheet sheet as an instance of the SheetModel type.
+        /// </summary>
+        /// <remarks>
+        /// Intended for sheets to which rows are only appended.<br/>
+        /// Only the head and new rows are downloaded, their numbers match the row numbers of the Google spreadsheet sheet.<br/>
+        /// If there are no new rows, the sheet is empty.
+        /// </remarks>
+        /// <param name="spreadsheetId"></param>
+        /// <param name="gid"></param>
+        /// <param name="lastKnownRowNumber">Number of the last row that was already received</param>
+        /// <returns>
+        /// SheetModel is a list of Rows of the window.<br/>
+        /// First row is a header of sheet.<br/>
+        /// Each row has the same number of cells.<br/>
+        /// Each cell has a string value and title, 
+        /// which matches the column heading for the given cell.
+        /// </returns>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="InvalidApiKeyException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="SpreadsheetNotFoundException"></exception>
+        /// <exception cref="SheetNotFoundException"></exception>
+        /// <exception cref="EmptySheetException"></exception>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        public SheetModel GetSheetWithHeadTail(string spreadsheetId, int gid, int lastKnownRowNumber)
+        {
+            CheckSheetService();
+
+            var sheetModel = new SheetModel()
+            {
+                IsValuePoolEnabled = PoolCellValues,
+                SpreadsheetId = spreadsheetId,
+                Gid = gid
+            };
+
+            Spreadsheet spreadsheet = GetGoogleSpreadsheet(spreadsheetId);
+            Sheet sheet = GetGoogleSheet(spreadsheet, gid);
+
+            sheetModel.SpreadsheetTitle = spreadsheet.Properties.Title;
+            sheetModel.Title = sheet.Properties.Title;
+            sheetModel.Mode = SheetMode.Head;
+            sheetModel.KeyName = string.Empty;
+
+            FillRowWindow(sheetModel, sheet, lastKnownRowNumber + 1, int.MaxValue);
+
+            return sheetModel;
+        }
+
+        /// <summary>
+        /// Receiving rows following the given row from a Google spreadsheet sheet as an instance of the SheetModel type.
+        /// </summary>
+        /// <remarks>
+        /// Intended for sheets to which rows are only appended.<br/>
+        /// Only the head and new rows are downloaded, their numbers match the row numbers of the Google spreadsheet sheet.<br/>
+        /// If there are no new rows, the sheet is empty.
+        /// </remarks>
+        /// <param name="spreadsheetId"></param>
+        /// <param name="sheetTitle"></param>
+        /// <param name="lastKnownRowNumber">Number of the last row that was already received</param>
+        /// <returns>
+        /// SheetModel is a list of Rows of the window.<br/>
+        /// First row is a header of sheet.<br/>
+        /// Each row has the same number of cells.<br/>
+        /// Each cell has a string value and title, 
+        /// which matches the column heading for the given cell.
+        /// </returns>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="InvalidApiKeyException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="SpreadsheetNotFoundException"></exception>
+        /// <exception cref="SheetNotFoundException"></exception>
+        /// <exception cref="EmptySheetException"></exception>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        public SheetModel GetSheetWithHeadTail(string spreadsheetId, string sheetTitle, int lastKnownRowNumber)
+        {
+            CheckSheetService();
+
+            var sheetModel = new SheetModel()
+            {
+                IsValuePoolEnabled = PoolCellValues,
+                SpreadsheetId = spreadsheetId,
+                Title = sheetTitle
+            };
+
+            Spreadsheet spreadsheet = GetGoogleSpreadsheet(spreadsheetId);
+            Sheet sheet = GetGoogleSheet(spreadsheet, sheetTitle);
+
+            sheetModel.SpreadsheetTitle = spreadsheet.Properties.Title;
+            sheetModel.Gid = sheet.Properties.SheetId.Value;
+            sheetModel.Mode = SheetMode.Head;
+            sheetModel.KeyName = string.Empty;
+
+            FillRowWindow(sheetModel, sheet, lastKnownRowNumber + 1, int.MaxValue);
+
+            return sheetModel;
+        }
+
+        /// <summary>
+        /// Receiving rows following the given row from a Google spreadsheet sheet as an instance of the SheetModel type.
+        /// </summary>
+        /// <remarks>
+        /// Intended for sheets to which rows are only appended.<br/>
+        /// Only the head and new rows are downloaded, their numbers match the row numbers of the Google spreadsheet sheet.<br/>
+        /// If there are no new rows, the sheet is empty.
+        /// </remarks>
+        /// <param name="spreadsheetId"></param>
+        /// <param name="gid"></param>
+        /// <param name="keyName"></param>
+        /// <param name="lastKnownRowNumber">Number of the last row that was already received</param>
+        /// <returns>
+        /// SheetModel is a list of Rows of the window.<br/>
+        /// First row is a header of sheet.<br/>
+        /// Each row has the same number of cells and has key column.<br/>
+        /// Each cell has a string value and title, 
+        /// which matches the column heading for the given cell.
+        /// </returns>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="InvalidApiKeyException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="SpreadsheetNotFoundException"></exception>
+        /// <exception cref="SheetNotFoundException"></exception>
+        /// <exception cref="SheetKeyNotFoundException"></exception>
+        /// <exception cref="EmptySheetException"></exception>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        public SheetModel GetSheetWithHeadAndKeyTail(string spreadsheetId, int gid, string keyName, int lastKnownRowNumber)
+        {
+            CheckSheetService();
+
+            var sheetModel = new SheetModel()
+            {
+                IsValuePoolEnabled = PoolCellValues,
+                SpreadsheetId = spreadsheetId,
+                Gid = gid
+            };
+
+            Spreadsheet spreadsheet = GetGoogleSpreadsheet(spreadsheetId);
+            Sheet sheet = GetGoogleSheet(spreadsheet, gid);
+
+            sheetModel.SpreadsheetTitle = spreadsheet.Properties.Title;
+            sheetModel.Title = sheet.Properties.Title;
+            sheetModel.Mode = SheetMode.HeadAndKey;
+            sheetModel.KeyName = keyName;
+
+            FillRowWindow(sheetModel, sheet, lastKnownRowNumber + 1, int.MaxValue);
+
+            return sheetModel;
+        }
+
+        /// <summary>
+        /// Receiving rows following the given row from a Google spreadsheet sheet as an instance of the SheetModel type.
+        /// </summary>
+        /// <remarks>
+        /// Intended for sheets to which rows are only appended.<br/>
+        /// Only the head and new rows are downloaded, their numbers match the row numbers of the Google spreadsheet sheet.<br/>
+        /// If there are no new rows, the sheet is empty.
+        /// </remarks>
+        /// <param name="spreadsheetId"></param>
+        /// <param name="sheetTitle"></param>
+        /// <param name="keyName"></param>
+        /// <param name="lastKnownRowNumber">Number of the last row that was already received</param>
+        /// <returns>
+        /// SheetModel is a list of Rows of the window.<br/>
+        /// First row is a header of sheet.<br/>
+        /// Each row has the same number of cells and has key column.<br/>
+        /// Each cell has a string value and title, 
+        /// which matches the column heading for the given cell.
+        /// </returns>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="InvalidApiKeyException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="SpreadsheetNotFoundException"></exception>
+        /// <exception cref="SheetNotFoundException"></exception>
+        /// <exception cref="SheetKeyNotFoundException"></exception>
+        /// <exception cref="EmptySheetException"></exception>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        public SheetModel GetSheetWithHeadAndKeyTail(string spreadsheetId, string sheetTitle, string keyName, int lastKnownRowNumber)
+        {
+            CheckSheetService();
+
+            var sheetModel = new SheetModel()
+            {
+                IsValuePoolEnabled = PoolCellValues,
+                SpreadsheetId = spreadsheetId,
+                Title = sheetTitle
+            };
+
+            Spreadsheet spreadsheet = GetGoogleSpreadsheet(spreadsheetId);
+            Sheet sheet = GetGoogleSheet(spreadsheet, sheetTitle);
+
+            sheetModel.SpreadsheetTitle = spreadsheet.Properties.Title;
+            sheetModel.Gid = sheet.Properties.SheetId.Value;
+            sheetModel.Mode = SheetMode.HeadAndKey;
+            sheetModel.KeyName = keyName;
+
+            FillRowWindow(sheetModel, sheet, lastKnownRowNumber + 1, int.MaxValue);
+
+            return sheetModel;
+        }
+
+        /// <summary>
+        /// Receiving many sheets in parallel, possibly from different spreadsheets.
+        /// </summary>
+        /// <remarks>
+        /// No more than maxDegreeOfParallelism sheets are received at the same time.
+        /// Requests rejected due to exceeding the quota are repeated with an increasing delay.<br/>
+        /// Results are returned as each sheet is received, so their order may differ from the order of the addresses.<br/>
+        /// Exceptions of individual sheets don't stop loading and are returned in SheetLoadResult.Exception.
+        /// </remarks>
+        /// <param name="uris">Full uris of sheets</param>
+        /// <param name="maxDegreeOfParallelism">Maximum number of sheets received at the same time</param>
+        /// <returns>One result for each sheet.</returns>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="ArgumentNullException"></exception>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        /// <exception cref="ArgumentException">An uri is not a correct sheet uri.</exception>
+        public IEnumerable<SheetLoadResult> GetSheets(IEnumerable<string> uris, int maxDegreeOfParallelism)
+        {
+            return GetSheets(ToSheetAddresses(uris), maxDegreeOfParallelism);
+        }
+
+        /// <summary>
+        /// Receiving many sheets in parallel, possibly from different spreadsheets.
+        /// </summary>
+        /// <remarks>
+        /// No more than maxDegreeOfParallelism sheets are received at the same time.
+        /// Requests rejected due to exceeding the quota are repeated with an increasing delay.<br/>
+        /// Results are returned as each sheet is received, so their order may differ from the order of the addresses.<br/>
+        /// Exceptions of individual sheets don't stop loading and are returned in SheetLoadResult.Exception.
+        /// </remarks>
+        /// <param name="addresses">Locations of sheets</param>
+        /// <param name="maxDegreeOfParallelism">Maximum number of sheets received at the same time</param>
+        /// <returns>One result for each sheet.</returns>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="ArgumentNullException"></exception>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        /// <exception cref="ArgumentException">An address is null.</exception>
+        public IEnumerable<SheetLoadResult> GetSheets(IEnumerable<SheetAddress> addresses, int maxDegreeOfParallelism)
+        {
+            return LoadSheets(
+                addresses,
+                maxDegreeOfParallelism,
+                address => address.HasTitle
+                    ? GetSheet(address.SpreadsheetId, address.Title)
+                    : GetSheet(address.SpreadsheetId, address.Gid)
+            );
+        }
+
+        /// <summary>
+        /// Receiving many sheets with head in parallel, possibly from different spreadsheets.
+        /// </summary>
+        /// <remarks>
+        /// No more than maxDegreeOfParallelism sheets are received at the same time.
+        /// Requests rejected due to exceeding the quota are repeated with an increasing delay.<br/>
+        /// Results are returned as each sheet is received, so their order may differ from the order of the addresses.<br/>
+        /// Exceptions of individual sheets don't stop loading and are returned in SheetLoadResult.Exception.
+        /// </remarks>
+        /// <param name="uris">Full uris of sheets</param>
+        /// <param name="maxDegreeOfParallelism">Maximum number of sheets received at the same time</param>
+        /// <returns>One result for each sheet.</returns>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="ArgumentNullException"></exception>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        /// <exception cref="ArgumentException">An uri is not a correct sheet uri.</exception>
+        public IEnumerable<SheetLoadResult> GetSheetsWithHead(IEnumerable<string> uris, int maxDegreeOfParallelism)
+        {
+            return GetSheetsWithHead(ToSheetAddresses(uris), maxDegreeOfParallelism);
+        }
+
+        /// <summary>
+        /// Receiving many sheets with head in parallel, possibly from different spreadsheets.
+        /// </summary>
+        /// <remarks>
+        /// No more than maxDegreeOfParallelism sheets are received at the same time.
+        /// Requests rejected due to exceeding the quota are repeated with an increasing delay.<br/>
+        /// Results are returned as each sheet is received, so their order may differ from the order of the addresses.<br/>
+        /// Exceptions of individual sheets don't stop loading and are returned in SheetLoadResult.Exception.
+        /// </remarks>
+        /// <param name="addresses">Locations of sheets</param>
+        /// <param name="maxDegreeOfParallelism">Maximum number of sheets received at the same time</param>
+        /// <returns>One result for each sheet.</returns>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="ArgumentNullException"></exception>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        /// <exception cref="ArgumentException">An address is null.</exception>
+        public IEnumerable<SheetLoadResult> GetSheetsWithHead(IEnumerable<SheetAddress> addresses, int maxDegreeOfParallelism)
+        {
+            return LoadSheets(
+                addresses,
+                maxDegreeOfParallelism,
+                address => address.HasTitle
+                    ? GetSheetWithHead(address.SpreadsheetId, address.Title)
+                    : GetSheetWithHead(address.SpreadsheetId, address.Gid)
+            );
+        }
+
+        /// <summary>
+        /// Receiving many sheets with head and key in parallel, possibly from different spreadsheets.
+        /// </summary>
+        /// <remarks>
+        /// No more than maxDegreeOfParallelism sheets are received at the same time.
+        /// Requests rejected due to exceeding the quota are repeated with an increasing delay.<br/>
+        /// Results are returned as each sheet is received, so their order may differ from the order of the addresses.<br/>
+        /// Exceptions of individual sheets don't stop loading and are returned in SheetLoadResult.Exception.
+        /// </remarks>
+        /// <param name="uris">Full uris of sheets</param>
+        /// <param name="keyName"></param>
+        /// <param name="maxDegreeOfParallelism">Maximum number of sheets received at the same time</param>
+        /// <returns>One result for each sheet.</returns>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="ArgumentNullException"></exception>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        /// <exception cref="ArgumentException">An uri is not a correct sheet uri.</exception>
+        public IEnumerable<SheetLoadResult> GetSheetsWithHeadAndKey(IEnumerable<string> uris, string keyName, int maxDegreeOfParallelism)
+        {
+            return GetSheetsWithHeadAndKey(ToSheetAddresses(uris), keyName, maxDegreeOfParallelism);
+        }
+
+        /// <summary>
+        /// Receiving many sheets with head and key in parallel, possibly from different spreadsheets.
+        /// </summary>
+        /// <remarks>
+        /// No more than maxDegreeOfParallelism sheets are received at the same time.
+        /// Requests rejected due to exceeding the quota are repeated with an increasing delay.<br/>
+        /// Results are returned as each sheet is received, so their order may differ from the order of the addresses.<br/>
+        /// Exceptions of individual sheets don't stop loading and are returned in SheetLoadResult.Exception.
+        /// </remarks>
+        /// <param name="addresses">Locations of sheets</param>
+        /// <param name="keyName"></param>
+        /// <param name="maxDegreeOfParallelism">Maximum number of sheets received at the same time</param>
+        /// <returns>One result for each sheet.</returns>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="ArgumentNullException"></exception>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        /// <exception cref="ArgumentException">An address is null.</exception>
+        public IEnumerable<SheetLoadResult> GetSheetsWithHeadAndKey(IEnumerable<SheetAddress> addresses, string keyName, int maxDegreeOfParallelism)
+        {
+            return LoadSheets(
+                addresses,
+                maxDegreeOfParallelism,
+                address => address.HasTitle
+                    ? GetSheetWithHeadAndKey(address.SpreadsheetId, address.Title, keyName)
+                    : GetSheetWithHeadAndKey(address.SpreadsheetId, address.Gid, keyName)
+            );
+        }
+
+        /// <summary>
+        /// Update the Google spreadsheet sheet based on the modified instance of the SheetModel type.
+        /// </summary>
+        /// <remarks>
+        /// The method changes the data in the cells,
+        /// adds rows to the end of the sheet and removes the selected rows.<br />
+        /// All these actions are based on requests to Google.<br />
+        /// Appended and changed rows are sent in chunks of about 50000 cells,
+        /// up to 4 chunks of changed rows at the same time.
+        /// Rows of successfully sent chunks get the RowStatus.Original status,
+        /// so if the update fails, calling the method again sends only the remaining rows.<br />
+        /// If the sheet has a published snapshot, a new snapshot is published after the update.
+        /// </remarks>
+        /// <param name="sheetModel">Google spreadsheet sheet model</param>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="OAuthSheetsScopeException"></exception>
+        public void UpdateSheet(SheetModel sheetModel)
+        {
+            UpdateSheet(sheetModel, DefaultChunkCellCount, DefaultMaxConcurrentRequests, null);
+        }
+
+        /// <summary>
+        /// Update the Google spreadsheet sheet based on the modified instance of the SheetModel type
+        /// with progress reporting.
+        /// </summary>
+        /// <remarks>
+        /// Rows with RowStatus.ToAppend are appended first, chunk by chunk in sheet order.
+        /// Then chunks of rows with RowStatus.ToChange are sent, up to maxConcurrentRequests at the same time.
+        /// Rows with RowStatus.ToDelete are deleted last in one request.<br />
+        /// Rows of successfully sent chunks get the RowStatus.Original status,
+        /// so if the update fails, calling the method again sends only the remaining rows.<br />
+        /// If the sheet has a published snapshot, a new snapshot is published after the update.
+        /// </remarks>
+        /// <param name="sheetModel">Google spreadsheet sheet model</param>
+        /// <param name="chunkCellCount">Maximum number of cells in one request. A row is never split.</param>
+        /// <param name="maxConcurrentRequests">Maximum number of chunks of changed rows sent at the same time</param>
+        /// <param name="progress">Receives the progress after each sent chunk. Can be null.</param>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="OAuthSheetsScopeException"></exception>
+        /// <exception cref="ArgumentNullException"></exception>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        public void UpdateSheet(
+            SheetModel sheetModel,
+            int chunkCellCount,
+            int maxConcurrentRequests,
+            IProgress<SheetUpdateProgress> progress)
+        {
+            CheckSheetService();
+            CheckPrincipal("Update sheet");
+
+            if (sheetModel == null)
+            {
+                throw new ArgumentNullException(nameof(sheetModel));
+            }
+
+            if (chunkCellCount < 1)
+            {
+                throw new ArgumentOutOfRangeException(nameof(chunkCellCount));
+            }
+
+            if (maxConcurrentRequests < 1)
+            {
+                throw new ArgumentOutOfRangeException(nameof(maxConcurrentRequests));
+            }
+
+            try
+            {
+                if (ReuseDeletedRows)
+                {
+                    sheetModel.PlanRowReuse();
+                }
+
+                List<List<Row>> appendChunks = sheetModel.GetRowChunks(RowStatus.ToAppend, chunkCellCount);
+                List<List<Row>> changeChunks = sheetModel.GetRowChunks(RowStatus.ToChange, chunkCellCount);
+                var tracker = new UpdateProgressTracker(
+                    appendChunks.Sum(chunk => chunk.Count) + changeChunks.Sum(chunk => chunk.Count),
+                    progress
+                );
+
+                foreach (List<Row> chunk in appendChunks)
+                {
+                    CreateAppendRequest(sheetModel, chunk).Execute();
+                    MarkSent(chunk, tracker);
+                }
+
+                SendChangeChunks(sheetModel, changeChunks, maxConcurrentRequests, tracker);
+                CreateDeleteRequest(sheetModel)?.Execute();
+
+                sheetModel.ClearDeletedRows();
+                sheetModel.RenumberRows();
+                sheetModel.ResetRowStatuses();
+
+                if (sheetModel.LatestSnapshot != null)
+                {
+                    sheetModel.PublishSnapshot();
+                }
+            }
+            catch (GoogleApiException e) when (e.HttpStatusCode == HttpStatusCode.Forbidden && e.Error.Message.Contains("insufficient authentication scopes"))
+            {
+                throw new OAuthSheetsScopeException(e.Error.Message, e);
+            }
+            catch (GoogleApiException e) when (e.HttpStatusCode == HttpStatusCode.Forbidden && e.Error.Message.Contains("does not have permission"))
+            {
+                throw new UserAccessDeniedException(e.Error.Message, e)
+                {
+                    Operation = $"Обновление листа: {sheetModel.SpreadsheetTitle}/{sheetModel.Title}",
+                };
+            }
+        }
+
+        /// <summary>
+        /// Update the Google spreadsheet sheet with changes received by the SheetModel.Diff method.
+        /// </summary>
+        /// <remarks>
+        /// The patch is applied to the sheet model, then the sheet is updated as usual.
+        /// </remarks>
+        /// <param name="sheetModel">Google spreadsheet sheet model to which the patch refers</param>
+        /// <param name="patch">Changes of the sheet</param>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="OAuthSheetsScopeException"></exception>
+        /// <exception cref="ArgumentNullException"></exception>
+        /// <exception cref="ArgumentException"></exception>
+        public void UpdateSheet(SheetModel sheetModel, SheetPatch patch)
+        {
+            sheetModel.ApplyPatch(patch);
+            UpdateSheet(sheetModel);
+        }
+
+        /// <summary>
+        /// Creating a buffer of rows that are appended to the end of the Google spreadsheet sheet
+        /// in batches on a background thread.
+        /// </summary>
+        /// <remarks>
+        /// The appender sends up to 500 rows per request at least every 5 seconds
+        /// and holds up to 10000 rows in the buffer.<br/>
+        /// The appender must be disposed to send the remaining rows.
+        /// </remarks>
+        /// <param name="sheetModel">Sheet to which rows are appended</param>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="ArgumentNullException"></exception>
+        public SheetAppender CreateSheetAppender(SheetModel sheetModel)
+        {
+            return CreateSheetAppender(
+                sheetModel,
+                SheetAppender.DefaultBatchSize,
+                SheetAppender.DefaultFlushInterval,
+                SheetAppender.DefaultCapacity
+            );
+        }
+
+        /// <summary>
+        /// Creating a buffer of rows that are appended to the end of the Google spreadsheet sheet
+        /// in batches on a background thread.
+        /// </summary>
+        /// <remarks>
+        /// The appender must be disposed to send the remaining rows.
+        /// </remarks>
+        /// <param name="sheetModel">Sheet to which rows are appended</param>
+        /// <param name="batchSize">Maximum number of rows in one request</param>
+        /// <param name="flushInterval">Maximum time that a row waits in the buffer before sending</param>
+        /// <param name="capacity">Maximum number of rows in the buffer. Must not be less than batchSize.</param>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="ArgumentNullException"></exception>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        public SheetAppender CreateSheetAppender(SheetModel sheetModel, int batchSize, TimeSpan flushInterval, int capacity)
+        {
+            CheckSheetService();
+            CheckPrincipal("Append rows");
+
+            if (sheetModel == null)
+            {
+                throw new ArgumentNullException(nameof(sheetModel));
+            }
+
+            if (batchSize < 1)
+            {
+                throw new ArgumentOutOfRangeException(nameof(batchSize));
+            }
+
+            if (flushInterval <= TimeSpan.Zero)
+            {
+                throw new ArgumentOutOfRangeException(nameof(flushInterval));
+            }
+
+            if (capacity < batchSize)
+            {
+                throw new ArgumentOutOfRangeException(nameof(capacity), "Capacity must not be less than batch size.");
+            }
+
+            return new SheetAppender(
+                sheetModel,
+                rows => AppendRows(sheetModel, rows),
+                batchSize,
+                flushInterval,
+                capacity
+            );
+        }
+
+        /// <summary>
+        /// Appending rows from delimiter-separated text such as CSV or TSV
+        /// to the end of the Google spreadsheet sheet.
+        /// </summary>
+        /// <remarks>
+        /// Rows are read from the stream and sent in chunks of about 50000 cells,
+        /// without creating Row and Cell instances, so the size of the text doesn't affect memory consumption.<br/>
+        /// The row size and the placement of values in columns are the same
+        /// as for rows added by the SheetModel.AddRow method.<br/>
+        /// Appended rows are not added to the SheetModel.
+        /// If sending a chunk fails, the previous chunks remain in the Google spreadsheet sheet.
+        /// </remarks>
+        /// <param name="sheetModel">Sheet to which rows are appended</param>
+        /// <param name="stream">Text in UTF-8 or with a byte order mark</param>
+        /// <param name="delimiter">Value delimiter, for example CsvSerialization.Comma</param>
+        /// <param name="skipFirstRow">Don't append the first row of the text, for example if it is the head</param>
+        /// <returns>Number of appended rows.</returns>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="OAuthSheetsScopeException"></exception>
+        /// <exception cref="ArgumentNullException"></exception>
+        /// <exception cref="ArgumentException"></exception>
+        /// <exception cref="FormatException">A quoted value is not closed before the end of the text.</exception>
+        public long AppendCsv(SheetModel sheetModel, Stream stream, char delimiter, bool skipFirstRow)
+        {
+            CheckSheetService();
+            CheckPrincipal("Append rows");
+
+            if (sheetModel == null)
+            {
+                throw new ArgumentNullException(nameof(sheetModel));
+            }
+
+            long appendedRowCount = 0;
+            int chunkCellCount = 0;
+            var chunk = new List<IList<object>>();
+            bool isFirstRow = true;
+
+            foreach (IList<string> data in CsvSerialization.ReadRows(stream, delimiter))
+            {
+                if (isFirstRow)
+                {
+                    isFirstRow = false;
+
+                    if (skipFirstRow)
+                    {
+                        continue;
+                    }
+                }
+
+                IList<object> rowData = sheetModel.CreateRowData(data);
+                chunk.Add(rowData);
+                chunkCellCount += Math.Max(rowData.Count, 1);
+
+                if (chunkCellCount >= DefaultChunkCellCount)
+                {
+                    AppendRows(sheetModel, chunk);
+                    appendedRowCount += chunk.Count;
+                    chunk = new List<IList<object>>(chunk.Count);
+                    chunkCellCount = 0;
+                }
+            }
+
+            if (chunk.Count > 0)
+            {
+                AppendRows(sheetModel, chunk);
+                appendedRowCount += chunk.Count;
+            }
+
+            return appendedRowCount;
+        }
+
+        /// <summary>
+        /// Appending rows from a delimiter-separated text file such as CSV or TSV
+        /// to the end of the Google spreadsheet sheet.
+        /// </summary>
+        /// <remarks>
+        /// The file is read and sent in chunks of about 50000 cells,
+        /// without creating Row and Cell instances, so the file size doesn't affect memory consumption.<br/>
+        /// Appended rows are not added to the SheetModel.
+        /// If sending a chunk fails, the previous chunks remain in the Google spreadsheet sheet.
+        /// </remarks>
+        /// <param name="sheetModel">Sheet to which rows are appended</param>
+        /// <param name="path">Path to the file in UTF-8 or with a byte order mark</param>
+        /// <param name="delimiter">Value delimiter, for example CsvSerialization.Comma</param>
+        /// <param name="skipFirstRow">Don't append the first row of the file, for example if it is the head</param>
+        /// <returns>Number of appended rows.</returns>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="OAuthSheetsScopeException"></exception>
+        /// <exception cref="ArgumentNullException"></exception>
+        /// <exception cref="ArgumentException"></exception>
+        /// <exception cref="IOException"></exception>
+        public long AppendCsv(SheetModel sheetModel, string path, char delimiter, bool skipFirstRow)
+        {
+            using (FileStream stream = File.OpenRead(path))
+            {
+                return AppendCsv(sheetModel, stream, delimiter, skipFirstRow);
+            }
+        }
+
+        /// <summary>
+        /// Creating a background check of the Google spreadsheet sheet for changes.
+        /// </summary>
+        /// <remarks>
+        /// Each check requests only the sheet metadata,
+        /// and the values are received only after the version stamp or the grid size has changed.
+        /// Writers must update the stamp by the UpdateSheetVersionStamp method.
+        /// Edits made without updating the stamp, for example by hand in the browser,
+        /// are not detected unless they change the grid size.<br/>
+        /// Checks are performed every 15 seconds to 5 minutes depending on how often the sheet changes.<br/>
+        /// To compare the values by hash on each check instead,
+        /// pass null as the version metadata key to the overload with intervals.
+        /// This detects all edits, but each check receives all values of the sheet.<br/>
+        /// The watcher must be disposed to stop checking.
+        /// </remarks>
+        /// <param name="sheetModel">Sheet to watch. The sheet itself is not changed by the watcher.</param>
+        /// <param name="versionMetadataKey">Key of the developer metadata with the version stamp</param>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="ArgumentNullException"></exception>
+        /// <exception cref="ArgumentException"></exception>
+        /// <exception cref="EmptySheetException"></exception>
+        /// <exception cref="SheetKeyNotFoundException"></exception>
+        public SheetWatcher CreateSheetWatcher(SheetModel sheetModel, string versionMetadataKey)
+        {
+            if (string.IsNullOrEmpty(versionMetadataKey))
+            {
+                throw new ArgumentNullException(nameof(versionMetadataKey));
+            }
+
+            return CreateSheetWatcher(
+                sheetModel,
+                versionMetadataKey,
+                SheetWatcher.DefaultMinInterval,
+                SheetWatcher.DefaultMaxInterval
+            );
+        }
+
+        /// <summary>
+        /// Creating a background check of the Google spreadsheet sheet for changes.
+        /// </summary>
+        /// <remarks>
+        /// If a version metadata key is given, each check requests only the sheet metadata,
+        /// and the values are received only after the version stamp or the grid size has changed.
+        /// Writers must update the stamp by the UpdateSheetVersionStamp method.
+        /// Edits made without updating the stamp, for example by hand in the browser,
+        /// are not detected unless they change the grid size.<br/>
+        /// Otherwise, all values are received on each check and compared by hash.
+        /// This detects all edits, but every check costs as much traffic and quota
+        /// as receiving the whole sheet, only creating the SheetModel is skipped.<br/>
+        /// The current state of the sheet is received when the watcher is created,
+        /// which is why the method is synchronous.<br/>
+        /// The watcher must be disposed to stop checking.
+        /// </remarks>
+        /// <param name="sheetModel">Sheet to watch. The sheet itself is not changed by the watcher.</param>
+        /// <param name="versionMetadataKey">Key of the developer metadata with the version stamp. Can be null.</param>
+        /// <param name="minInterval">Interval between checks after a change</param>
+        /// <param name="maxInterval">Maximum interval between checks</param>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="ArgumentNullException"></exception>
+        /// <exception cref="ArgumentException">The sheet contains only some of the rows or columns.</exception>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        /// <exception cref="EmptySheetException"></exception>
+        /// <exception cref="SheetKeyNotFoundException"></exception>
+        public SheetWatcher CreateSheetWatcher(
+            SheetModel sheetModel,
+            string versionMetadataKey,
+            TimeSpan minInterval,
+            TimeSpan maxInterval)
+        {
+            CheckSheetService();
+
+            if (sheetModel == null)
+            {
+                throw new ArgumentNullException(nameof(sheetModel));
+            }
+
+            if (sheetModel.ColumnIndexes.Count > 0 || sheetModel.FirstRowNumber > 0)
+            {
+                throw new ArgumentException("Only a sheet received with all rows and columns can be watched.", nameof(sheetModel));
+            }
+
+            if (minInterval <= TimeSpan.Zero)
+            {
+                throw new ArgumentOutOfRangeException(nameof(minInterval));
+            }
+
+            if (maxInterval < minInterval)
+            {
+                throw new ArgumentOutOfRangeException(nameof(maxInterval), "Maximum interval must not be less than minimum interval.");
+            }
+
+            Func<string> getVersionStamp = null;
+
+            if (!string.IsNullOrEmpty(versionMetadataKey))
+            {
+                getVersionStamp = () => GetSheetVersionStamp(sheetModel.SpreadsheetId, sheetModel.Gid, versionMetadataKey);
+            }
+
+            return new SheetWatcher(
+                getVersionStamp,
+                () => GetData(sheetModel.SpreadsheetId, sheetModel.Title),
+                data => CreateWatchedSheet(sheetModel, data),
+                minInterval,
+                maxInterval
+            );
+        }
+
+        /// <summary>
+        /// Writing a new version stamp to the developer metadata of the Google spreadsheet sheet.
+        /// </summary>
+        /// <remarks>
+        /// Used after updating the sheet so that watchers created with the same
+        /// version metadata key detect the change without receiving the values.
+        /// </remarks>
+        /// <param name="sheetModel">Updated sheet</param>
+        /// <param name="versionMetadataKey">Key of the developer metadata with the version stamp</param>
+        /// <exception cref="InvalidOperationException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="OAuthSheetsScopeException"></exception>
+        /// <exception cref="ArgumentNullException"></exception>
+        /// <exception cref="SheetNotFoundException"></exception>
+        public void UpdateSheetVersionStamp(SheetModel sheetModel, string versionMetadataKey)
+        {
+            CheckSheetService();
+            CheckPrincipal("Update sheet version stamp");
+
+            if (sheetModel == null)
+            {
+                throw new ArgumentNullException(nameof(sheetModel));
+            }
+
+            if (string.IsNullOrEmpty(versionMetadataKey))
+            {
+                throw new ArgumentNullException(nameof(versionMetadataKey));
+            }
+
+            Sheet sheet = GetSheetMetadata(sheetModel.SpreadsheetId, sheetModel.Gid);
+            DeveloperMetadata metadata = sheet.DeveloperMetadata?.FirstOrDefault(m => m.MetadataKey == versionMetadataKey);
+            string versionStamp = Guid.NewGuid().ToString("N");
+
+            var request = new Request();
+
+            if (metadata == null)
+            {
+                request.CreateDeveloperMetadata = new CreateDeveloperMetadataRequest
+                {
+                    DeveloperMetadata = new DeveloperMetadata
+                    {
+                        MetadataKey = versionMetadataKey,
+                        MetadataValue = versionStamp,
+                        Location = new DeveloperMetadataLocation { SheetId = sheetModel.Gid },
+                        Visibility = "DOCUMENT"
+                    }
+                };
+            }
+            else
+            {
+                request.UpdateDeveloperMetadata = new UpdateDeveloperMetadataRequest
+                {
+                    DataFilters = new List<DataFilter>
+                    {
+                        new DataFilter
+                        {
+                            DeveloperMetadataLookup = new DeveloperMetadataLookup { MetadataId = metadata.MetadataId }
+                        }
+                    },
+                    DeveloperMetadata = new DeveloperMetadata { MetadataValue = versionStamp },
+                    Fields = "metadataValue"
+                };
+            }
+
+            var requestBody = new BatchUpdateSpreadsheetRequest
+            {
+                Requests = new List<Request> { request }
+            };
+
+            try
+            {
+                new SpreadsheetsResource.BatchUpdateRequest(_sheetsService, requestBody, sheetModel.SpreadsheetId).Execute();
+            }
+            catch (GoogleApiException e) when (e.HttpStatusCode == HttpStatusCode.Forbidden && e.Error.Message.Contains("insufficient authentication scopes"))
+            {
+                throw new OAuthSheetsScopeException(e.Error.Message, e);
+            }
+            catch (GoogleApiException e) when (e.HttpStatusCode == HttpStatusCode.Forbidden && e.Error.Message.Contains("does not have permission"))
+            {
+                throw new UserAccessDeniedException(e.Error.Message, e)
+                {
+                    Operation = $"Update sheet version stamp: {sheetModel.SpreadsheetTitle}/{sheetModel.Title}",
+                };
+            }
+        }
+
+        /// <summary>
+        /// Check the presence of a sheet in the Google spreadsheet by name.
+        /// </summary>
+        /// <param name="spreadsheetId"></param>
+        /// <param name="sheetTitle"></param>
+        /// <exception cref="InvalidOperationException"/>
+        /// <exception cref="InvalidApiKeyException"/>
+        /// <exception cref="UserAccessDeniedException"/>
+        /// <exception cref="SpreadsheetNotFoundException"/>
+        public bool IsSheetExists(string spreadsheetId, string sheetTitle)
+        {
+            try
+            {
+                return IsSheetExists(GetGoogleSpreadsheet(spreadsheetId), sheetTitle);
+            }
+            catch (SpreadsheetNotFoundException)
+            {
+                return false;
+            }
+        }
+
+        /// <summary>
+        /// Check the absence of a sheet in the Google spreadsheet by name.
+        /// </summary>
+        /// <param name="spreadsheetId"></param>
+        /// <param name="sheetTitle"></param>
+        /// <exception cref="InvalidOperationException"/>
+        /// <exception cref="InvalidApiKeyException"/>
+        /// <exception cref="UserAccessDeniedException"/>
+        public bool IsSheetNotExists(string spreadsheetId, string sheetTitle)
+        {
+            return !IsSheetExists(spreadsheetId, sheetTitle);
+        }
+
+
+        private bool IsSheetExists(Spreadsheet spreadsheet, string sheetTitle)
+        {
+            return spreadsheet
+                .Sheets
+                .Select(s => s.Properties.Title)
+                .Contains(sheetTitle);
+        }
+
+        #region CheckFields
+        /// <exception cref="InvalidOperationException"></exception>
+        private void CheckSheetService()
+        {
+            if (_sheetsService == null)
+            {
+                throw new InvalidOperationException(
+                    $"Need to authenticate before using this method."
+                );
+            }
+        }
+
+        /// <exception cref="UserAccessDeniedException"></exception>
+        private void CheckPrincipal(string operation)
+        {
+            if (_principal is ServiceAccount)
+            {
+                throw new UserAccessDeniedException(
+                    $"Can't modify Google spreadsheets using {nameof(ServiceAccount)}.")
+                {
+                    Operation = operation
+                };
+            }
+        }
+        #endregion
+
+        #region Spreadsheets
+        /// <exception cref="InvalidApiKeyException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="SpreadsheetNotFoundException"></exception>
+        private Spreadsheet GetGoogleSpreadsheet(string spreadsheetId)
+        {
+            return GetGoogleSpreadsheet(spreadsheetId, null);
+        }
+
+        /// <param name="spreadsheetId"></param>
+        /// <param name="fields">Field mask of the response. Null to receive all fields.</param>
+        private Spreadsheet GetGoogleSpreadsheet(string spreadsheetId, string fields)
+        {
+            try
+            {
+                var request = _sheetsService.Spreadsheets.Get(spreadsheetId);
+
+                if (fields != null)
+                {
+                    request.Fields = fields;
+                }
+
+                return request.Execute();
+            }
+            catch (GoogleApiException e) when (e.HttpStatusCode == HttpStatusCode.BadRequest)
+            {
+                // Controversial and implicit decision,
+                // but so far this state only appeared due to an invalid API key.
+                // Maybe look for a clarifying error state.
+                throw new InvalidApiKeyException($"Failed to get spreadsheet with id: {spreadsheetId}", e);
+            }
+            catch (GoogleApiException e) when (e.HttpStatusCode == HttpStatusCode.Forbidden && e.Error.Message.Contains("does not have permission"))
+            {
                 throw new UserAccessDeniedException(e.Error.Message, e)
                 {
-                    Operation = $"Обновление листа: {sheetModel.SpreadsheetTitle}/{sheetModel.Title}",
+                    Operation = $"Recieving spreadsheet with id: {spreadsheetId}"
+                };
+            }
+            catch (GoogleApiException e) when (e.HttpStatusCode == HttpStatusCode.NotFound)
+            {
+                throw new SpreadsheetNotFoundException(e.Error.Message, e)
+                {
+                    SpreadsheetId = spreadsheetId
+                };
+            }
+        }
+
+        /// <exception cref="SheetNotFoundException"></exception>
+        private Sheet GetGoogleSheet(Spreadsheet spreadsheet, int gid)
+        {
+            Sheet sheet = spreadsheet.Sheets.ToList().Find(s => s.Properties.SheetId == gid);
+
+            if (sheet == null)
+            {
+                throw new SheetNotFoundException(
+                    $"Spreadsheet {spreadsheet.Properties.Title} " +
+                    $"with id: {spreadsheet.SpreadsheetId} " +
+                    $"not found sheet with gid: {gid}"
+                )
+                {
+                    SpreadsheetTitle = spreadsheet.Properties.Title,
+                    SpreadsheetId = spreadsheet.SpreadsheetId,
+                    SheetGid = gid.ToString()
+                };
+            }
+
+            return sheet;
+        }
+
+        /// <exception cref="SheetNotFoundException"></exception>
+        private Sheet GetGoogleSheet(Spreadsheet spreadsheet, string sheetTitle)
+        {
+            Sheet sheet = spreadsheet.Sheets.ToList().Find(s => s.Properties.Title == sheetTitle);
+
+            if (sheet == null)
+            {
+                throw new SheetNotFoundException(
+                    $"Spreadsheet {spreadsheet.Properties.Title} " +
+                    $"with id: {spreadsheet.SpreadsheetId} " +
+                    $"not found sheet with name: {sheetTitle}"
+                )
+                {
+                    SpreadsheetTitle = spreadsheet.Properties.Title,
+                    SpreadsheetId = spreadsheet.SpreadsheetId,
+                    SheetTitle = sheetTitle
                 };
             }
+
+            return sheet;
+        }
+
+        private IList<IList<object>> GetData(string spreadsheetId, string range)
+        {
+            var request = _sheetsService
+                .Spreadsheets
+                .Values
+                .Get(spreadsheetId, range);
+
+            if (ValueRenderMode == ValueRenderMode.Unformatted)
+            {
+                request.ValueRenderOption = SpreadsheetsResource
+                    .ValuesResource
+                    .GetRequest
+                    .ValueRenderOptionEnum
+                    .UNFORMATTEDVALUE;
+
+                request.DateTimeRenderOption = SpreadsheetsResource
+                    .ValuesResource
+                    .GetRequest
+                    .DateTimeRenderOptionEnum
+                    .SERIALNUMBER;
+            }
+
+            return request.Execute().Values ?? new List<IList<object>>();
         }
 
         /// <summary>
-        /// Check the presence of a sheet in the Google spreadsheet by name.
+        /// Filling the sheet with the head and the given columns only.
         /// </summary>
-        /// <param name="spreadsheetId"></param>
-        /// <param name="sheetTitle"></param>
-        /// <exception cref="InvalidOperationException"/>
-        /// <exception cref="InvalidApiKeyException"/>
-        /// <exception cref="UserAccessDeniedException"/>
-        /// <exception cref="SpreadsheetNotFoundException"/>
-        public bool IsSheetExists(string spreadsheetId, string sheetTitle)
+        /// <remarks>
+        /// The head row is received first to find the column positions,
+        /// then all columns are received with one batch request.
+        /// </remarks>
+        /// <exception cref="ArgumentException"></exception>
+        /// <exception cref="EmptySheetException"></exception>
+        /// <exception cref="SheetKeyNotFoundException"></exception>
+        /// <exception cref="InvalidSheetHeadException"></exception>
+        private void FillColumns(SheetModel sheetModel, IEnumerable<string> columns)
         {
-            try
+            if (columns == null || !columns.Any())
             {
-                return IsSheetExists(GetGoogleSpreadsheet(spreadsheetId), sheetTitle);
+                throw new ArgumentException("At least one column is required.", nameof(columns));
             }
-            catch (SpreadsheetNotFoundException)
+
+            IList<IList<object>> headData = GetData(
+                sheetModel.SpreadsheetId,
+                A1Notation.GetRowRange(sheetModel.Title, 1, 1)
+            );
+
+            if (sheetModel.Mode == SheetMode.HeadAndKey)
             {
-                return false;
+                sheetModel.ValidateData(headData, sheetModel.KeyName);
+            }
+            else
+            {
+                sheetModel.ValidateData(headData);
             }
+
+            sheetModel.SelectColumns(headData[0], columns);
+            sheetModel.Fill(GetColumnsData(sheetModel.SpreadsheetId, sheetModel.Title, sheetModel.ColumnIndexes));
         }
 
         /// <summary>
-        /// Check the absence of a sheet in the Google spreadsheet by name.
+        /// Receiving the given columns with one request and composing them into rows.
         /// </summary>
-        /// <param name="spreadsheetId"></param>
-        /// <param name="sheetTitle"></param>
-        /// <exception cref="InvalidOperationException"/>
-        /// <exception cref="InvalidApiKeyException"/>
-        /// <exception cref="UserAccessDeniedException"/>
-        public bool IsSheetNotExists(string spreadsheetId, string sheetTitle)
+        private IList<IList<object>> GetColumnsData(string spreadsheetId, string sheetTitle, IList<int> columnIndexes)
         {
-            return !IsSheetExists(spreadsheetId, sheetTitle);
+            var request = CreateBatchGetRequest(
+                spreadsheetId,
+                columnIndexes.Select(index => A1Notation.GetColumnRange(sheetTitle, index))
+            );
+
+            request.MajorDimension = SpreadsheetsResource
+                .ValuesResource
+                .BatchGetRequest
+                .MajorDimensionEnum
+                .COLUMNS;
+
+            List<IList<object>> columns = request
+                .Execute()
+                .ValueRanges
+                .Select(range => range.Values?.FirstOrDefault() ?? new List<object>())
+                .ToList();
+
+            int rowCount = columns.Max(column => column.Count);
+            var data = new List<IList<object>>(rowCount);
+
+            for (int rowIndex = 0; rowIndex < rowCount; rowIndex++)
+            {
+                var row = new List<object>(columns.Count);
+
+                foreach (IList<object> column in columns)
+                {
+                    row.Add(rowIndex < column.Count ? column[rowIndex] : string.Empty);
+                }
+
+                data.Add(row);
+            }
+
+            return data;
         }
 
+        /// <summary>
+        /// Filling the sheet with the head and a window of rows.
+        /// </summary>
+        /// <remarks>
+        /// The head and the rows are received with one batch request.<br/>
+        /// The window is limited by the sheet size, so there is no request for rows
+        /// if the window starts after the last row of the sheet.
+        /// </remarks>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        /// <exception cref="EmptySheetException"></exception>
+        /// <exception cref="SheetKeyNotFoundException"></exception>
+        private void FillRowWindow(SheetModel sheetModel, Sheet sheet, int firstRowNumber, int lastRowNumber)
+        {
+            if (firstRowNumber < 1)
+            {
+                throw new ArgumentOutOfRangeException(nameof(firstRowNumber), "Row numbers start from 1.");
+            }
+
+            if (lastRowNumber < firstRowNumber)
+            {
+                throw new ArgumentOutOfRangeException(nameof(lastRowNumber), "The last row number is less than the first.");
+            }
 
-        private bool IsSheetExists(Spreadsheet spreadsheet, string sheetTitle)
+            if (sheetModel.Mode != SheetMode.Simple)
+            {
+                // The first row is the head, so it can't be in the window.
+                firstRowNumber = Math.Max(firstRowNumber, 2);
+            }
+
+            int? rowCount = sheet.Properties.GridProperties?.RowCount;
+            bool reachesSheetEnd = lastRowNumber == int.MaxValue || (rowCount.HasValue && lastRowNumber >= rowCount.Value);
+
+            lastRowNumber = Math.Min(lastRowNumber, rowCount ?? lastRowNumber);
+
+            var ranges = new List<string>();
+
+            if (sheetModel.Mode != SheetMode.Simple)
+            {
+                ranges.Add(A1Notation.GetRowRange(sheetModel.Title, 1, 1));
+            }
+
+            if (firstRowNumber <= lastRowNumber)
+            {
+                ranges.Add(A1Notation.GetRowRange(sheetModel.Title, firstRowNumber, lastRowNumber));
+            }
+
+            IList<ValueRange> valueRanges = new List<ValueRange>();
+
+            if (ranges.Count > 0)
+            {
+                valueRanges = CreateBatchGetRequest(sheetModel.SpreadsheetId, ranges).Execute().ValueRanges;
+            }
+
+            IList<object> headData = null;
+            IList<IList<object>> rowsData = new List<IList<object>>();
+
+            if (sheetModel.Mode != SheetMode.Simple)
+            {
+                IList<IList<object>> headRange = valueRanges[0].Values ?? new List<IList<object>>();
+
+                if (sheetModel.Mode == SheetMode.HeadAndKey)
+                {
+                    sheetModel.ValidateData(headRange, sheetModel.KeyName);
+                }
+                else
+                {
+                    sheetModel.ValidateData(headRange);
+                }
+
+                headData = headRange[0];
+                valueRanges.RemoveAt(0);
+            }
+
+            if (valueRanges.Count > 0)
+            {
+                rowsData = valueRanges[0].Values ?? rowsData;
+            }
+
+            sheetModel.Fill(headData, rowsData, firstRowNumber, reachesSheetEnd ? 0 : lastRowNumber);
+        }
+
+        private SpreadsheetsResource.ValuesResource.BatchGetRequest CreateBatchGetRequest(string spreadsheetId, IEnumerable<string> ranges)
         {
-            return spreadsheet
-                .Sheets
-                .Select(s => s.Properties.Title)
-                .Contains(sheetTitle);
+            var request = _sheetsService
+                .Spreadsheets
+                .Values
+                .BatchGet(spreadsheetId);
+
+            request.Ranges = new Repeatable<string>(ranges);
+
+            if (ValueRenderMode == ValueRenderMode.Unformatted)
+            {
+                request.ValueRenderOption = SpreadsheetsResource
+                    .ValuesResource
+                    .BatchGetRequest
+                    .ValueRenderOptionEnum
+                    .UNFORMATTEDVALUE;
+
+                request.DateTimeRenderOption = SpreadsheetsResource
+                    .ValuesResource
+                    .BatchGetRequest
+                    .DateTimeRenderOptionEnum
+                    .SERIALNUMBER;
+            }
+
+            return request;
         }
+        #endregion
 
-        #region CheckFields
+        #region BulkLoading
+        private const int MaxQuotaRetries = 5;
+
+        /// <summary>
+        /// Addresses are composed before loading starts,
+        /// so an incorrect uri is reported to the caller instead of stopping the loading.
+        /// </summary>
+        /// <exception cref="ArgumentNullException"></exception>
+        /// <exception cref="ArgumentException"></exception>
+        private static List<SheetAddress> ToSheetAddresses(IEnumerable<string> uris)
+        {
+            if (uris == null)
+            {
+                throw new ArgumentNullException(nameof(uris));
+            }
+
+            var addresses = new List<SheetAddress>();
+
+            foreach (string uri in uris)
+            {
+                if (HttpUtils.IsNotCorrectUri(uri))
+                {
+                    throw new ArgumentException($"Uri is not a correct sheet uri: {uri}", nameof(uris));
+                }
+
+                try
+                {
+                    addresses.Add(SheetAddress.FromUri(uri));
+                }
+                catch (OverflowException e)
+                {
+                    throw new ArgumentException($"Uri contains an incorrect gid: {uri}", nameof(uris), e);
+                }
+            }
+
+            return addresses;
+        }
+
+        /// <summary>
+        /// Receiving sheets on the thread pool with bounded parallelism.
+        /// </summary>
+        /// <remarks>
+        /// Results are passed through a blocking collection,
+        /// so the caller can process them while the remaining sheets are being received.<br/>
+        /// Arguments are checked before loading starts.
+        /// If the caller stops enumerating early, sheets that are not requested yet are not received.
+        /// </remarks>
         /// <exception cref="InvalidOperationException"></exception>
-        private void CheckSheetService()
+        /// <exception cref="ArgumentNullException"></exception>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        /// <exception cref="ArgumentException"></exception>
+        private IEnumerable<SheetLoadResult> LoadSheets(
+            IEnumerable<SheetAddress> addresses,
+            int maxDegreeOfParallelism,
+            Func<SheetAddress, SheetModel> getSheet)
         {
-            if (_sheetsService == null)
+            CheckSheetService();
+
+            if (addresses == null)
             {
-                throw new InvalidOperationException(
-                    $"Need to authenticate before using this method."
-                );
+                throw new ArgumentNullException(nameof(addresses));
+            }
+
+            if (maxDegreeOfParallelism < 1)
+            {
+                throw new ArgumentOutOfRangeException(nameof(maxDegreeOfParallelism));
+            }
+
+            List<SheetAddress> addressList = addresses.ToList();
+
+            if (addressList.Contains(null))
+            {
+                throw new ArgumentException("Addresses contain null.", nameof(addresses));
             }
+
+            var results = new BlockingCollection<SheetLoadResult>();
+            // Not disposed: the producer can still check it after the caller stops enumerating,
+            // and no wait handle or timer is created for it.
+            var cancellation = new CancellationTokenSource();
+            CancellationToken cancellationToken = cancellation.Token;
+
+            Task producer = Task.Run(() =>
+            {
+                try
+                {
+                    Parallel.ForEach(
+                        Partitioner.Create(addressList, EnumerablePartitionerOptions.NoBuffering),
+                        new ParallelOptions
+                        {
+                            MaxDegreeOfParallelism = maxDegreeOfParallelism,
+                            CancellationToken = cancellationToken
+                        },
+                        address => results.Add(LoadSheet(address, getSheet, cancellationToken))
+                    );
+                }
+                catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+                {
+                    // The caller stopped enumerating, nobody waits for the remaining results.
+                }
+                finally
+                {
+                    results.CompleteAdding();
+                }
+            });
+
+            return ConsumeResults(results, producer, cancellation);
         }
 
-        /// <exception cref="UserAccessDeniedException"></exception>
-        private void CheckPrincipal(string operation)
+        /// <summary>
+        /// Returning results as they are received.
+        /// </summary>
+        /// <remarks>
+        /// If loading stopped because of an unexpected exception,
+        /// it is thrown after the received results, so the caller doesn't get a silently truncated sequence.<br/>
+        /// Loading is cancelled when the enumeration ends, including when the caller stops it early.
+        /// </remarks>
+        private static IEnumerable<SheetLoadResult> ConsumeResults(
+            BlockingCollection<SheetLoadResult> results,
+            Task producer,
+            CancellationTokenSource cancellation)
         {
-            if (_principal is ServiceAccount)
+            try
             {
-                throw new UserAccessDeniedException(
-                    $"Can't modify Google spreadsheets using {nameof(ServiceAccount)}.")
+                foreach (SheetLoadResult result in results.GetConsumingEnumerable(cancellation.Token))
                 {
-                    Operation = operation
-                };
+                    yield return result;
+                }
+
+                WaitProducer(producer);
+            }
+            finally
+            {
+                cancellation.Cancel();
             }
         }
-        #endregion
 
-        #region Spreadsheets
-        /// <exception cref="InvalidApiKeyException"></exception>
-        /// <exception cref="UserAccessDeniedException"></exception>
-        /// <exception cref="SpreadsheetNotFoundException"></exception>
-        private Spreadsheet GetGoogleSpreadsheet(string spreadsheetId)
+        private static void WaitProducer(Task producer)
         {
             try
             {
-                return _sheetsService.Spreadsheets.Get(spreadsheetId).Execute();
+                producer.Wait();
             }
-            catch (GoogleApiException e) when (e.HttpStatusCode == HttpStatusCode.BadRequest)
+            catch (AggregateException e)
             {
-                // Controversial and implicit decision,
-                // but so far this state only appeared due to an invalid API key.
-                // Maybe look for a clarifying error state.
-                throw new InvalidApiKeyException($"Failed to get spreadsheet with id: {spreadsheetId}", e);
+                AggregateException flattened = e.Flatten();
+
+                if (flattened.InnerExceptions.Count == 1)
+                {
+                    ExceptionDispatchInfo.Capture(flattened.InnerExceptions[0]).Throw();
+                }
+
+                throw flattened;
             }
-            catch (GoogleApiException e) when (e.HttpStatusCode == HttpStatusCode.Forbidden && e.Error.Message.Contains("does not have permission"))
+        }
+
+        /// <exception cref="OperationCanceledException">Loading was cancelled while waiting for a retry.</exception>
+        private static SheetLoadResult LoadSheet(
+            SheetAddress address,
+            Func<SheetAddress, SheetModel> getSheet,
+            CancellationToken cancellationToken)
+        {
+            for (int attempt = 0; ; attempt++)
             {
-                throw new UserAccessDeniedException(e.Error.Message, e)
+                try
                 {
-                    Operation = $"Recieving spreadsheet with id: {spreadsheetId}"
-                };
+                    return new SheetLoadResult(address, getSheet(address), null);
+                }
+                catch (GoogleApiException e) when (IsQuotaExceeded(e) && attempt < MaxQuotaRetries)
+                {
+                    WaitForRetry(GetQuotaRetryDelay(attempt), cancellationToken);
+                }
+                catch (Exception e)
+                {
+                    return new SheetLoadResult(address, null, e);
+                }
             }
-            catch (GoogleApiException e) when (e.HttpStatusCode == HttpStatusCode.NotFound)
+        }
+
+        /// <exception cref="OperationCanceledException"></exception>
+        private static void WaitForRetry(TimeSpan delay, CancellationToken cancellationToken)
+        {
+            try
             {
-                throw new SpreadsheetNotFoundException(e.Error.Message, e)
-                {
-                    SpreadsheetId = spreadsheetId
-                };
+                Task.Delay(delay, cancellationToken).Wait();
             }
+            catch (AggregateException)
+            {
+                cancellationToken.ThrowIfCancellationRequested();
+                throw;
+            }
+        }
+
+        private static bool IsQuotaExceeded(GoogleApiException e)
+        {
+            // HttpStatusCode doesn't contain 429 Too Many Requests in .NET Framework.
+            return (int)e.HttpStatusCode == 429;
+        }
+
+        /// <summary>
+        /// Exponential delay with a random addition,
+        /// so that parallel requests are not repeated at the same time.
+        /// </summary>
+        private static TimeSpan GetQuotaRetryDelay(int attempt)
+        {
+            var random = new Random(Guid.NewGuid().GetHashCode());
+            return TimeSpan.FromMilliseconds(1000 * Math.Pow(2, attempt) + random.Next(1000));
         }
+        #endregion
+
+        #region Watching
+        private const string SheetMetadataFields =
+            "spreadsheetId,properties/title," +
+            "sheets(properties(sheetId,title,gridProperties(rowCount,columnCount))," +
+            "developerMetadata(metadataId,metadataKey,metadataValue))";
 
+        /// <summary>
+        /// Receiving only the properties and the developer metadata of the sheet.
+        /// </summary>
+        /// <exception cref="InvalidApiKeyException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="SpreadsheetNotFoundException"></exception>
         /// <exception cref="SheetNotFoundException"></exception>
-        private Sheet GetGoogleSheet(Spreadsheet spreadsheet, int gid)
+        private Sheet GetSheetMetadata(string spreadsheetId, int gid)
         {
-            Sheet sheet = spreadsheet.Sheets.ToList().Find(s => s.Properties.SheetId == gid);
+            return GetGoogleSheet(GetGoogleSpreadsheet(spreadsheetId, SheetMetadataFields), gid);
+        }
 
-            if (sheet == null)
-            {
-                throw new SheetNotFoundException(
-                    $"Spreadsheet {spreadsheet.Properties.Title} " +
-                    $"with id: {spreadsheet.SpreadsheetId} " +
-                    $"not found sheet with gid: {gid}"
-                )
-                {
-                    SpreadsheetTitle = spreadsheet.Properties.Title,
-                    SpreadsheetId = spreadsheet.SpreadsheetId,
-                    SheetGid = gid.ToString()
-                };
-            }
+        /// <summary>
+        /// Version stamp combined with the grid size,
+        /// so that adding or removing rows is detected even without a new stamp.
+        /// </summary>
+        private string GetSheetVersionStamp(string spreadsheetId, int gid, string versionMetadataKey)
+        {
+            Sheet sheet = GetSheetMetadata(spreadsheetId, gid);
+            DeveloperMetadata metadata = sheet.DeveloperMetadata?.FirstOrDefault(m => m.MetadataKey == versionMetadataKey);
+            GridProperties grid = sheet.Properties.GridProperties;
 
-            return sheet;
+            return $"{grid?.RowCount}x{grid?.ColumnCount}:{metadata?.MetadataValue}";
         }
 
-        /// <exception cref="SheetNotFoundException"></exception>
-        private Sheet GetGoogleSheet(Spreadsheet spreadsheet, string sheetTitle)
+        /// <summary>
+        /// Creating a new state of the watched sheet from the received values.
+        /// </summary>
+        /// <exception cref="EmptySheetException"></exception>
+        /// <exception cref="SheetKeyNotFoundException"></exception>
+        private SheetModel CreateWatchedSheet(SheetModel watchedSheet, IList<IList<object>> data)
         {
-            Sheet sheet = spreadsheet.Sheets.ToList().Find(s => s.Properties.Title == sheetTitle);
+            var sheetModel = new SheetModel()
+            {
+                IsValuePoolEnabled = PoolCellValues,
+                SpreadsheetId = watchedSheet.SpreadsheetId,
+                SpreadsheetTitle = watchedSheet.SpreadsheetTitle,
+                Gid = watchedSheet.Gid,
+                Title = watchedSheet.Title,
+                Mode = watchedSheet.Mode,
+                KeyName = watchedSheet.KeyName
+            };
 
-            if (sheet == null)
+            switch (sheetModel.Mode)
             {
-                throw new SheetNotFoundException(
-                    $"Spreadsheet {spreadsheet.Properties.Title} " +
-                    $"with id: {spreadsheet.SpreadsheetId} " +
-                    $"not found sheet with name: {sheetTitle}"
-                )
-                {
-                    SpreadsheetTitle = spreadsheet.Properties.Title,
-                    SpreadsheetId = spreadsheet.SpreadsheetId,
-                    SheetTitle = sheetTitle
-                };
+                case SheetMode.HeadAndKey:
+                    sheetModel.ValidateData(data, sheetModel.KeyName);
+                    break;
+                case SheetMode.Head:
+                    sheetModel.ValidateData(data);
+                    break;
             }
 
-            return sheet;
-        }
+            if (data.Count > 0)
+            {
+                sheetModel.Fill(data);
+            }
 
-        private IList<IList<object>> GetData(string spreadsheetId, string sheetTitle)
-        {
-            return _sheetsService
-                .Spreadsheets
-                .Values
-                .Get(spreadsheetId, sheetTitle)
-                .Execute()
-                .Values ?? new List<IList<object>>();
+            return sheetModel;
         }
         #endregion
 
         #region UpdateSheetModel
-        private SpreadsheetsResource.ValuesResource.BatchUpdateRequest CreateUpdateRequest(SheetModel sheet)
+        private const int DefaultChunkCellCount = 50000;
+        private const int DefaultMaxConcurrentRequests = 4;
+
+        /// <summary>
+        /// Sending chunks of changed rows with limited concurrency.
+        /// </summary>
+        /// <remarks>
+        /// After the first failed chunk no new chunks are started,
+        /// the chunks already started are completed.
+        /// The exception of the failed chunk is rethrown on the calling thread.
+        /// </remarks>
+        private void SendChangeChunks(
+            SheetModel sheet,
+            List<List<Row>> chunks,
+            int maxConcurrentRequests,
+            UpdateProgressTracker tracker)
+        {
+            Exception firstException = null;
+
+            Parallel.ForEach(
+                chunks,
+                new ParallelOptions { MaxDegreeOfParallelism = maxConcurrentRequests },
+                (chunk, loopState) =>
+                {
+                    try
+                    {
+                        CreateUpdateRequest(sheet, chunk).Execute();
+                    }
+                    catch (Exception e)
+                    {
+                        Interlocked.CompareExchange(ref firstException, e, null);
+                        loopState.Stop();
+                        return;
+                    }
+
+                    MarkSent(chunk, tracker);
+                }
+            );
+
+            if (firstException != null)
+            {
+                ExceptionDispatchInfo.Capture(firstException).Throw();
+            }
+        }
+
+        /// <summary>
+        /// Rows of the sent chunk will not be sent again if the update is repeated.
+        /// </summary>
+        private static void MarkSent(List<Row> chunk, UpdateProgressTracker tracker)
         {
-            if (sheet.Rows.FindAll(row => row.Status == RowStatus.ToChange).Count <= 0)
+            foreach (Row row in chunk)
             {
-                return null;
+                row.Status = RowStatus.Original;
             }
- 
+
+            tracker.Report(chunk.Count);
+        }
+
+        private SpreadsheetsResource.ValuesResource.BatchUpdateRequest CreateUpdateRequest(SheetModel sheet, IList<Row> rows)
+        {
             var requestBody = new BatchUpdateValuesRequest
             {
-                Data = sheet.GetChangeValueRange(),
+                Data = ValueRangeConverter.ToChangeValueRanges(sheet, rows),
                 ValueInputOption = SpreadsheetsResource
                     .ValuesResource
                     .AppendRequest
@@ -785,17 +2896,12 @@ namespace SynSys.GSpreadsheetEasyAccess.Application
             };
         }
 
-        private SpreadsheetsResource.ValuesResource.AppendRequest CreateAppendRequest(SheetModel sheet)
+        private SpreadsheetsResource.ValuesResource.AppendRequest CreateAppendRequest(SheetModel sheet, IList<Row> rows)
         {
-            if (sheet.Rows.FindAll(row => row.Status == RowStatus.ToAppend).Count <= 0)
-            {
-                return null;
-            }
- 
             var request = _sheetsService
                 .Spreadsheets
                 .Values
-                .Append(sheet.GetAppendValueRange(), sheet.SpreadsheetId, sheet.Title);
+                .Append(ValueRangeConverter.ToAppendValueRange(sheet, rows), sheet.SpreadsheetId, sheet.Title);
 
             request.ValueInputOption = SpreadsheetsResource
                 .ValuesResource
@@ -806,52 +2912,307 @@ namespace SynSys.GSpreadsheetEasyAccess.Application
             return request;
         }
 
-        private SpreadsheetsResource.BatchUpdateRequest CreateAddSheetRequest(string spreadsheetId, string sheetTitle)
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="OAuthSheetsScopeException"></exception>
+        private void AppendRows(SheetModel sheet, IList<IList<object>> rows)
         {
-            var batchUpdateSpreadsheetRequest = new BatchUpdateSpreadsheetRequest()
+            var request = _sheetsService
+                .Spreadsheets
+                .Values
+                .Append(new ValueRange { Values = rows }, sheet.SpreadsheetId, sheet.Title);
+
+            request.ValueInputOption = SpreadsheetsResource
+                .ValuesResource
+                .AppendRequest
+                .ValueInputOptionEnum
+                .USERENTERED;
+
+            try
             {
-                Requests = new List<Request>()
+                request.Execute();
+            }
+            catch (GoogleApiException e) when (e.HttpStatusCode == HttpStatusCode.Forbidden && e.Error.Message.Contains("insufficient authentication scopes"))
+            {
+                throw new OAuthSheetsScopeException(e.Error.Message, e);
+            }
+            catch (GoogleApiException e) when (e.HttpStatusCode == HttpStatusCode.Forbidden && e.Error.Message.Contains("does not have permission"))
+            {
+                throw new UserAccessDeniedException(e.Error.Message, e)
+                {
+                    Operation = $"Append rows: {sheet.SpreadsheetTitle}/{sheet.Title}",
+                };
+            }
+        }
+
+        #endregion
+
+        #region CreatingSheets
+        private const int DefaultSheetRowCount = 1000;
+        private const int DefaultSheetColumnCount = 26;
+        private const string CreatedSheetFields = "replies/addSheet/properties/sheetId,updatedSpreadsheet/properties/title";
+        private const string ExistingSheetFields = "spreadsheetId,properties/title,sheets/properties(sheetId,title)";
+
+        /// <exception cref="ArgumentNullException"></exception>
+        /// <exception cref="ArgumentException"></exception>
+        private static List<string> CheckSheetTitles(IEnumerable<string> sheetTitles)
+        {
+            if (sheetTitles == null)
+            {
+                throw new ArgumentNullException(nameof(sheetTitles));
+            }
+
+            List<string> titles = sheetTitles.ToList();
+
+            if (titles.Count == 0)
+            {
+                throw new ArgumentException("At least one sheet title is required.", nameof(sheetTitles));
+            }
+
+            if (titles.Distinct().Count() != titles.Count)
+            {
+                throw new ArgumentException("Sheet titles must be unique.", nameof(sheetTitles));
+            }
+
+            return titles;
+        }
+
+        /// <summary>
+        /// Adding sheets with frozen head rows to the Google spreadsheet in one batchUpdate request.
+        /// </summary>
+        /// <remarks>
+        /// Gids are assigned before sending, because the head rows are written in the same request.<br/>
+        /// The spreadsheet is received only if Google rejects the request as bad, to find out the reason.
+        /// If the reason is a gid that is already used, the request is repeated once with other gids.
+        /// Other failures are not handled here.
+        /// </remarks>
+        /// <param name="spreadsheetId"></param>
+        /// <param name="sheetTitles"></param>
+        /// <param name="head">Null for sheets without head</param>
+        /// <param name="mode"></param>
+        /// <param name="keyName"></param>
+        /// <exception cref="InvalidApiKeyException"></exception>
+        /// <exception cref="UserAccessDeniedException"></exception>
+        /// <exception cref="SpreadsheetNotFoundException"></exception>
+        /// <exception cref="OAuthSheetsScopeException"></exception>
+        /// <exception cref="SheetExistsException"></exception>
+        /// <exception cref="CreatingSheetException">Google rejected the request for another reason.</exception>
+        private IList<SheetModel> AddSheets(
+            string spreadsheetId,
+            IList<string> sheetTitles,
+            List<string> head,
+            SheetMode mode,
+            string keyName)
+        {
+            return AddSheets(spreadsheetId, sheetTitles, head, mode, keyName, new HashSet<int>(), true);
+        }
+
+        private IList<SheetModel> AddSheets(
+            string spreadsheetId,
+            IList<string> sheetTitles,
+            List<string> head,
+            SheetMode mode,
+            string keyName,
+            ISet<int> usedGids,
+            bool canRetry)
+        {
+            List<int> gids = GenerateSheetGids(sheetTitles.Count, usedGids);
+            BatchUpdateSpreadsheetResponse response;
+
+            try
+            {
+                var request = CreateAddSheetsRequest(spreadsheetId, sheetTitles, gids, head);
+                request.Fields = CreatedSheetFields;
+                response = request.Execute();
+            }
+            catch (GoogleApiException e) when (e.HttpStatusCode == HttpStatusCode.Forbidden && e.Error.Message.Contains("insufficient authentication scopes"))
+            {
+                throw new OAuthSheetsScopeException(e.Error.Message, e);
+            }
+            catch (GoogleApiException e) when (e.HttpStatusCode == HttpStatusCode.Forbidden && e.Error.Message.Contains("does not have permission"))
+            {
+                throw new UserAccessDeniedException(e.Error.Message, e)
+                {
+                    Operation = $"Create sheet: {string.Join(", ", sheetTitles)}",
+                };
+            }
+            catch (GoogleApiException e) when (e.HttpStatusCode == HttpStatusCode.NotFound)
+            {
+                throw new SpreadsheetNotFoundException(e.Error.Message, e)
+                {
+                    SpreadsheetId = spreadsheetId
+                };
+            }
+            catch (GoogleApiException e) when (e.HttpStatusCode == HttpStatusCode.BadRequest)
+            {
+                // A sheet with the same title or gid is reported as a bad request.
+                Spreadsheet spreadsheet = GetGoogleSpreadsheet(spreadsheetId, ExistingSheetFields);
+                string existingTitle = sheetTitles.FirstOrDefault(title => IsSheetExists(spreadsheet, title));
+
+                if (existingTitle != null)
+                {
+                    throw new SheetExistsException()
+                    {
+                        SpreadsheetId = spreadsheetId,
+                        SpreadsheetTitle = spreadsheet.Properties.Title,
+                        SheetTitle = existingTitle
+                    };
+                }
+
+                HashSet<int> existingGids = GetSheetGids(spreadsheet);
+
+                if (canRetry && gids.Any(existingGids.Contains))
+                {
+                    return AddSheets(spreadsheetId, sheetTitles, head, mode, keyName, existingGids, false);
+                }
+
+                throw new CreatingSheetException("Couldn't add sheet to google spreadsheet", e)
+                {
+                    SpreadsheetId = spreadsheetId,
+                    SpreadsheetTitle = spreadsheet.Properties.Title,
+                    SheetTitle = string.Join(", ", sheetTitles),
+                };
+            }
+
+            var sheetModels = new List<SheetModel>(sheetTitles.Count);
+
+            for (int i = 0; i < sheetTitles.Count; i++)
+            {
+                sheetModels.Add(new SheetModel()
+                {
+                    IsValuePoolEnabled = PoolCellValues,
+                    SpreadsheetTitle = response.UpdatedSpreadsheet.Properties.Title,
+                    SpreadsheetId = spreadsheetId,
+                    Title = sheetTitles[i],
+                    Gid = response.Replies[i].AddSheet.Properties.SheetId ?? gids[i],
+                    Head = head == null ? new List<string>() : new List<string>(head),
+                    Mode = mode,
+                    KeyName = keyName
+                });
+            }
+
+            return sheetModels;
+        }
+
+        /// <summary>
+        /// Gids of all sheets of the spreadsheet.
+        /// </summary>
+        internal static HashSet<int> GetSheetGids(Spreadsheet spreadsheet)
+        {
+            return new HashSet<int>(
+                spreadsheet.Sheets
+                    .Where(sheet => sheet.Properties.SheetId.HasValue)
+                    .Select(sheet => sheet.Properties.SheetId.Value)
+            );
+        }
+
+        /// <summary>
+        /// Random positive gids that are not in usedGids and differ from each other,
+        /// the same way Google assigns gids of new sheets.
+        /// </summary>
+        internal static List<int> GenerateSheetGids(int count, ISet<int> usedGids)
+        {
+            var random = new Random(Guid.NewGuid().GetHashCode());
+            var gids = new List<int>(count);
+
+            while (gids.Count < count)
+            {
+                int gid = random.Next(1, int.MaxValue);
+
+                if (!usedGids.Contains(gid) && !gids.Contains(gid))
+                {
+                    gids.Add(gid);
+                }
+            }
+
+            return gids;
+        }
+
+        private SpreadsheetsResource.BatchUpdateRequest CreateAddSheetsRequest(
+            string spreadsheetId,
+            IList<string> sheetTitles,
+            IList<int> gids,
+            IList<string> head)
+        {
+            return _sheetsService.Spreadsheets.BatchUpdate(CreateAddSheetsRequestBody(sheetTitles, gids, head), spreadsheetId);
+        }
+
+        /// <summary>
+        /// All AddSheet requests go first, so the reply of the sheet with index i is Replies[i].
+        /// </summary>
+        /// <remarks>
+        /// Sheets have at least as many columns as sheets created by Google by default.
+        /// </remarks>
+        internal static BatchUpdateSpreadsheetRequest CreateAddSheetsRequestBody(
+            IList<string> sheetTitles,
+            IList<int> gids,
+            IList<string> head)
+        {
+            var requestBody = new BatchUpdateSpreadsheetRequest()
+            {
+                Requests = new List<Request>(),
+                IncludeSpreadsheetInResponse = true,
+                ResponseIncludeGridData = false
+            };
+
+            for (int i = 0; i < sheetTitles.Count; i++)
+            {
+                requestBody.Requests.Add(new Request()
                 {
-                    new Request()
+                    AddSheet = new AddSheetRequest()
                     {
-                        AddSheet = new AddSheetRequest()
+                        Properties = new SheetProperties()
                         {
-                            Properties = new SheetProperties()
+                            SheetId = gids[i],
+                            Title = sheetTitles[i],
+                            GridProperties = new GridProperties()
                             {
-                                Title = sheetTitle,
+                                RowCount = DefaultSheetRowCount,
+                                ColumnCount = head == null ? DefaultSheetColumnCount : Math.Max(DefaultSheetColumnCount, head.Count),
+                                FrozenRowCount = head == null ? 0 : 1
                             }
                         }
                     }
+                });
+            }
+
+            if (head != null)
+            {
+                foreach (int gid in gids)
+                {
+                    requestBody.Requests.Add(CreateHeadRequest(gid, head));
                 }
-            };
+            }
 
-            return _sheetsService.Spreadsheets.BatchUpdate(batchUpdateSpreadsheetRequest, spreadsheetId);
+            return requestBody;
         }
 
-        private void AddHead(SheetModel sheet, IEnumerable<string> head)
+        private static Request CreateHeadRequest(int gid, IList<string> head)
         {
-            sheet.Head = head.ToList();
-
-            var range = new ValueRange
+            return new Request()
             {
-                Values = new List<IList<object>>()
+                UpdateCells = new UpdateCellsRequest()
                 {
-                    head.Cast<object>().ToList()
+                    Start = new GridCoordinate()
+                    {
+                        SheetId = gid,
+                        RowIndex = 0,
+                        ColumnIndex = 0
+                    },
+                    Rows = new List<RowData>()
+                    {
+                        new RowData()
+                        {
+                            Values = head
+                                .Select(title => new CellData()
+                                {
+                                    UserEnteredValue = new ExtendedValue() { StringValue = title }
+                                })
+                                .ToList()
+                        }
+                    },
+                    Fields = "userEnteredValue"
                 }
             };
-
-            var request = _sheetsService
-                .Spreadsheets
-                .Values
-                .Append(range, sheet.SpreadsheetId, sheet.Title);
-
-            request.ValueInputOption = SpreadsheetsResource
-                .ValuesResource
-                .AppendRequest
-                .ValueInputOptionEnum
-                .USERENTERED;
-
-            request.Execute();
         }
         #endregion
     }
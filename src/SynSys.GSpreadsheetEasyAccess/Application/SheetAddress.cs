@@ -0,0 +1,71 @@
+namespace SynSys.GSpreadsheetEasyAccess.Application
+{
+    /// <summary>
+    /// Represents the location of one Google spreadsheet sheet.
+    /// </summary>
+    /// <remarks>
+    /// The sheet is determined either by Gid or by Title.
+    /// </remarks>
+    public class SheetAddress
+    {
+        /// <summary>
+        /// Google spreadsheet Id.
+        /// </summary>
+        public string SpreadsheetId { get; }
+
+        /// <summary>
+        /// Google spreadsheet sheet Id. Equal to -1 if the sheet is determined by Title.
+        /// </summary>
+        public int Gid { get; } = -1;
+
+        /// <summary>
+        /// Sheet name. Null if the sheet is determined by Gid.
+        /// </summary>
+        public string Title { get; }
+
+        /// <summary>
+        /// Initializes the address of the sheet determined by Gid.
+        /// </summary>
+        /// <param name="spreadsheetId"></param>
+        /// <param name="gid"></param>
+        public SheetAddress(string spreadsheetId, int gid)
+        {
+            SpreadsheetId = spreadsheetId;
+            Gid = gid;
+        }
+
+        /// <summary>
+        /// Initializes the address of the sheet determined by Title.
+        /// </summary>
+        /// <param name="spreadsheetId"></param>
+        /// <param name="sheetTitle"></param>
+        public SheetAddress(string spreadsheetId, string sheetTitle)
+        {
+            SpreadsheetId = spreadsheetId;
+            Title = sheetTitle;
+        }
+
+        /// <summary>
+        /// Get the address of the sheet from the full sheet uri.
+        /// </summary>
+        /// <param name="uri">Full Google spreadsheet sheet uri</param>
+        public static SheetAddress FromUri(string uri)
+        {
+            return new SheetAddress(
+                HttpUtils.GetSpreadsheetIdFromUri(uri),
+                HttpUtils.GetGidFromUri(uri)
+            );
+        }
+
+        /// <summary>
+        /// Indicates that the sheet is determined by Title.
+        /// </summary>
+        internal bool HasTitle { get => Title != null; }
+
+        /// <inheritdoc/>
+        public override string ToString()
+        {
+            return HasTitle ? $"{SpreadsheetId}/{Title}" : $"{SpreadsheetId}/gid={Gid}";
+        }
+    }
+}
@@ -0,0 +1,328 @@
+using SynSys.GSpreadsheetEasyAccess.Data;
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Threading;
+
+namespace SynSys.GSpreadsheetEasyAccess.Application
+{
+    /// <summary>
+    /// Represents a buffer of rows that are appended to the end of a Google spreadsheet sheet
+    /// in batches on a background thread.
+    /// </summary>
+    /// <remarks>
+    /// Rows are sent when the buffer contains BatchSize rows or when FlushInterval has passed
+    /// since the previous sending.<br/>
+    /// If the buffer is full, Append waits for free space and TryAppend drops the row.<br/>
+    /// Remaining rows are sent when the instance is disposed.
+    /// If it is disposed from the BatchFailed handler, they are sent after the handler returns.<br/>
+    /// Appended rows are not added to the SheetModel.
+    /// </remarks>
+    public class SheetAppender : IDisposable
+    {
+        internal const int DefaultBatchSize = 500;
+        internal const int DefaultCapacity = 10000;
+        internal static readonly TimeSpan DefaultFlushInterval = TimeSpan.FromSeconds(5);
+
+        private readonly SheetModel _sheet;
+        private readonly Action<IList<IList<object>>> _appendRows;
+        private readonly BlockingCollection<IList<object>> _buffer;
+        private readonly AutoResetEvent _batchReady = new AutoResetEvent(false);
+        private readonly ManualResetEventSlim _stopping = new ManualResetEventSlim(false);
+        private readonly object _sendLock = new object();
+        private readonly Thread _worker;
+        private long _sentRowCount;
+        private long _failedRowCount;
+        private long _droppedRowCount;
+        private int _isDisposed;
+        private int _flushDepth;
+        private bool _isReleasePending;
+        private bool _isReleased;
+
+        /// <summary>
+        /// Occurs when a batch of rows could not be appended to the Google spreadsheet sheet.
+        /// </summary>
+        /// <remarks>
+        /// The event is raised on the thread which sent the batch.
+        /// </remarks>
+        public event EventHandler<AppendBatchFailedEventArgs> BatchFailed;
+
+        /// <summary>
+        /// Maximum number of rows in one request.
+        /// </summary>
+        public int BatchSize { get; }
+
+        /// <summary>
+        /// Maximum time that a row waits in the buffer before sending.
+        /// </summary>
+        public TimeSpan FlushInterval { get; }
+
+        /// <summary>
+        /// Maximum number of rows in the buffer.
+        /// </summary>
+        public int Capacity { get; }
+
+        /// <summary>
+        /// Number of rows waiting for sending.
+        /// </summary>
+        public int BufferedRowCount { get => _buffer.Count; }
+
+        /// <summary>
+        /// Number of rows successfully appended to the Google spreadsheet sheet.
+        /// </summary>
+        public long SentRowCount { get => Interlocked.Read(ref _sentRowCount); }
+
+        /// <summary>
+        /// Number of rows from batches that could not be appended.
+        /// </summary>
+        public long FailedRowCount { get => Interlocked.Read(ref _failedRowCount); }
+
+        /// <summary>
+        /// Number of rows rejected by TryAppend because the buffer was full.
+        /// </summary>
+        public long DroppedRowCount { get => Interlocked.Read(ref _droppedRowCount); }
+
+        /// <summary>
+        /// Adds a row to the buffer.
+        /// </summary>
+        /// <remarks>
+        /// If the buffer is full, the method waits until the background thread frees up space.<br/>
+        /// The row size will be equal to the head size of the sheet.
+        /// </remarks>
+        /// <param name="data">Data to compose a row.</param>
+        /// <exception cref="ObjectDisposedException"></exception>
+        public void Append(IList<string> data)
+        {
+            CheckDisposed();
+
+            _buffer.Add(_sheet.CreateRowData(data));
+            SignalIfBatchReady();
+        }
+
+        /// <summary>
+        /// Adds a row to the buffer if it is not full.
+        /// </summary>
+        /// <remarks>
+        /// If the buffer is full, the row is dropped and counted in DroppedRowCount.
+        /// </remarks>
+        /// <param name="data">Data to compose a row.</param>
+        /// <returns>true if the row was added to the buffer.</returns>
+        /// <exception cref="ObjectDisposedException"></exception>
+        public bool TryAppend(IList<string> data)
+        {
+            CheckDisposed();
+
+            if (!_buffer.TryAdd(_sheet.CreateRowData(data)))
+            {
+                Interlocked.Increment(ref _droppedRowCount);
+                return false;
+            }
+
+            SignalIfBatchReady();
+            return true;
+        }
+
+        /// <summary>
+        /// Sends all buffered rows on the calling thread.
+        /// </summary>
+        /// <exception cref="ObjectDisposedException"></exception>
+        public void Flush()
+        {
+            CheckDisposed();
+            FlushBuffer();
+        }
+
+        /// <summary>
+        /// Stops the background thread and sends all remaining rows.
+        /// </summary>
+        /// <remarks>
+        /// Can be called from the BatchFailed handler.
+        /// In this case the remaining rows are sent by the Flush that raised the event.
+        /// </remarks>
+        public void Dispose()
+        {
+            if (Interlocked.Exchange(ref _isDisposed, 1) == 1)
+            {
+                return;
+            }
+
+            _buffer.CompleteAdding();
+            _stopping.Set();
+
+            // The background thread can't wait for itself when the handler is called on it.
+            if (Thread.CurrentThread != _worker)
+            {
+                _worker.Join();
+            }
+
+            lock (_sendLock)
+            {
+                if (_flushDepth > 0)
+                {
+                    _isReleasePending = true;
+                    return;
+                }
+
+                FlushBuffer();
+                ReleaseResources();
+            }
+        }
+
+
+        /// <summary>
+        /// Initializes the appender and starts the background thread.
+        /// </summary>
+        /// <param name="sheet">Sheet to which rows are appended</param>
+        /// <param name="appendRows">Sending one batch to Google</param>
+        /// <param name="batchSize"></param>
+        /// <param name="flushInterval"></param>
+        /// <param name="capacity"></param>
+        internal SheetAppender(
+            SheetModel sheet,
+            Action<IList<IList<object>>> appendRows,
+            int batchSize,
+            TimeSpan flushInterval,
+            int capacity)
+        {
+            _sheet = sheet;
+            _appendRows = appendRows;
+
+            BatchSize = batchSize;
+            FlushInterval = flushInterval;
+            Capacity = capacity;
+
+            _buffer = new BlockingCollection<IList<object>>(capacity);
+            _worker = new Thread(Run)
+            {
+                IsBackground = true,
+                Name = $"{nameof(SheetAppender)} {sheet.SpreadsheetTitle}/{sheet.Title}"
+            };
+            _worker.Start();
+        }
+
+
+        /// <summary>
+        /// Sending all buffered rows, also while the instance is being disposed.
+        /// </summary>
+        private void FlushBuffer()
+        {
+            lock (_sendLock)
+            {
+                // A Flush that passed the disposed check while Dispose was sending the remaining rows.
+                if (_isReleased)
+                {
+                    return;
+                }
+
+                _flushDepth++;
+
+                try
+                {
+                    var batch = new List<IList<object>>(BatchSize);
+
+                    while (_buffer.TryTake(out IList<object> row))
+                    {
+                        batch.Add(row);
+
+                        if (batch.Count == BatchSize)
+                        {
+                            Send(batch);
+                            batch = new List<IList<object>>(BatchSize);
+                        }
+                    }
+
+                    if (batch.Count > 0)
+                    {
+                        Send(batch);
+                    }
+                }
+                finally
+                {
+                    _flushDepth--;
+                }
+
+                if (_flushDepth == 0 && _isReleasePending)
+                {
+                    ReleaseResources();
+                }
+            }
+        }
+
+        private void Run()
+        {
+            var waitHandles = new WaitHandle[] { _batchReady, _stopping.WaitHandle };
+
+            while (true)
+            {
+                WaitHandle.WaitAny(waitHandles, FlushInterval);
+
+                if (IsDisposed)
+                {
+                    return;
+                }
+
+                // Another thread that is sending rows may be waiting for this thread in Dispose.
+                if (!Monitor.TryEnter(_sendLock))
+                {
+                    continue;
+                }
+
+                try
+                {
+                    FlushBuffer();
+                }
+                finally
+                {
+                    Monitor.Exit(_sendLock);
+                }
+
+                if (IsDisposed)
+                {
+                    return;
+                }
+            }
+        }
+
+        private bool IsDisposed { get => Volatile.Read(ref _isDisposed) == 1; }
+
+        private void ReleaseResources()
+        {
+            _isReleasePending = false;
+            _isReleased = true;
+            _buffer.Dispose();
+            _batchReady.Dispose();
+            _stopping.Dispose();
+        }
+
+        private void Send(IList<IList<object>> batch)
+        {
+            try
+            {
+                _appendRows(batch);
+                Interlocked.Add(ref _sentRowCount, batch.Count);
+            }
+            catch (Exception e)
+            {
+                Interlocked.Add(ref _failedRowCount, batch.Count);
+                BatchFailed?.Invoke(this, new AppendBatchFailedEventArgs(batch, e));
+            }
+        }
+
+        private void SignalIfBatchReady()
+        {
+            if (_buffer.Count >= BatchSize)
+            {
+                _batchReady.Set();
+            }
+        }
+
+        /// <exception cref="ObjectDisposedException"></exception>
+        private void CheckDisposed()
+        {
+            if (IsDisposed)
+            {
+                throw new ObjectDisposedException(nameof(SheetAppender));
+            }
+        }
+    }
+}
@@ -0,0 +1,32 @@
+using SynSys.GSpreadsheetEasyAccess.Data;
+using System;
+
+namespace SynSys.GSpreadsheetEasyAccess.Application
+{
+    /// <summary>
+    /// Provides data for the SheetWatcher.SheetChanged event.
+    /// </summary>
+    public class SheetChangedEventArgs : EventArgs
+    {
+        /// <summary>
+        /// Changes that turn the previous state of the sheet into the new one.
+        /// </summary>
+        /// <remarks>
+        /// Null if the head of the sheet has changed,
+        /// since such a change can't be represented as changes of rows.
+        /// </remarks>
+        public SheetPatch Patch { get; }
+
+        /// <summary>
+        /// New state of the Google spreadsheet sheet.
+        /// </summary>
+        public SheetModel Sheet { get; }
+
+
+        internal SheetChangedEventArgs(SheetPatch patch, SheetModel sheet)
+        {
+            Patch = patch;
+            Sheet = sheet;
+        }
+    }
+}
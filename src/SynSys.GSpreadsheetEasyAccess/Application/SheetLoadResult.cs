@@ -0,0 +1,44 @@
+using SynSys.GSpreadsheetEasyAccess.Data;
+using System;
+
+namespace SynSys.GSpreadsheetEasyAccess.Application
+{
+    /// <summary>
+    /// Represents the result of receiving one sheet during bulk loading.
+    /// </summary>
+    public class SheetLoadResult
+    {
+        /// <summary>
+        /// Location of the requested sheet.
+        /// </summary>
+        public SheetAddress Address { get; }
+
+        /// <summary>
+        /// Received sheet. Null if the sheet could not be received.
+        /// </summary>
+        public SheetModel Sheet { get; }
+
+        /// <summary>
+        /// The reason why the sheet could not be received.
+        /// Null if the sheet was received.
+        /// </summary>
+        /// <remarks>
+        /// These are the same exceptions that are thrown by the methods
+        /// for receiving one sheet, for example SheetNotFoundException or UserAccessDeniedException.
+        /// </remarks>
+        public Exception Exception { get; }
+
+        /// <summary>
+        /// Indicates that the sheet was received.
+        /// </summary>
+        public bool IsSuccess { get => Exception == null; }
+
+
+        internal SheetLoadResult(SheetAddress address, SheetModel sheet, Exception exception)
+        {
+            Address = address;
+            Sheet = sheet;
+            Exception = exception;
+        }
+    }
+}
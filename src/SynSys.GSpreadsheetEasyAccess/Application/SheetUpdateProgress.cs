@@ -0,0 +1,28 @@
+namespace SynSys.GSpreadsheetEasyAccess.Application
+{
+    /// <summary>
+    /// Represents the progress of updating a Google spreadsheet sheet.
+    /// </summary>
+    /// <remarks>
+    /// Reported after each successfully sent chunk of appended or changed rows.
+    /// </remarks>
+    public class SheetUpdateProgress
+    {
+        /// <summary>
+        /// Number of appended and changed rows that have already been sent.
+        /// </summary>
+        public int SentRowCount { get; }
+
+        /// <summary>
+        /// Number of appended and changed rows to send during this update.
+        /// </summary>
+        public int TotalRowCount { get; }
+
+
+        internal SheetUpdateProgress(int sentRowCount, int totalRowCount)
+        {
+            SentRowCount = sentRowCount;
+            TotalRowCount = totalRowCount;
+        }
+    }
+}
@@ -0,0 +1,21 @@
+using System;
+
+namespace SynSys.GSpreadsheetEasyAccess.Application
+{
+    /// <summary>
+    /// Provides data for the SheetWatcher.PollFailed event.
+    /// </summary>
+    public class SheetWatchFailedEventArgs : EventArgs
+    {
+        /// <summary>
+        /// The reason why the sheet could not be checked.
+        /// </summary>
+        public Exception Exception { get; }
+
+
+        internal SheetWatchFailedEventArgs(Exception exception)
+        {
+            Exception = exception;
+        }
+    }
+}
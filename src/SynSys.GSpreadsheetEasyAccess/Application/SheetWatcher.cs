@@ -0,0 +1,273 @@
+using SynSys.GSpreadsheetEasyAccess.Data;
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Threading;
+
+namespace SynSys.GSpreadsheetEasyAccess.Application
+{
+    /// <summary>
+    /// Represents a background check of a Google spreadsheet sheet for changes.
+    /// </summary>
+    /// <remarks>
+    /// If a version metadata key is used, only the sheet metadata is requested on each check
+    /// and the values are received only after the version stamp has changed.
+    /// Edits that don't update the stamp are detected only if they change the grid size.<br/>
+    /// Otherwise, all values are received on each check and compared by hash,
+    /// so the sheet model is created only when the values have changed,
+    /// but each check receives the whole sheet.<br/>
+    /// The check interval doubles while the sheet doesn't change or the check fails,
+    /// up to MaxInterval, and returns to MinInterval after a change.<br/>
+    /// Events are raised on the background thread, the watcher can be disposed from their handlers.
+    /// </remarks>
+    public class SheetWatcher : IDisposable
+    {
+        internal static readonly TimeSpan DefaultMinInterval = TimeSpan.FromSeconds(15);
+        internal static readonly TimeSpan DefaultMaxInterval = TimeSpan.FromMinutes(5);
+
+        private readonly Func<string> _getVersionStamp;
+        private readonly Func<IList<IList<object>>> _getData;
+        private readonly Func<IList<IList<object>>, SheetModel> _createSheet;
+        private readonly ManualResetEventSlim _stopping = new ManualResetEventSlim(false);
+        private readonly Thread _worker;
+        private SheetModel _sheet;
+        private string _versionStamp;
+        private ulong _valuesHash;
+        private long _currentIntervalTicks;
+        private long _pollCount;
+        private long _fetchCount;
+        private int _isDisposed;
+
+        /// <summary>
+        /// Occurs when the values of the Google spreadsheet sheet have changed.
+        /// </summary>
+        /// <remarks>
+        /// Exceptions of handlers are not caught and are not reported by the PollFailed event.
+        /// </remarks>
+        public event EventHandler<SheetChangedEventArgs> SheetChanged;
+
+        /// <summary>
+        /// Occurs when the sheet could not be checked.
+        /// </summary>
+        /// <remarks>
+        /// The watcher continues checking with an increased interval.
+        /// </remarks>
+        public event EventHandler<SheetWatchFailedEventArgs> PollFailed;
+
+        /// <summary>
+        /// Last received state of the Google spreadsheet sheet.
+        /// </summary>
+        /// <remarks>
+        /// The instance is replaced after each change and must not be modified.
+        /// </remarks>
+        public SheetModel Sheet { get => Volatile.Read(ref _sheet); }
+
+        /// <summary>
+        /// Interval between checks after a change.
+        /// </summary>
+        public TimeSpan MinInterval { get; }
+
+        /// <summary>
+        /// Maximum interval between checks.
+        /// </summary>
+        public TimeSpan MaxInterval { get; }
+
+        /// <summary>
+        /// Interval before the next check.
+        /// </summary>
+        public TimeSpan CurrentInterval { get => TimeSpan.FromTicks(Interlocked.Read(ref _currentIntervalTicks)); }
+
+        /// <summary>
+        /// Indicates that changes are detected by the version stamp in the sheet metadata.
+        /// </summary>
+        public bool UsesVersionStamp { get => _getVersionStamp != null; }
+
+        /// <summary>
+        /// Number of performed checks.
+        /// </summary>
+        public long PollCount { get => Interlocked.Read(ref _pollCount); }
+
+        /// <summary>
+        /// Number of times the values of the sheet were received.
+        /// </summary>
+        public long FetchCount { get => Interlocked.Read(ref _fetchCount); }
+
+        /// <summary>
+        /// Stops the background thread.
+        /// </summary>
+        /// <remarks>
+        /// Waits for the current check to finish, unless it is called from an event handler.
+        /// </remarks>
+        public void Dispose()
+        {
+            if (Interlocked.Exchange(ref _isDisposed, 1) == 1)
+            {
+                return;
+            }
+
+            _stopping.Set();
+
+            // The background thread can't wait for itself, it stops after the handler returns.
+            if (Thread.CurrentThread != _worker)
+            {
+                _worker.Join();
+            }
+        }
+
+
+        /// <summary>
+        /// Receives the current state of the sheet and starts the background thread.
+        /// </summary>
+        /// <param name="getVersionStamp">Receiving the version stamp. Null if values are compared by hash.</param>
+        /// <param name="getData">Receiving the values of the sheet</param>
+        /// <param name="createSheet">Creating a sheet model from the values</param>
+        /// <param name="minInterval"></param>
+        /// <param name="maxInterval"></param>
+        internal SheetWatcher(
+            Func<string> getVersionStamp,
+            Func<IList<IList<object>>> getData,
+            Func<IList<IList<object>>, SheetModel> createSheet,
+            TimeSpan minInterval,
+            TimeSpan maxInterval)
+        {
+            _getVersionStamp = getVersionStamp;
+            _getData = getData;
+            _createSheet = createSheet;
+
+            MinInterval = minInterval;
+            MaxInterval = maxInterval;
+            _currentIntervalTicks = minInterval.Ticks;
+
+            _versionStamp = _getVersionStamp?.Invoke();
+            IList<IList<object>> data = FetchData();
+            _valuesHash = ComputeHash(data);
+            _sheet = _createSheet(data);
+
+            _worker = new Thread(Run)
+            {
+                IsBackground = true,
+                Name = $"{nameof(SheetWatcher)} {_sheet.SpreadsheetTitle}/{_sheet.Title}"
+            };
+            _worker.Start();
+        }
+
+        /// <summary>
+        /// One check of the sheet for changes.
+        /// </summary>
+        internal void Poll()
+        {
+            Interlocked.Increment(ref _pollCount);
+
+            SheetChangedEventArgs changedArgs;
+
+            try
+            {
+                string versionStamp = null;
+
+                if (UsesVersionStamp)
+                {
+                    versionStamp = _getVersionStamp();
+
+                    if (versionStamp == _versionStamp)
+                    {
+                        IncreaseInterval();
+                        return;
+                    }
+                }
+
+                IList<IList<object>> data = FetchData();
+                ulong valuesHash = ComputeHash(data);
+
+                if (valuesHash == _valuesHash)
+                {
+                    _versionStamp = versionStamp;
+                    IncreaseInterval();
+                    return;
+                }
+
+                SheetModel newSheet = _createSheet(data);
+                SheetPatch patch = CreatePatch(_sheet, newSheet);
+
+                _versionStamp = versionStamp;
+                _valuesHash = valuesHash;
+                Volatile.Write(ref _sheet, newSheet);
+                Interlocked.Exchange(ref _currentIntervalTicks, MinInterval.Ticks);
+
+                changedArgs = new SheetChangedEventArgs(patch, newSheet);
+            }
+            catch (Exception e)
+            {
+                IncreaseInterval();
+                PollFailed?.Invoke(this, new SheetWatchFailedEventArgs(e));
+                return;
+            }
+
+            // Outside of the try block, so exceptions of handlers are not reported as failed checks.
+            SheetChanged?.Invoke(this, changedArgs);
+        }
+
+
+        private void Run()
+        {
+            while (!_stopping.Wait(CurrentInterval))
+            {
+                Poll();
+            }
+
+            _stopping.Dispose();
+        }
+
+        private IList<IList<object>> FetchData()
+        {
+            Interlocked.Increment(ref _fetchCount);
+            return _getData();
+        }
+
+        private void IncreaseInterval()
+        {
+            long ticks = Math.Min(Interlocked.Read(ref _currentIntervalTicks) * 2, MaxInterval.Ticks);
+            Interlocked.Exchange(ref _currentIntervalTicks, ticks);
+        }
+
+        /// <returns>Null if the sheets have different heads.</returns>
+        private static SheetPatch CreatePatch(SheetModel previousSheet, SheetModel newSheet)
+        {
+            if (!previousSheet.Head.SequenceEqual(newSheet.Head))
+            {
+                return null;
+            }
+
+            return previousSheet.Diff(newSheet);
+        }
+
+        /// <summary>
+        /// FNV-1a hash of the values with separators of cells and rows.
+        /// </summary>
+        private static ulong ComputeHash(IList<IList<object>> data)
+        {
+            const ulong prime = 1099511628211;
+            const char cellSeparator = '\u001F';
+            const char rowSeparator = '\u001E';
+            ulong hash = 14695981039346656037;
+
+            foreach (IList<object> row in data)
+            {
+                foreach (object value in row)
+                {
+                    string text = value?.ToString() ?? string.Empty;
+
+                    foreach (char c in text)
+                    {
+                        hash = (hash ^ c) * prime;
+                    }
+
+                    hash = (hash ^ cellSeparator) * prime;
+                }
+
+                hash = (hash ^ rowSeparator) * prime;
+            }
+
+            return hash;
+        }
+    }
+}
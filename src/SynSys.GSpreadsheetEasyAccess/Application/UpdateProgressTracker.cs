@@ -0,0 +1,36 @@
+using System;
+using System.Threading;
+
+namespace SynSys.GSpreadsheetEasyAccess.Application
+{
+    /// <summary>
+    /// Counts rows sent during one sheet update and reports the progress.
+    /// </summary>
+    /// <remarks>
+    /// Chunks can be reported from several threads at the same time.
+    /// </remarks>
+    internal class UpdateProgressTracker
+    {
+        private readonly int _totalRowCount;
+        private readonly IProgress<SheetUpdateProgress> _progress;
+        private int _sentRowCount;
+
+        /// <param name="totalRowCount">Number of appended and changed rows to send</param>
+        /// <param name="progress">Can be null</param>
+        internal UpdateProgressTracker(int totalRowCount, IProgress<SheetUpdateProgress> progress)
+        {
+            _totalRowCount = totalRowCount;
+            _progress = progress;
+        }
+
+        /// <summary>
+        /// Used after a chunk of rows has been sent successfully.
+        /// </summary>
+        /// <param name="rowCount">Number of rows in the chunk</param>
+        internal void Report(int rowCount)
+        {
+            int sentRowCount = Interlocked.Add(ref _sentRowCount, rowCount);
+            _progress?.Report(new SheetUpdateProgress(sentRowCount, _totalRowCount));
+        }
+    }
+}
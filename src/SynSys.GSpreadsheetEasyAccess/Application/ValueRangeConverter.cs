@@ -0,0 +1,52 @@
+using Google.Apis.Sheets.v4.Data;
+using SynSys.GSpreadsheetEasyAccess.Data;
+using System.Collections.Generic;
+
+namespace SynSys.GSpreadsheetEasyAccess.Application
+{
+    /// <summary>
+    /// Provides methods for converting SheetModel rows to Google ValueRange.
+    /// </summary>
+    /// <remarks>
+    /// Conversion is kept out of the Data namespace so that the data model does not depend on the Google API client.
+    /// </remarks>
+    internal static class ValueRangeConverter
+    {
+        /// <summary>
+        /// Getting ValueRange for adding the given rows in Google spreadsheet sheet.
+        /// </summary>
+        /// <param name="sheet"></param>
+        /// <param name="rowsToAppend">Rows with ToAppend status in sheet order</param>
+        internal static ValueRange ToAppendValueRange(SheetModel sheet, IList<Row> rowsToAppend)
+        {
+            return new ValueRange
+            {
+                Values = sheet.GetRowsData(rowsToAppend)
+            };
+        }
+
+        /// <summary>
+        /// Getting ValueRange from the given rows.
+        /// </summary>
+        /// <remarks>
+        /// Rows with consecutive numbers are combined into one ValueRange.
+        /// </remarks>
+        /// <param name="sheet"></param>
+        /// <param name="rowsToChange">Rows with ToChange status in sheet order</param>
+        internal static IList<ValueRange> ToChangeValueRanges(SheetModel sheet, IList<Row> rowsToChange)
+        {
+            var valueRanges = new List<ValueRange>();
+
+            foreach (List<Row> group in sheet.GetConsecutiveRowGroups(rowsToChange))
+            {
+                valueRanges.Add(new ValueRange()
+                {
+                    Values = sheet.GetRowsData(group),
+                    Range = A1Notation.GetRowStartCell(sheet.Title, group[0].Number)
+                });
+            }
+
+            return valueRanges;
+        }
+    }
+}
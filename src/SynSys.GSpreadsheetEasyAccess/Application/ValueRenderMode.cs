@@ -0,0 +1,20 @@
+namespace SynSys.GSpreadsheetEasyAccess.Application
+{
+    /// <summary>
+    /// Determines how cell values are rendered when reading a Google spreadsheet sheet.
+    /// </summary>
+    public enum ValueRenderMode
+    {
+        /// <summary>
+        /// Values are read as they are displayed in the sheet,
+        /// according to the cell formatting and the spreadsheet locale.
+        /// </summary>
+        Formatted,
+        /// <summary>
+        /// Values are read without formatting.<br/>
+        /// Numbers use the invariant culture and dates are read as serial numbers,
+        /// so numeric columns can be parsed regardless of the spreadsheet locale.
+        /// </summary>
+        Unformatted
+    }
+}
@@ -20,6 +20,7 @@ namespace SynSys.GSpreadsheetEasyAccess.Data
             set
             {
                 this.value = value;
+                Host?.InvalidateValues();
                 ChangeHostStatus();
             }
         }
@@ -54,6 +55,38 @@ namespace SynSys.GSpreadsheetEasyAccess.Data
             Host = row;
         }
 
+        /// <summary>
+        /// Changing the value without updating the row in which the cell is located.
+        /// </summary>
+        /// <remarks>
+        /// Used by bulk setters that update the row once after all its cells have been changed.
+        /// </remarks>
+        /// <param name="value"></param>
+        /// <returns>true if the value has changed.</returns>
+        internal bool ChangeValue(string value)
+        {
+            if (this.value == value)
+            {
+                return false;
+            }
+
+            this.value = value;
+            return true;
+        }
+
+        /// <summary>
+        /// Replacing the value with an equal instance from the pool.
+        /// </summary>
+        /// <remarks>
+        /// The value doesn't change, so the row status doesn't change either.
+        /// </remarks>
+        /// <param name="pool"></param>
+        /// <param name="columnIndex">Zero-based index of the column of the cell</param>
+        internal void PoolValue(ValuePool pool, int columnIndex)
+        {
+            value = pool.Get(columnIndex, value);
+        }
+
 
         private void ChangeHostStatus()
         {
@@ -0,0 +1,39 @@
+﻿using Newtonsoft.Json;
+
+namespace SynSys.GSpreadsheetEasyAccess.Data
+{
+    /// <summary>
+    /// Represents a change of one cell value in a SheetPatch.
+    /// </summary>
+    public class CellEdit
+    {
+        /// <summary>
+        /// Number of the row in which the cell is located.
+        /// </summary>
+        [JsonProperty("r")]
+        public int RowNumber { get; internal set; }
+
+        /// <summary>
+        /// Zero-based index of the cell in the row.
+        /// </summary>
+        [JsonProperty("c")]
+        public int Column { get; internal set; }
+
+        /// <summary>
+        /// New cell value.
+        /// </summary>
+        [JsonProperty("v")]
+        public string Value { get; internal set; }
+
+
+        [JsonConstructor]
+        internal CellEdit() { }
+
+        internal CellEdit(int rowNumber, int column, string value)
+        {
+            RowNumber = rowNumber;
+            Column = column;
+            Value = value;
+        }
+    }
+}
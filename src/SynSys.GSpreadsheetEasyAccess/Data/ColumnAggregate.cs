@@ -0,0 +1,81 @@
+﻿namespace SynSys.GSpreadsheetEasyAccess.Data
+{
+    /// <summary>
+    /// Represents aggregated values of one numeric column of the sheet.
+    /// </summary>
+    /// <remarks>
+    /// Only cells containing numbers are taken into account.
+    /// </remarks>
+    public class ColumnAggregate
+    {
+        /// <summary>
+        /// Number of numeric cells in the column.
+        /// </summary>
+        public int Count { get; internal set; }
+
+        /// <summary>
+        /// Sum of numeric cells.
+        /// </summary>
+        public double Sum { get; internal set; }
+
+        /// <summary>
+        /// Minimum value. Equal to double.NaN if the column has no numbers.
+        /// </summary>
+        public double Min { get; internal set; } = double.NaN;
+
+        /// <summary>
+        /// Maximum value. Equal to double.NaN if the column has no numbers.
+        /// </summary>
+        public double Max { get; internal set; } = double.NaN;
+
+
+        internal ColumnAggregate() { }
+
+        /// <summary>
+        /// Calculation of aggregates in one pass over the column vector.
+        /// </summary>
+        /// <param name="values">Column vector where non-numeric cells are double.NaN</param>
+        internal static ColumnAggregate Calculate(double[] values)
+        {
+            var aggregate = new ColumnAggregate();
+            int count = 0;
+            double sum = 0;
+            double min = double.PositiveInfinity;
+            double max = double.NegativeInfinity;
+
+            for (int i = 0; i < values.Length; i++)
+            {
+                double value = values[i];
+
+                if (double.IsNaN(value))
+                {
+                    continue;
+                }
+
+                count++;
+                sum += value;
+
+                if (value < min)
+                {
+                    min = value;
+                }
+
+                if (value > max)
+                {
+                    max = value;
+                }
+            }
+
+            aggregate.Count = count;
+            aggregate.Sum = sum;
+
+            if (count > 0)
+            {
+                aggregate.Min = min;
+                aggregate.Max = max;
+            }
+
+            return aggregate;
+        }
+    }
+}
@@ -0,0 +1,308 @@
+﻿using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Text;
+
+namespace SynSys.GSpreadsheetEasyAccess.Data
+{
+    /// <summary>
+    /// Provides methods for reading and writing sheet rows
+    /// as delimiter-separated text such as CSV or TSV.
+    /// </summary>
+    /// <remarks>
+    /// Quoting follows <a href="https://www.rfc-editor.org/rfc/rfc4180">RFC 4180</a>:
+    /// values containing the delimiter, quotes or line breaks are enclosed in double quotes
+    /// and double quotes inside them are doubled.<br/>
+    /// Text is read and written in chunks, so the size of the stream doesn't affect memory consumption.
+    /// </remarks>
+    public class CsvSerialization
+    {
+        /// <summary>
+        /// Delimiter of CSV files.
+        /// </summary>
+        public const char Comma = ',';
+
+        /// <summary>
+        /// Delimiter of TSV files.
+        /// </summary>
+        public const char Tab = '\t';
+
+        private const int BufferSize = 64 * 1024;
+        private const char Quote = '"';
+
+        /// <summary>
+        /// Reads rows from delimiter-separated text one by one.
+        /// </summary>
+        /// <remarks>
+        /// Rows are read lazily while the result is being enumerated,
+        /// so it can be passed directly to the SheetModel.AddRows method.<br/>
+        /// The first row of the text is returned like any other row. Blank lines are skipped.<br/>
+        /// The encoding is detected by the byte order mark, UTF-8 is used by default.
+        /// The stream is not closed.<br/>
+        /// Each enumeration reads from the current position of the stream,
+        /// so the position must be reset to read the text again.
+        /// </remarks>
+        /// <param name="stream"></param>
+        /// <param name="delimiter">Value delimiter, for example CsvSerialization.Comma</param>
+        /// <returns>Values of each row.</returns>
+        /// <exception cref="ArgumentNullException"></exception>
+        /// <exception cref="ArgumentException">The delimiter is a quote or a line break.</exception>
+        /// <exception cref="FormatException">
+        /// A quoted value is not closed before the end of the text. Thrown during enumeration.
+        /// </exception>
+        public static IEnumerable<IList<string>> ReadRows(Stream stream, char delimiter)
+        {
+            if (stream == null)
+            {
+                throw new ArgumentNullException(nameof(stream));
+            }
+
+            CheckDelimiter(delimiter);
+
+            return ParseRows(stream, delimiter);
+        }
+
+        /// <summary>
+        /// Writes the sheet as delimiter-separated text in UTF-8.
+        /// </summary>
+        /// <remarks>
+        /// The head is written first unless the sheet has SheetMode.Simple.<br/>
+        /// Rows with RowStatus.ToDelete are not written.<br/>
+        /// Rows are separated by CRLF. The stream is not closed.
+        /// </remarks>
+        /// <param name="sheet"></param>
+        /// <param name="stream"></param>
+        /// <param name="delimiter">Value delimiter, for example CsvSerialization.Comma</param>
+        /// <exception cref="ArgumentNullException"></exception>
+        /// <exception cref="ArgumentException">The delimiter is a quote or a line break.</exception>
+        public static void WriteSheet(SheetModel sheet, Stream stream, char delimiter)
+        {
+            if (sheet == null)
+            {
+                throw new ArgumentNullException(nameof(sheet));
+            }
+
+            if (stream == null)
+            {
+                throw new ArgumentNullException(nameof(stream));
+            }
+
+            CheckDelimiter(delimiter);
+
+            using (var writer = new StreamWriter(stream, new UTF8Encoding(false), BufferSize, true))
+            {
+                if (sheet.Mode != SheetMode.Simple)
+                {
+                    WriteHead(writer, sheet.Head, delimiter);
+                }
+
+                foreach (Row row in sheet.Rows)
+                {
+                    if (row.Status != RowStatus.ToDelete)
+                    {
+                        WriteRow(writer, row.Cells, delimiter);
+                    }
+                }
+            }
+        }
+
+
+        /// <remarks>
+        /// The reader is created by the iterator, so that each enumeration has its own reader.
+        /// </remarks>
+        private static IEnumerable<IList<string>> ParseRows(Stream stream, char delimiter)
+        {
+            using (var reader = new StreamReader(stream, Encoding.UTF8, true, BufferSize, true))
+            {
+                var buffer = new char[BufferSize];
+                var value = new StringBuilder();
+                var row = new List<string>();
+                bool isRowStarted = false;
+                bool isInQuotes = false;
+                bool isQuoteClosed = false;
+                bool isAfterCarriageReturn = false;
+                int lineNumber = 1;
+                int quoteLineNumber = 0;
+                char previous = '\0';
+                int count;
+
+                while ((count = reader.Read(buffer, 0, buffer.Length)) > 0)
+                {
+                    for (int i = 0; i < count; i++)
+                    {
+                        char c = buffer[i];
+                        bool isLineBreak = c == '\r' || (c == '\n' && previous != '\r');
+                        previous = c;
+
+                        if (isLineBreak)
+                        {
+                            lineNumber++;
+                        }
+
+                        // CRLF is one line break.
+                        if (isAfterCarriageReturn)
+                        {
+                            isAfterCarriageReturn = false;
+
+                            if (c == '\n')
+                            {
+                                continue;
+                            }
+                        }
+
+                        if (isInQuotes)
+                        {
+                            if (c == Quote)
+                            {
+                                isInQuotes = false;
+                                isQuoteClosed = true;
+                            }
+                            else
+                            {
+                                value.Append(c);
+                            }
+
+                            continue;
+                        }
+
+                        // Two quotes in a row inside a quoted value are one quote character.
+                        if (isQuoteClosed && c == Quote)
+                        {
+                            value.Append(Quote);
+                            isInQuotes = true;
+                            isQuoteClosed = false;
+                            continue;
+                        }
+
+                        isQuoteClosed = false;
+
+                        if (c == delimiter)
+                        {
+                            row.Add(value.ToString());
+                            value.Clear();
+                            isRowStarted = true;
+                        }
+                        else if (c == '\r' || c == '\n')
+                        {
+                            isAfterCarriageReturn = c == '\r';
+
+                            // Blank lines don't contain values, so they are not rows.
+                            if (!isRowStarted && value.Length == 0)
+                            {
+                                continue;
+                            }
+
+                            row.Add(value.ToString());
+                            value.Clear();
+
+                            yield return row;
+
+                            row = new List<string>(row.Count);
+                            isRowStarted = false;
+                        }
+                        else if (c == Quote && value.Length == 0)
+                        {
+                            isInQuotes = true;
+                            isRowStarted = true;
+                            quoteLineNumber = lineNumber;
+                        }
+                        else
+                        {
+                            value.Append(c);
+                            isRowStarted = true;
+                        }
+                    }
+                }
+
+                if (isInQuotes)
+                {
+                    throw new FormatException(
+                        $"The quoted value started on line {quoteLineNumber} is not closed before the end of the text."
+                    );
+                }
+
+                // The last row may not end with a line break.
+                if (isRowStarted || value.Length > 0)
+                {
+                    row.Add(value.ToString());
+                    yield return row;
+                }
+            }
+        }
+
+        private static void WriteHead(TextWriter writer, IList<string> head, char delimiter)
+        {
+            for (int i = 0; i < head.Count; i++)
+            {
+                if (i > 0)
+                {
+                    writer.Write(delimiter);
+                }
+
+                WriteValue(writer, head[i], delimiter);
+            }
+
+            WriteLineEnd(writer, head.Count, head.Count > 0 ? head[0] : null);
+        }
+
+        private static void WriteRow(TextWriter writer, IList<Cell> cells, char delimiter)
+        {
+            for (int i = 0; i < cells.Count; i++)
+            {
+                if (i > 0)
+                {
+                    writer.Write(delimiter);
+                }
+
+                WriteValue(writer, cells[i].Value, delimiter);
+            }
+
+            WriteLineEnd(writer, cells.Count, cells.Count > 0 ? cells[0].Value : null);
+        }
+
+        /// <remarks>
+        /// A line of one empty value would be blank and skipped when reading,
+        /// so the value is written as an empty quoted value.
+        /// </remarks>
+        private static void WriteLineEnd(TextWriter writer, int valueCount, string firstValue)
+        {
+            if (valueCount <= 1 && string.IsNullOrEmpty(firstValue))
+            {
+                writer.Write(Quote);
+                writer.Write(Quote);
+            }
+
+            writer.Write("\r\n");
+        }
+
+        private static void WriteValue(TextWriter writer, string value, char delimiter)
+        {
+            if (string.IsNullOrEmpty(value))
+            {
+                return;
+            }
+
+            if (value.IndexOf(delimiter) < 0
+                && value.IndexOf(Quote) < 0
+                && value.IndexOf('\r') < 0
+                && value.IndexOf('\n') < 0)
+            {
+                writer.Write(value);
+                return;
+            }
+
+            writer.Write(Quote);
+            writer.Write(value.Replace("\"", "\"\""));
+            writer.Write(Quote);
+        }
+
+        /// <exception cref="ArgumentException"></exception>
+        private static void CheckDelimiter(char delimiter)
+        {
+            if (delimiter == Quote || delimiter == '\r' || delimiter == '\n')
+            {
+                throw new ArgumentException("Quotes and line breaks can't be used as a delimiter.", nameof(delimiter));
+            }
+        }
+    }
+}
@@ -1,4 +1,5 @@
 ﻿using Newtonsoft.Json;
+using System.Runtime.Serialization;
 
 namespace SynSys.GSpreadsheetEasyAccess.Data
 {
@@ -36,5 +37,61 @@ namespace SynSys.GSpreadsheetEasyAccess.Data
         {
             return JsonConvert.DeserializeObject<SheetModel>(jsonSheet);
         }
+
+        /// <summary>
+        /// Deserializes JSON to an instance SheetModel.
+        /// </summary>
+        /// <remarks>
+        /// Values are pooled as each row is read,
+        /// so duplicate values are released during deserialization rather than after it.
+        /// </remarks>
+        /// <param name="jsonSheet"></param>
+        /// <param name="poolValues">
+        /// Store equal cell values as one string instance,
+        /// see SheetModel.EnableValuePool.
+        /// </param>
+        /// <returns>Deserialized object from string JSON.</returns>
+        public static SheetModel DeserializeSheet(string jsonSheet, bool poolValues)
+        {
+            if (!poolValues)
+            {
+                return DeserializeSheet(jsonSheet);
+            }
+
+            // Rows receive the pool through the context and pool their values in Row.OnDeserialized.
+            var valuePool = new ValuePool();
+            SheetModel sheet = JsonConvert.DeserializeObject<SheetModel>(
+                jsonSheet,
+                new JsonSerializerSettings()
+                {
+                    Context = new StreamingContext(StreamingContextStates.All, valuePool)
+                }
+            );
+
+            sheet.UseValuePool(valuePool);
+
+            return sheet;
+        }
+
+        /// <summary>
+        /// Serializes sheet changes to JSON using the selected formatting.
+        /// </summary>
+        /// <param name="patch"></param>
+        /// <param name="formatting"></param>
+        /// <returns>The string representation of the object in the format JSON.</returns>
+        public static string SerializePatch(SheetPatch patch, Formatting formatting)
+        {
+            return JsonConvert.SerializeObject(patch, formatting);
+        }
+
+        /// <summary>
+        /// Deserializes JSON to an instance SheetPatch.
+        /// </summary>
+        /// <param name="jsonPatch"></param>
+        /// <returns>Deserialized object from string JSON.</returns>
+        public static SheetPatch DeserializePatch(string jsonPatch)
+        {
+            return JsonConvert.DeserializeObject<SheetPatch>(jsonPatch);
+        }
     }
 }
@@ -1,5 +1,7 @@
 ﻿using Newtonsoft.Json;
 using System.Collections.Generic;
+using System.Globalization;
+using System.Runtime.Serialization;
 
 namespace SynSys.GSpreadsheetEasyAccess.Data
 {
@@ -8,17 +10,48 @@ namespace SynSys.GSpreadsheetEasyAccess.Data
     /// </summary>
     public class Row
     {
+        private int number;
+        private RowStatus status = RowStatus.ToAppend;
+        private RowSnapshot snapshot;
+        private double[] numbers;
+
         /// <summary>
         /// Number, not index!
         /// </summary>
         [JsonProperty]
-        public int Number { get; internal set; }
+        public int Number
+        {
+            get => number;
+            internal set
+            {
+                if (number == value)
+                {
+                    return;
+                }
+
+                number = value;
+                InvalidateSnapshot();
+            }
+        }
 
         /// <summary>
         /// Current status.
         /// </summary>
         [JsonProperty]
-        public RowStatus Status { get; internal set; } = RowStatus.ToAppend;
+        public RowStatus Status
+        {
+            get => status;
+            internal set
+            {
+                if (status == value)
+                {
+                    return;
+                }
+
+                status = value;
+                InvalidateSnapshot();
+            }
+        }
 
         /// <summary>
         /// All cells in this row.
@@ -45,8 +78,11 @@ namespace SynSys.GSpreadsheetEasyAccess.Data
         /// <param name="rowData">Data to fill</param>
         /// <param name="maxLength">Assigns the maximum length of a row</param>
         /// <param name="headOfSheet"></param>
-        internal Row(IList<string> rowData, int maxLength, List<string> headOfSheet)
+        /// <param name="valuePool">Pool of cell values. Null if values are not pooled.</param>
+        internal Row(IList<string> rowData, int maxLength, List<string> headOfSheet, ValuePool valuePool = null)
         {
+            Cells.Capacity = maxLength;
+
             for (int cellIndex = 0; cellIndex < maxLength; cellIndex++)
             {
                 var value = string.Empty;
@@ -57,10 +93,134 @@ namespace SynSys.GSpreadsheetEasyAccess.Data
                     value = rowData[cellIndex];
                 }
 
+                if (valuePool != null)
+                {
+                    value = valuePool.Get(cellIndex, value);
+                }
+
                 Cells.Add(new Cell(value, title, this));
             }
         }
 
+        /// <summary>
+        /// Getting an immutable copy of the row.
+        /// </summary>
+        /// <remarks>
+        /// The copy is created again only after the row has changed,
+        /// so unchanged rows are shared between sheet snapshots.
+        /// </remarks>
+        /// <returns></returns>
+        internal RowSnapshot GetSnapshot()
+        {
+            if (snapshot == null)
+            {
+                snapshot = new RowSnapshot(this);
+            }
+
+            return snapshot;
+        }
+
+        /// <summary>
+        /// Used when the number, the status or a cell value of the row changes.
+        /// </summary>
+        internal void InvalidateSnapshot()
+        {
+            snapshot = null;
+        }
+
+        /// <summary>
+        /// Getting cell values as numbers parsed using the invariant culture.
+        /// </summary>
+        /// <remarks>
+        /// Values are parsed once and kept until a cell value of the row changes.<br/>
+        /// Empty and non-numeric cells are represented as double.NaN.
+        /// </remarks>
+        /// <returns>The same array until a cell value changes. It must not be modified.</returns>
+        internal double[] GetNumbers()
+        {
+            if (numbers == null || numbers.Length != Cells.Count)
+            {
+                var parsedNumbers = new double[Cells.Count];
+
+                for (int i = 0; i < Cells.Count; i++)
+                {
+                    parsedNumbers[i] = ParseNumber(Cells[i].Value);
+                }
+
+                numbers = parsedNumbers;
+            }
+
+            return numbers;
+        }
+
+        /// <summary>
+        /// Assigning numbers already known when filling the row,
+        /// so that the GetNumbers method doesn't parse the cell values.
+        /// </summary>
+        /// <param name="numbers">One number for each cell</param>
+        internal void SetNumbers(double[] numbers)
+        {
+            this.numbers = numbers;
+        }
+
+        /// <summary>
+        /// Used when a cell value of the row changes.
+        /// </summary>
+        internal void InvalidateValues()
+        {
+            snapshot = null;
+            numbers = null;
+        }
+
+        /// <param name="value"></param>
+        /// <returns>double.NaN if the value is not a number.</returns>
+        internal static double ParseNumber(string value)
+        {
+            if (string.IsNullOrEmpty(value)
+                || !double.TryParse(value, NumberStyles.Float, CultureInfo.InvariantCulture, out double number))
+            {
+                return double.NaN;
+            }
+
+            return number;
+        }
+
+        /// <summary>
+        /// Used after the values of several cells of the row have been changed
+        /// by the Cell.ChangeValue method.
+        /// </summary>
+        /// <remarks>
+        /// The status changes in the same way as when assigning the Cell.Value property.
+        /// </remarks>
+        internal void MarkCellsChanged()
+        {
+            InvalidateValues();
+
+            if (Status == RowStatus.Original)
+            {
+                Status = RowStatus.ToChange;
+            }
+        }
+
+        /// <summary>
+        /// Pooling the values of the row as soon as it has been deserialized,
+        /// so that duplicate values are not kept until the whole sheet has been read.
+        /// </summary>
+        /// <param name="context">Context with the ValuePool of the sheet, or without a context if values are not pooled.</param>
+        [OnDeserialized]
+        internal void OnDeserialized(StreamingContext context)
+        {
+            if (!(context.Context is ValuePool valuePool))
+            {
+                return;
+            }
+
+            for (int i = 0; i < Cells.Count; i++)
+            {
+                Cells[i].PoolValue(valuePool, i);
+            }
+        }
+
         /// <summary>
         /// Row conversion from List&lt;Cell&gt; to List&lt;object&gt;.
         /// This is necessary to prepare data for sending to Google spreadsheet.
@@ -77,5 +237,26 @@ namespace SynSys.GSpreadsheetEasyAccess.Data
 
             return data;
         }
+
+        /// <summary>
+        /// Row conversion to List&lt;object&gt; placing cell values in the given sheet columns.
+        /// </summary>
+        /// <remarks>
+        /// Columns not included in the row get null values,
+        /// so Google leaves the corresponding cells unchanged.
+        /// </remarks>
+        /// <param name="columnIndexes">Ascending zero-based indexes of sheet columns for each cell</param>
+        /// <returns></returns>
+        internal IList<object> GetData(IList<int> columnIndexes)
+        {
+            var data = new List<object>(new object[columnIndexes[columnIndexes.Count - 1] + 1]);
+
+            for (int cellIndex = 0; cellIndex < Cells.Count; cellIndex++)
+            {
+                data[columnIndexes[cellIndex]] = Cells[cellIndex].Value;
+            }
+
+            return data;
+        }
     }
 }
\ No newline at end of file
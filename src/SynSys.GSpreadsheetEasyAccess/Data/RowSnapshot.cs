@@ -0,0 +1,60 @@
+﻿using System;
+using System.Collections.Generic;
+
+namespace SynSys.GSpreadsheetEasyAccess.Data
+{
+    /// <summary>
+    /// Represents an immutable copy of one row of the sheet.
+    /// </summary>
+    /// <remarks>
+    /// The copy is shared between sheet snapshots while the row doesn't change.
+    /// </remarks>
+    public class RowSnapshot
+    {
+        /// <summary>
+        /// Number, not index!
+        /// </summary>
+        public int Number { get; }
+
+        /// <summary>
+        /// Row status at the time of the snapshot.
+        /// </summary>
+        public RowStatus Status { get; }
+
+        /// <summary>
+        /// Cell values in column order.
+        /// </summary>
+        public IReadOnlyList<string> Values { get; }
+
+        /// <summary>
+        /// Key cell value. Null if the sheet has no key.
+        /// </summary>
+        public string Key { get; }
+
+        /// <summary>
+        /// Cell value by zero-based column index.
+        /// </summary>
+        /// <param name="columnIndex"></param>
+        public string this[int columnIndex] { get => Values[columnIndex]; }
+
+
+        /// <summary>
+        /// Copying values of the row.
+        /// </summary>
+        /// <param name="row"></param>
+        internal RowSnapshot(Row row)
+        {
+            var values = new string[row.Cells.Count];
+
+            for (int i = 0; i < values.Length; i++)
+            {
+                values[i] = row.Cells[i].Value;
+            }
+
+            Number = row.Number;
+            Status = row.Status;
+            Values = Array.AsReadOnly(values);
+            Key = row.Key?.Value;
+        }
+    }
+}
@@ -1,10 +1,11 @@
-﻿using Google.Apis.Sheets.v4.Data;
-using Newtonsoft.Json;
+﻿using Newtonsoft.Json;
 using SynSys.GSpreadsheetEasyAccess.Data.Exceptions;
 using System;
 using System.Collections.Generic;
+using System.Globalization;
 using System.Linq;
 using System.Runtime.CompilerServices;
+using System.Threading;
 
 [assembly:InternalsVisibleTo("SynSys.GSpreadsheetEasyAccess.Tests")]
 namespace SynSys.GSpreadsheetEasyAccess.Data
@@ -14,6 +15,20 @@ namespace SynSys.GSpreadsheetEasyAccess.Data
     /// </summary>
     public class SheetModel
     {
+        private SheetSnapshot latestSnapshot;
+        private long snapshotVersion;
+        private ValuePool valuePool;
+
+        /// <summary>
+        /// Cost of one range or request in cells when planning row reuse.
+        /// </summary>
+        private const int RangeCost = 100;
+
+        /// <summary>
+        /// The largest integer from which all smaller integers are exactly represented as double.
+        /// </summary>
+        private const double MaxExactInteger = 9007199254740992;
+
         /// <summary>
         /// Sheet Name.
         /// </summary>
@@ -66,6 +81,39 @@ namespace SynSys.GSpreadsheetEasyAccess.Data
         [JsonProperty]
         public List<Row> Rows { get; } = new List<Row>();
 
+        /// <summary>
+        /// Zero-based indexes of the Google spreadsheet sheet columns
+        /// that correspond to the Head, in ascending order.
+        /// </summary>
+        /// <remarks>
+        /// The list is empty if the sheet was received with all columns.<br/>
+        /// Otherwise, the sheet contains only some of the columns
+        /// and changes are written back to these columns only.
+        /// </remarks>
+        [JsonProperty]
+        public List<int> ColumnIndexes { get; internal set; } = new List<int>();
+
+        /// <summary>
+        /// Number of the first Google spreadsheet sheet row included in this sheet.
+        /// </summary>
+        /// <remarks>
+        /// Equal to 0 if the sheet was received with all rows.<br/>
+        /// Otherwise, the sheet contains only a window of rows and
+        /// all row numbers remain absolute for the Google spreadsheet sheet.
+        /// </remarks>
+        [JsonProperty]
+        public int FirstRowNumber { get; internal set; }
+
+        /// <summary>
+        /// Number of the last Google spreadsheet sheet row included in the window of rows.
+        /// </summary>
+        /// <remarks>
+        /// Equal to 0 if the sheet contains all rows up to the end of the Google spreadsheet sheet.<br/>
+        /// Otherwise, there may be rows after the window, so rows can't be appended to the sheet.
+        /// </remarks>
+        [JsonProperty]
+        public int LastRowNumber { get; internal set; }
+
         /// <summary>
         /// Indicates that there are no rows in the sheet.
         /// </summary>
@@ -76,6 +124,39 @@ namespace SynSys.GSpreadsheetEasyAccess.Data
         [JsonIgnore]
         public bool IsEmpty { get => Rows.Count == 0; }
 
+        /// <summary>
+        /// Indicates that equal cell values of the sheet are stored as one string instance.
+        /// </summary>
+        /// <remarks>
+        /// Pooling is not saved to JSON, so it has to be enabled again after deserialization.
+        /// </remarks>
+        [JsonIgnore]
+        public bool IsValuePoolEnabled
+        {
+            get => valuePool != null;
+            internal set
+            {
+                if (value)
+                {
+                    EnableValuePool();
+                }
+                else
+                {
+                    valuePool = null;
+                }
+            }
+        }
+
+        /// <summary>
+        /// The last snapshot published by the PublishSnapshot method.
+        /// </summary>
+        /// <remarks>
+        /// The property can be read from any thread without locks.<br/>
+        /// Null if no snapshot has been published yet.
+        /// </remarks>
+        [JsonIgnore]
+        public SheetSnapshot LatestSnapshot { get => Volatile.Read(ref latestSnapshot); }
+
         /// <summary>
         /// Adds an empty row to the end of the sheet.
         /// The row size will be equal to the maximum for this sheet
@@ -94,11 +175,83 @@ namespace SynSys.GSpreadsheetEasyAccess.Data
         /// If there is less data, then the remaining cells will be filled with empty values.
         /// </remarks>
         /// <param name="data">Data to compose a row.</param>
+        /// <exception cref="InvalidOperationException">The sheet is a window of rows that doesn't reach the end of the sheet.</exception>
         public void AddRow(IList<string> data)
         {
+            CheckCanAppendRows();
             AddRow(FindNextRowNumber(), Head.Count, data);
         }
 
+        /// <summary>
+        /// Adds rows to the end of the sheet.
+        /// </summary>
+        /// <remarks>
+        /// Each row is composed in the same way as by the AddRow method,
+        /// but the next row number and the key column are found once for all rows.
+        /// </remarks>
+        /// <param name="rowsData">Data to compose rows.</param>
+        /// <exception cref="ArgumentNullException"></exception>
+        /// <exception cref="InvalidOperationException">The sheet is a window of rows that doesn't reach the end of the sheet.</exception>
+        public void AddRows(IEnumerable<IList<string>> rowsData)
+        {
+            if (rowsData == null)
+            {
+                throw new ArgumentNullException(nameof(rowsData));
+            }
+
+            CheckCanAppendRows();
+
+            if (rowsData is ICollection<IList<string>> collection)
+            {
+                Rows.Capacity = Math.Max(Rows.Capacity, Rows.Count + collection.Count);
+            }
+
+            int number = FindNextRowNumber();
+            int keyIndex = FindKeyIndex();
+
+            foreach (IList<string> data in rowsData)
+            {
+                Rows.Add(CreateRow(number, Head.Count, data, RowStatus.ToAppend, keyIndex));
+                number++;
+            }
+        }
+
+        /// <summary>
+        /// Adds rows to the end of the sheet from a block of values.
+        /// </summary>
+        /// <remarks>
+        /// The first dimension of the array corresponds to rows, the second to columns.<br/>
+        /// Each row is composed in the same way as by the AddRow method.
+        /// </remarks>
+        /// <param name="values">Block of values</param>
+        /// <exception cref="ArgumentNullException"></exception>
+        /// <exception cref="InvalidOperationException">The sheet is a window of rows that doesn't reach the end of the sheet.</exception>
+        public void AddRows(string[,] values)
+        {
+            if (values == null)
+            {
+                throw new ArgumentNullException(nameof(values));
+            }
+
+            int rowCount = values.GetLength(0);
+            int columnCount = values.GetLength(1);
+            var rowsData = new List<IList<string>>(rowCount);
+
+            for (int i = 0; i < rowCount; i++)
+            {
+                var data = new string[columnCount];
+
+                for (int j = 0; j < columnCount; j++)
+                {
+                    data[j] = values[i, j];
+                }
+
+                rowsData.Add(data);
+            }
+
+            AddRows(rowsData);
+        }
+
         /// <summary>
         /// The method deletes the row only if it had a RowStatus.ToAppend status.<br/>
         /// Otherwise, the method does not delete the row, but assigns the RowStatus.ToDelete status.<br/>
@@ -199,37 +352,586 @@ namespace SynSys.GSpreadsheetEasyAccess.Data
                 throw new ArgumentNullException();
             }
 
-            if (IsNotSameSheet(otherSheet, out string failReason))
+            if (IsNotSameSheet(otherSheet, out string failReason))
+            {
+                throw new ArgumentException($"Sheets are not same. Reason: {failReason}");
+            }
+
+            int maximumRows = Math.Max(Rows.Count, otherSheet.Rows.Count);
+            var rowsWithToAppendStatus = new List<Row>();
+
+            for (int i = 0; i < maximumRows; i++)
+            {
+                Row currentRow = GetRowByIndex(i, Rows);
+                Row otherRow = GetRowByIndex(i, otherSheet.Rows);
+
+                if (MatchingRowNotFoundInOtherSheet(currentRow, otherRow))
+                {
+                    PrepareRowForDeletion(currentRow, rowsWithToAppendStatus);
+                    continue;
+                }
+
+                if (MatchingRowNotFoundInCurrentSheet(currentRow, otherRow))
+                {
+                    AddRow(otherRow.GetData().Cast<string>().ToList());
+                    continue;
+                }
+
+                MergeRows(currentRow, otherRow);
+            }
+
+            // These rows should be deleted because they cannot be given RowStatus.ToDelete status.
+            // they cannot be given this status because they were not already in the Google spreadsheet sheet.
+            DeleteRows(rowsWithToAppendStatus);
+        }
+
+        /// <summary>
+        /// Store equal cell values of the sheet as one string instance.
+        /// </summary>
+        /// <remarks>
+        /// Reduces memory for sheets with columns that contain few distinct values,
+        /// such as statuses, categories or TRUE/FALSE.<br/>
+        /// Each column is pooled separately. A column with many distinct values, such as ids or timestamps,
+        /// stops being pooled, so its values are not retained by the pool.<br/>
+        /// Values of existing cells are pooled immediately,
+        /// values of rows added later are pooled when the rows are added.<br/>
+        /// Values assigned to the Cell.Value property are not pooled.<br/>
+        /// Row statuses don't change.
+        /// </remarks>
+        public void EnableValuePool()
+        {
+            if (valuePool != null)
+            {
+                return;
+            }
+
+            valuePool = new ValuePool();
+
+            foreach (Row row in Rows)
+            {
+                for (int i = 0; i < row.Cells.Count; i++)
+                {
+                    row.Cells[i].PoolValue(valuePool, i);
+                }
+            }
+        }
+
+        /// <summary>
+        /// Using the pool that already contains the values of the cells of the sheet.
+        /// </summary>
+        /// <param name="pool">Pool by which the rows were pooled during deserialization</param>
+        internal void UseValuePool(ValuePool pool)
+        {
+            valuePool = pool;
+        }
+
+        /// <summary>
+        /// Create an immutable copy of the current state of the sheet.
+        /// </summary>
+        /// <remarks>
+        /// Only rows changed since the previous snapshot are copied,
+        /// the rest are shared with it.<br/>
+        /// The method must be called from the thread which changes the sheet.
+        /// </remarks>
+        /// <returns></returns>
+        public SheetSnapshot TakeSnapshot()
+        {
+            snapshotVersion++;
+            return new SheetSnapshot(this, latestSnapshot, snapshotVersion);
+        }
+
+        /// <summary>
+        /// Create a snapshot of the current state of the sheet and make it available
+        /// to other threads through the LatestSnapshot property.
+        /// </summary>
+        /// <remarks>
+        /// The method must be called from the thread which changes the sheet.<br/>
+        /// Readers that have already received the previous snapshot continue to use it.
+        /// </remarks>
+        /// <returns>Published snapshot.</returns>
+        public SheetSnapshot PublishSnapshot()
+        {
+            SheetSnapshot snapshot = TakeSnapshot();
+            Volatile.Write(ref latestSnapshot, snapshot);
+
+            return snapshot;
+        }
+
+        /// <summary>
+        /// Get changes that turn this sheet into another version of the same sheet.
+        /// </summary>
+        /// <remarks>
+        /// Rows are matched by number.<br/>
+        /// Rows of this sheet that are missing or have RowStatus.ToDelete in the other sheet are deleted.<br/>
+        /// Rows of the other sheet that are missing in this sheet are appended.<br/>
+        /// Rows with RowStatus.ToAppend are matched only with rows with the same status,
+        /// so rows that are already pending for appending in this sheet are not appended again.<br/>
+        /// For the remaining rows only changed cells are included in the patch.
+        /// </remarks>
+        /// <param name="otherSheet">Same SheetModel</param>
+        /// <returns>Changes to apply to this sheet by the ApplyPatch method.</returns>
+        /// <exception cref="ArgumentNullException"/>
+        /// <exception cref="ArgumentException"/>
+        public SheetPatch Diff(SheetModel otherSheet)
+        {
+            if (otherSheet == null)
+            {
+                throw new ArgumentNullException(nameof(otherSheet));
+            }
+
+            if (IsNotSameSheet(otherSheet, out string failReason))
+            {
+                throw new ArgumentException($"Sheets are not same. Reason: {failReason}");
+            }
+
+            var patch = new SheetPatch();
+            var otherRows = new Dictionary<int, Row>();
+            var otherAppendedRows = new Dictionary<int, Row>();
+
+            foreach (Row otherRow in otherSheet.Rows)
+            {
+                if (otherRow.Status == RowStatus.ToAppend)
+                {
+                    otherAppendedRows[otherRow.Number] = otherRow;
+                }
+                else
+                {
+                    otherRows[otherRow.Number] = otherRow;
+                }
+            }
+
+            foreach (Row row in Rows)
+            {
+                if (row.Status == RowStatus.ToDelete)
+                {
+                    continue;
+                }
+
+                Dictionary<int, Row> matchingRows = row.Status == RowStatus.ToAppend ? otherAppendedRows : otherRows;
+
+                if (!matchingRows.TryGetValue(row.Number, out Row otherRow) || otherRow.Status == RowStatus.ToDelete)
+                {
+                    patch.DeletedRowNumbers.Add(row.Number);
+                    matchingRows.Remove(row.Number);
+                    continue;
+                }
+
+                matchingRows.Remove(row.Number);
+
+                for (int column = 0; column < row.Cells.Count; column++)
+                {
+                    if (row.Cells[column].Value != otherRow.Cells[column].Value)
+                    {
+                        patch.CellEdits.Add(new CellEdit(row.Number, column, otherRow.Cells[column].Value));
+                    }
+                }
+            }
+
+            foreach (Row otherRow in otherRows.Values.Concat(otherAppendedRows.Values).OrderBy(row => row.Number))
+            {
+                if (otherRow.Status != RowStatus.ToDelete)
+                {
+                    patch.AppendedRows.Add(otherRow.Cells.Select(cell => cell.Value).ToList());
+                }
+            }
+
+            return patch;
+        }
+
+        /// <summary>
+        /// Apply changes received by the Diff method.
+        /// </summary>
+        /// <remarks>
+        /// Cells are changed as if their values were assigned,
+        /// rows are deleted by the DeleteRow method and appended by the AddRow method,
+        /// so rows get the same statuses as with manual changes.
+        /// </remarks>
+        /// <param name="patch">Changes of this sheet</param>
+        /// <exception cref="ArgumentNullException"/>
+        /// <exception cref="ArgumentException">The patch refers to a row that is not in the sheet.</exception>
+        /// <exception cref="ArgumentOutOfRangeException">The patch refers to a cell that is not in the row.</exception>
+        /// <exception cref="InvalidOperationException">The patch appends rows to a window of rows that doesn't reach the end of the sheet.</exception>
+        public void ApplyPatch(SheetPatch patch)
+        {
+            if (patch == null)
+            {
+                throw new ArgumentNullException(nameof(patch));
+            }
+
+            var rows = new Dictionary<int, Row>();
+
+            foreach (Row row in Rows)
+            {
+                rows[row.Number] = row;
+            }
+
+            foreach (CellEdit edit in patch.CellEdits)
+            {
+                Row row = FindPatchedRow(rows, edit.RowNumber);
+
+                if (edit.Column < 0 || edit.Column >= row.Cells.Count)
+                {
+                    throw new ArgumentOutOfRangeException(nameof(patch), $"Row {edit.RowNumber} has no cell {edit.Column}.");
+                }
+
+                Cell cell = row.Cells[edit.Column];
+
+                if (cell.Value != edit.Value)
+                {
+                    cell.Value = edit.Value;
+                }
+            }
+
+            foreach (int rowNumber in patch.DeletedRowNumbers)
+            {
+                DeleteRow(FindPatchedRow(rows, rowNumber));
+            }
+
+            foreach (List<string> rowData in patch.AppendedRows)
+            {
+                AddRow(rowData);
+            }
+        }
+
+        /// <summary>
+        /// Get all cell values of the sheet as one block.
+        /// </summary>
+        /// <remarks>
+        /// The first dimension of the array corresponds to rows, the second to columns of the head.<br/>
+        /// Rows are included regardless of their status.<br/>
+        /// Useful for scripts, since the whole sheet is received in one call
+        /// instead of a call for each cell.
+        /// </remarks>
+        /// <returns>Array of Rows.Count rows and Head.Count columns.</returns>
+        public string[,] ToArray()
+        {
+            var values = new string[Rows.Count, Head.Count];
+
+            for (int i = 0; i < Rows.Count; i++)
+            {
+                List<Cell> cells = Rows[i].Cells;
+                int columnCount = Math.Min(cells.Count, Head.Count);
+
+                for (int j = 0; j < columnCount; j++)
+                {
+                    values[i, j] = cells[j].Value;
+                }
+            }
+
+            return values;
+        }
+
+        /// <summary>
+        /// Get column values.
+        /// </summary>
+        /// <param name="title">Column title</param>
+        /// <returns>One value for each row of the sheet.</returns>
+        /// <exception cref="InvalidSheetHeadException"></exception>
+        public string[] GetColumn(string title)
+        {
+            return GetColumn(FindColumnIndex(title));
+        }
+
+        /// <summary>
+        /// Get column values.
+        /// </summary>
+        /// <param name="columnIndex">Zero-based column index</param>
+        /// <returns>One value for each row of the sheet.</returns>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        public string[] GetColumn(int columnIndex)
+        {
+            CheckColumnIndex(columnIndex);
+
+            var values = new string[Rows.Count];
+
+            for (int i = 0; i < Rows.Count; i++)
+            {
+                values[i] = Rows[i].Cells[columnIndex].Value;
+            }
+
+            return values;
+        }
+
+        /// <summary>
+        /// Get column values as a vector of numbers.
+        /// </summary>
+        /// <remarks>
+        /// Values are parsed using the invariant culture,
+        /// so the sheet should be received with ValueRenderMode.Unformatted.<br/>
+        /// Empty and non-numeric cells are represented as double.NaN.<br/>
+        /// Numbers received with ValueRenderMode.Unformatted are kept when the sheet is filled,
+        /// other values are parsed once and kept until a cell of the row changes.
+        /// </remarks>
+        /// <param name="title">Column title</param>
+        /// <returns>One value for each row of the sheet.</returns>
+        /// <exception cref="InvalidSheetHeadException"></exception>
+        public double[] GetDoubleColumn(string title)
+        {
+            return GetDoubleColumn(FindColumnIndex(title));
+        }
+
+        /// <summary>
+        /// Get column values as a vector of numbers.
+        /// </summary>
+        /// <remarks>
+        /// Values are parsed using the invariant culture,
+        /// so the sheet should be received with ValueRenderMode.Unformatted.<br/>
+        /// Empty and non-numeric cells are represented as double.NaN.<br/>
+        /// Numbers received with ValueRenderMode.Unformatted are kept when the sheet is filled,
+        /// other values are parsed once and kept until a cell of the row changes.
+        /// </remarks>
+        /// <param name="columnIndex">Zero-based column index</param>
+        /// <returns>One value for each row of the sheet.</returns>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        public double[] GetDoubleColumn(int columnIndex)
+        {
+            CheckColumnIndex(columnIndex);
+
+            var values = new double[Rows.Count];
+
+            for (int i = 0; i < Rows.Count; i++)
+            {
+                values[i] = Rows[i].GetNumbers()[columnIndex];
+            }
+
+            return values;
+        }
+
+        /// <summary>
+        /// Get column values as a vector of integers.
+        /// </summary>
+        /// <remarks>
+        /// Empty cells are represented as 0.
+        /// </remarks>
+        /// <param name="title">Column title</param>
+        /// <returns>One value for each row of the sheet.</returns>
+        /// <exception cref="InvalidSheetHeadException"></exception>
+        /// <exception cref="FormatException">The column contains a value that is not an integer.</exception>
+        public long[] GetLongColumn(string title)
+        {
+            return GetLongColumn(FindColumnIndex(title));
+        }
+
+        /// <summary>
+        /// Get column values as a vector of integers.
+        /// </summary>
+        /// <remarks>
+        /// Empty cells are represented as 0.
+        /// </remarks>
+        /// <param name="columnIndex">Zero-based column index</param>
+        /// <returns>One value for each row of the sheet.</returns>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        /// <exception cref="FormatException">The column contains a value that is not an integer.</exception>
+        public long[] GetLongColumn(int columnIndex)
+        {
+            CheckColumnIndex(columnIndex);
+
+            var values = new long[Rows.Count];
+
+            for (int i = 0; i < Rows.Count; i++)
+            {
+                double number = Rows[i].GetNumbers()[columnIndex];
+
+                // Integers up to 2^53 are exact in double, larger ones are parsed from the text.
+                if (Math.Abs(number) <= MaxExactInteger && Math.Floor(number) == number)
+                {
+                    values[i] = (long)number;
+                    continue;
+                }
+
+                string value = Rows[i].Cells[columnIndex].Value;
+
+                if (string.IsNullOrEmpty(value))
+                {
+                    continue;
+                }
+
+                if (!long.TryParse(value, NumberStyles.Integer, CultureInfo.InvariantCulture, out values[i]))
+                {
+                    throw new FormatException(
+                        $"Value \"{value}\" in row {Rows[i].Number} " +
+                        $"column {columnIndex + 1} is not an integer."
+                    );
+                }
+            }
+
+            return values;
+        }
+
+        /// <summary>
+        /// Calculate count, sum, minimum and maximum of the numeric column.
+        /// </summary>
+        /// <param name="title">Column title</param>
+        /// <exception cref="InvalidSheetHeadException"></exception>
+        public ColumnAggregate AggregateColumn(string title)
+        {
+            return ColumnAggregate.Calculate(GetDoubleColumn(title));
+        }
+
+        /// <summary>
+        /// Calculate count, sum, minimum and maximum of the numeric column.
+        /// </summary>
+        /// <param name="columnIndex">Zero-based column index</param>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        public ColumnAggregate AggregateColumn(int columnIndex)
+        {
+            return ColumnAggregate.Calculate(GetDoubleColumn(columnIndex));
+        }
+
+        /// <summary>
+        /// Assign values to a rectangular block of cells.
+        /// </summary>
+        /// <remarks>
+        /// The first dimension of the array corresponds to rows, the second to columns.<br/>
+        /// Row statuses change in the same way as when assigning the Cell.Value property,
+        /// but only for rows in which at least one value has actually changed.
+        /// </remarks>
+        /// <param name="firstRowNumber">Number of the row of the upper left cell of the block</param>
+        /// <param name="firstColumn">Zero-based index of the column of the upper left cell of the block</param>
+        /// <param name="values">Block of values</param>
+        /// <exception cref="ArgumentNullException"></exception>
+        /// <exception cref="ArgumentOutOfRangeException">The block doesn't fit into the sheet.</exception>
+        public void SetValues(int firstRowNumber, int firstColumn, string[,] values)
+        {
+            if (values == null)
+            {
+                throw new ArgumentNullException(nameof(values));
+            }
+
+            int rowCount = values.GetLength(0);
+            int columnCount = values.GetLength(1);
+            int firstRowIndex = firstRowNumber - FindFirstRowNumber();
+
+            if (firstRowIndex < 0 || firstRowIndex + rowCount > Rows.Count)
+            {
+                throw new ArgumentOutOfRangeException(nameof(firstRowNumber));
+            }
+
+            if (firstColumn < 0 || firstColumn + columnCount > Head.Count)
+            {
+                throw new ArgumentOutOfRangeException(nameof(firstColumn));
+            }
+
+            for (int i = 0; i < rowCount; i++)
+            {
+                Row row = Rows[firstRowIndex + i];
+                bool isChanged = false;
+
+                for (int j = 0; j < columnCount; j++)
+                {
+                    isChanged |= row.Cells[firstColumn + j].ChangeValue(PoolValue(firstColumn + j, values[i, j]));
+                }
+
+                if (isChanged)
+                {
+                    row.MarkCellsChanged();
+                }
+            }
+        }
+
+        /// <summary>
+        /// Assign values to the column.
+        /// </summary>
+        /// <remarks>
+        /// Values are assigned one for each row starting from the first row of the sheet.<br/>
+        /// Row statuses change in the same way as when assigning the Cell.Value property,
+        /// but only for rows in which the value has actually changed.
+        /// </remarks>
+        /// <param name="title">Column title</param>
+        /// <param name="values">No more values than rows in the sheet</param>
+        /// <exception cref="InvalidSheetHeadException"></exception>
+        /// <exception cref="ArgumentNullException"></exception>
+        /// <exception cref="ArgumentException">There are more values than rows.</exception>
+        public void SetColumn(string title, IList<string> values)
+        {
+            SetColumn(FindColumnIndex(title), values);
+        }
+
+        /// <summary>
+        /// Assign values to the column.
+        /// </summary>
+        /// <remarks>
+        /// Values are assigned one for each row starting from the first row of the sheet.<br/>
+        /// Row statuses change in the same way as when assigning the Cell.Value property,
+        /// but only for rows in which the value has actually changed.
+        /// </remarks>
+        /// <param name="columnIndex">Zero-based column index</param>
+        /// <param name="values">No more values than rows in the sheet</param>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        /// <exception cref="ArgumentNullException"></exception>
+        /// <exception cref="ArgumentException">There are more values than rows.</exception>
+        public void SetColumn(int columnIndex, IList<string> values)
+        {
+            CheckColumnIndex(columnIndex);
+
+            if (values == null)
+            {
+                throw new ArgumentNullException(nameof(values));
+            }
+
+            if (values.Count > Rows.Count)
+            {
+                throw new ArgumentException(
+                    $"{values.Count} values can't be assigned to a column of {Rows.Count} rows.",
+                    nameof(values)
+                );
+            }
+
+            for (int i = 0; i < values.Count; i++)
+            {
+                if (Rows[i].Cells[columnIndex].ChangeValue(PoolValue(columnIndex, values[i])))
+                {
+                    Rows[i].MarkCellsChanged();
+                }
+            }
+        }
+
+        /// <summary>
+        /// Assign numbers to the column.
+        /// </summary>
+        /// <remarks>
+        /// Numbers are written using the invariant culture, double.NaN is written as an empty cell,
+        /// so the values are read back by the GetDoubleColumn method.<br/>
+        /// Values are assigned in the same way as by the SetColumn method.
+        /// </remarks>
+        /// <param name="title">Column title</param>
+        /// <param name="values">No more values than rows in the sheet</param>
+        /// <exception cref="InvalidSheetHeadException"></exception>
+        /// <exception cref="ArgumentNullException"></exception>
+        /// <exception cref="ArgumentException">There are more values than rows.</exception>
+        public void SetDoubleColumn(string title, double[] values)
+        {
+            SetDoubleColumn(FindColumnIndex(title), values);
+        }
+
+        /// <summary>
+        /// Assign numbers to the column.
+        /// </summary>
+        /// <remarks>
+        /// Numbers are written using the invariant culture, double.NaN is written as an empty cell,
+        /// so the values are read back by the GetDoubleColumn method.<br/>
+        /// Values are assigned in the same way as by the SetColumn method.
+        /// </remarks>
+        /// <param name="columnIndex">Zero-based column index</param>
+        /// <param name="values">No more values than rows in the sheet</param>
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        /// <exception cref="ArgumentNullException"></exception>
+        /// <exception cref="ArgumentException">There are more values than rows.</exception>
+        public void SetDoubleColumn(int columnIndex, double[] values)
+        {
+            if (values == null)
             {
-                throw new ArgumentException($"Sheets are not same. Reason: {failReason}");
+                throw new ArgumentNullException(nameof(values));
             }
 
-            int maximumRows = Math.Max(Rows.Count, otherSheet.Rows.Count);
-            var rowsWithToAppendStatus = new List<Row>();
+            var textValues = new string[values.Length];
 
-            for (int i = 0; i < maximumRows; i++)
+            for (int i = 0; i < values.Length; i++)
             {
-                Row currentRow = GetRowByIndex(i, Rows);
-                Row otherRow = GetRowByIndex(i, otherSheet.Rows);
-
-                if (MatchingRowNotFoundInOtherSheet(currentRow, otherRow))
-                {
-                    PrepareRowForDeletion(currentRow, rowsWithToAppendStatus);
-                    continue;
-                }
-
-                if (MatchingRowNotFoundInCurrentSheet(currentRow, otherRow))
-                {
-                    AddRow(otherRow.GetData().Cast<string>().ToList());
-                    continue;
-                }
-
-                MergeRows(currentRow, otherRow);
+                textValues[i] = double.IsNaN(values[i]) ? string.Empty : ConvertToCellValue(values[i]);
             }
 
-            // These rows should be deleted because they cannot be given RowStatus.ToDelete status.
-            // they cannot be given this status because they were not already in the Google spreadsheet sheet.
-            DeleteRows(rowsWithToAppendStatus);
+            SetColumn(columnIndex, textValues);
         }
 
 
@@ -242,6 +944,9 @@ namespace SynSys.GSpreadsheetEasyAccess.Data
         /// <summary>
         /// Filling the sheet with the creation of rows and cells.
         /// </summary>
+        /// <remarks>
+        /// Unformatted numbers and booleans are converted to strings using the invariant culture.
+        /// </remarks>
         /// <param name="data">Data for sheet formation.</param>
         internal void Fill(IList<IList<object>> data)
         {
@@ -258,65 +963,273 @@ namespace SynSys.GSpreadsheetEasyAccess.Data
                     }
                     else
                     {
-                        Head = data[0].Cast<string>().ToList();
+                        Head = data[0].Select(ConvertToCellValue).ToList();
                         continue;
                     }
                 }
 
-                var rowData = data[rowIndex].Cast<string>().ToList();
+                var rowData = data[rowIndex].Select(ConvertToCellValue).ToList();
                 AddRow(rowIndex + 1, maxRowLength, rowData, RowStatus.Original);
+                KeepNumbers(Rows.Last(), data[rowIndex]);
+            }
+        }
+
+        /// <summary>
+        /// Filling the sheet with a window of rows.
+        /// </summary>
+        /// <remarks>
+        /// Row numbers start from the given number,
+        /// so they match the row numbers of the Google spreadsheet sheet.
+        /// </remarks>
+        /// <param name="headData">First row of the sheet. Ignored for SheetMode.Simple.</param>
+        /// <param name="rowsData">Data of rows starting from the firstRowNumber.</param>
+        /// <param name="firstRowNumber">Number of the first row of the window.</param>
+        /// <param name="lastRowNumber">Number of the last row of the window. 0 if the window reaches the end of the sheet.</param>
+        internal void Fill(IList<object> headData, IList<IList<object>> rowsData, int firstRowNumber, int lastRowNumber = 0)
+        {
+            int maxRowLength;
+
+            if (Mode == SheetMode.Simple)
+            {
+                maxRowLength = rowsData.Count > 0 ? rowsData.Max(row => row.Count) : 0;
+                CreateEmptyHead(maxRowLength);
+            }
+            else
+            {
+                Head = headData.Select(ConvertToCellValue).ToList();
+                maxRowLength = Head.Count;
+            }
+
+            FirstRowNumber = firstRowNumber;
+            LastRowNumber = lastRowNumber;
+
+            for (int rowIndex = 0; rowIndex < rowsData.Count; rowIndex++)
+            {
+                var rowData = rowsData[rowIndex].Select(ConvertToCellValue).ToList();
+                AddRow(firstRowNumber + rowIndex, maxRowLength, rowData, RowStatus.Original);
+                KeepNumbers(Rows.Last(), rowsData[rowIndex]);
             }
         }
 
         /// <summary>
-        /// Getting ValueRange for adding rows in Google spreadsheet sheet.
+        /// Converting data to a row for sending to Google spreadsheet
+        /// without creating Row and Cell instances.
         /// </summary>
+        /// <remarks>
+        /// The row size and the placement of values in columns are the same
+        /// as for rows added by the AddRow method.
+        /// </remarks>
+        /// <param name="data">Data to compose a row.</param>
         /// <returns></returns>
-        internal ValueRange GetAppendValueRange()
+        internal IList<object> CreateRowData(IList<string> data)
         {
-            return new ValueRange
+            int length = Head.Count > 0 ? Head.Count : data.Count;
+
+            if (ColumnIndexes.Count == 0)
             {
-                Values = GetAppendRows()
-            };
+                var rowData = new List<object>(length);
+
+                for (int i = 0; i < length; i++)
+                {
+                    rowData.Add(i < data.Count ? data[i] : string.Empty);
+                }
+
+                return rowData;
+            }
+
+            var sparseRowData = new List<object>(new object[ColumnIndexes[ColumnIndexes.Count - 1] + 1]);
+
+            for (int i = 0; i < length; i++)
+            {
+                sparseRowData[ColumnIndexes[i]] = i < data.Count ? data[i] : string.Empty;
+            }
+
+            return sparseRowData;
+        }
+
+        /// <summary>
+        /// Getting data of rows with ToAppend status for adding them in Google spreadsheet sheet.
+        /// </summary>
+        /// <returns></returns>
+        internal IList<IList<object>> GetAppendRowsData()
+        {
+            return GetRowsData(Rows.FindAll(row => row.Status == RowStatus.ToAppend));
+        }
+
+        /// <summary>
+        /// Getting data of the given rows in the form sent to Google spreadsheet sheet.
+        /// </summary>
+        /// <remarks>
+        /// If only some columns were received, the values are placed in the original columns.
+        /// </remarks>
+        /// <param name="rows">Rows in sheet order</param>
+        /// <returns></returns>
+        internal IList<IList<object>> GetRowsData(IList<Row> rows)
+        {
+            var values = new List<IList<object>>(rows.Count);
+
+            foreach (Row row in rows)
+            {
+                values.Add(GetRowData(row));
+            }
+
+            return values;
         }
 
         /// <summary>
-        /// Getting ValueRange from rows with ToChange status.
+        /// Splitting the given rows into groups of rows with consecutive numbers.
         /// </summary>
+        /// <param name="rows">Rows in sheet order</param>
         /// <returns></returns>
-        internal IList<ValueRange> GetChangeValueRange()
+        internal List<List<Row>> GetConsecutiveRowGroups(IList<Row> rows)
         {
-            var valueRanges = new List<ValueRange>
+            var groups = new List<List<Row>>();
+            Row previousRow = null;
+
+            foreach (Row currentRow in rows)
             {
-                new ValueRange()
+                if (previousRow == null || currentRow.Number - previousRow.Number > 1)
                 {
-                    Values = new List<IList<object>>()
+                    groups.Add(new List<Row>());
                 }
-            };
 
-            var rowsToChange = Rows.FindAll(row => row.Status == RowStatus.ToChange);
-            var previousRow = rowsToChange.First();
-            rowsToChange.Remove(previousRow);
+                groups.Last().Add(currentRow);
+                previousRow = currentRow;
+            }
+
+            return groups;
+        }
+
+        /// <summary>
+        /// Splitting rows with the given status into chunks for sending in separate requests.
+        /// </summary>
+        /// <remarks>
+        /// A chunk contains rows in sheet order and no more cells than chunkCellCount,
+        /// except for a chunk of one row which is larger.
+        /// </remarks>
+        /// <param name="status"></param>
+        /// <param name="chunkCellCount">Maximum number of cells in a chunk</param>
+        /// <returns></returns>
+        internal List<List<Row>> GetRowChunks(RowStatus status, int chunkCellCount)
+        {
+            var chunks = new List<List<Row>>();
+            var chunk = new List<Row>();
+            int cellCount = 0;
+
+            foreach (Row row in Rows)
+            {
+                if (row.Status != status)
+                {
+                    continue;
+                }
+
+                int rowCellCount = Math.Max(row.Cells.Count, 1);
+
+                if (chunk.Count > 0 && cellCount + rowCellCount > chunkCellCount)
+                {
+                    chunks.Add(chunk);
+                    chunk = new List<Row>();
+                    cellCount = 0;
+                }
+
+                chunk.Add(row);
+                cellCount += rowCellCount;
+            }
+
+            if (chunk.Count > 0)
+            {
+                chunks.Add(chunk);
+            }
+
+            return chunks;
+        }
+
+        /// <summary>
+        /// Writing data of rows with ToAppend status into rows with ToDelete status
+        /// if this is cheaper than appending and deleting them separately.
+        /// </summary>
+        /// <remarks>
+        /// Deleting rows shifts all rows below them in the Google spreadsheet sheet,
+        /// so the slots closest to the top of the sheet are reused first.
+        /// Reused rows get all values of the appended rows and ToChange status,
+        /// their cells beyond the appended values are cleared.
+        /// Rows whose data was moved are removed from the sheet,
+        /// and only the remaining rows are appended or deleted.<br/>
+        /// The cost of a plan is estimated in cells: shifted rows, cleared cells
+        /// and an overhead for each range or request.
+        /// The appended values are not counted, because both plans write them.<br/>
+        /// Rows are not reused in a sheet with only some of the columns,
+        /// because the columns that were not received would keep the values of the deleted rows.
+        /// </remarks>
+        /// <returns>true if the rows have been reused.</returns>
+        internal bool PlanRowReuse()
+        {
+            if (ColumnIndexes.Count > 0)
+            {
+                return false;
+            }
+
+            List<Row> rowsToDelete = Rows.FindAll(row => row.Status == RowStatus.ToDelete);
+            List<Row> rowsToAppend = Rows.FindAll(row => row.Status == RowStatus.ToAppend);
+            int reusedCount = Math.Min(rowsToDelete.Count, rowsToAppend.Count);
+
+            if (reusedCount == 0)
+            {
+                return false;
+            }
+
+            List<Row> reusedRows = rowsToDelete.GetRange(0, reusedCount);
+            List<Row> remainingRowsToDelete = rowsToDelete.GetRange(reusedCount, rowsToDelete.Count - reusedCount);
+            int lastNumber = Rows.Last().Number;
+
+            long separateCost = EstimateDeleteCost(rowsToDelete, lastNumber) + RangeCost;
+            long reuseCost = EstimateDeleteCost(remainingRowsToDelete, lastNumber - reusedCount)
+                + CountRowGroups(reusedRows) * RangeCost
+                + (rowsToAppend.Count > reusedCount ? RangeCost : 0);
 
-            valueRanges.Last().Values.Add(previousRow.GetData());
-            valueRanges.Last().Range = $"{Title}!A{previousRow.Number}";
+            for (int i = 0; i < reusedCount; i++)
+            {
+                reuseCost += Math.Max(0, reusedRows[i].Cells.Count - rowsToAppend[i].Cells.Count);
+            }
+
+            if (reuseCost >= separateCost)
+            {
+                return false;
+            }
 
-            foreach (var currentRow in rowsToChange)
+            for (int i = 0; i < reusedCount; i++)
             {
-                if (currentRow.Number - previousRow.Number > 1)
+                Row slot = reusedRows[i];
+                Row appendedRow = rowsToAppend[i];
+
+                // Rows of a simple sheet can have different lengths.
+                for (int j = 0; j < appendedRow.Cells.Count; j++)
                 {
-                    valueRanges.Add(new ValueRange()
+                    Cell appendedCell = appendedRow.Cells[j];
+
+                    if (j < slot.Cells.Count)
+                    {
+                        slot.Cells[j].ChangeValue(appendedCell.Value);
+                    }
+                    else
                     {
-                        Values = new List<IList<object>>(),
-                        Range = $"{Title}!A{currentRow.Number}"
-                    });
+                        slot.Cells.Add(new Cell(appendedCell.Value, appendedCell.Title, slot));
+                    }
                 }
 
-                valueRanges.Last().Values.Add(currentRow.GetData());
-                previousRow = currentRow;
+                for (int j = appendedRow.Cells.Count; j < slot.Cells.Count; j++)
+                {
+                    slot.Cells[j].ChangeValue(string.Empty);
+                }
+
+                slot.MarkCellsChanged();
+                slot.Status = RowStatus.ToChange;
+                Rows.Remove(appendedRow);
             }
 
-            return valueRanges;
+            RenumberRows();
+
+            return true;
         }
 
         /// <summary>
@@ -380,7 +1293,12 @@ namespace SynSys.GSpreadsheetEasyAccess.Data
 
             foreach (var row in Rows)
             {
-                row.Number = number;
+                // Rows whose number doesn't change keep their snapshots.
+                if (row.Number != number)
+                {
+                    row.Number = number;
+                }
+
                 number++;
             }
         }
@@ -398,6 +1316,35 @@ namespace SynSys.GSpreadsheetEasyAccess.Data
             }
         }
 
+        /// <summary>
+        /// Selecting the sheet columns by the full head of the Google spreadsheet sheet.
+        /// </summary>
+        /// <remarks>
+        /// The key column is always selected for a sheet with SheetMode.HeadAndKey.
+        /// </remarks>
+        /// <param name="headData">First row of the Google spreadsheet sheet</param>
+        /// <param name="columns">Titles of the required columns</param>
+        /// <exception cref="InvalidSheetHeadException"></exception>
+        internal void SelectColumns(IList<object> headData, IEnumerable<string> columns)
+        {
+            Head = headData.Select(ConvertToCellValue).ToList();
+
+            var requiredHeaders = columns.ToList();
+
+            if (Mode == SheetMode.HeadAndKey && !requiredHeaders.Contains(KeyName))
+            {
+                requiredHeaders.Add(KeyName);
+            }
+
+            CheckHead(requiredHeaders);
+
+            ColumnIndexes = requiredHeaders
+                .Select(title => Head.IndexOf(title))
+                .Distinct()
+                .OrderBy(index => index)
+                .ToList();
+        }
+
         /// <exception cref="EmptySheetException"></exception>
         internal void ValidateData(IList<IList<object>> data)
         {
@@ -434,20 +1381,122 @@ namespace SynSys.GSpreadsheetEasyAccess.Data
             }
         }
 
+        /// <summary>
+        /// Keeping the numbers of an unformatted row, so that the typed column access
+        /// doesn't parse them back from the cell values.
+        /// </summary>
+        /// <param name="row">Row filled from rowData</param>
+        /// <param name="rowData">Values received from Google</param>
+        private static void KeepNumbers(Row row, IList<object> rowData)
+        {
+            if (!rowData.Any(value => value is double))
+            {
+                return;
+            }
+
+            var numbers = new double[row.Cells.Count];
+
+            for (int i = 0; i < numbers.Length; i++)
+            {
+                numbers[i] = i < rowData.Count && rowData[i] is double number
+                    ? number
+                    : Row.ParseNumber(row.Cells[i].Value);
+            }
+
+            row.SetNumbers(numbers);
+        }
+
+        /// <summary>
+        /// Converting a value received from Google to a cell value.
+        /// </summary>
+        /// <remarks>
+        /// Formatted values are always strings,
+        /// but unformatted values can be numbers or booleans.
+        /// </remarks>
+        private static string ConvertToCellValue(object value)
+        {
+            switch (value)
+            {
+                case null:
+                    return string.Empty;
+                case string text:
+                    return text;
+                case bool flag:
+                    return flag ? "TRUE" : "FALSE";
+                case double number:
+                    return number.ToString("R", CultureInfo.InvariantCulture);
+                case IFormattable formattable:
+                    return formattable.ToString(null, CultureInfo.InvariantCulture);
+                default:
+                    return value.ToString();
+            }
+        }
+
+        /// <exception cref="InvalidSheetHeadException"></exception>
+        private int FindColumnIndex(string title)
+        {
+            int columnIndex = Head.IndexOf(title);
+
+            if (columnIndex < 0)
+            {
+                throw new InvalidSheetHeadException(
+                    $"in spreadsheet \"{SpreadsheetTitle}\" " +
+                    $"in sheet\"{Title}\" " +
+                    $"no column: {title}."
+                )
+                {
+                    Sheet = this,
+                    LostHeaders = new List<string>() { title }
+                };
+            }
+
+            return columnIndex;
+        }
+
+        /// <exception cref="ArgumentOutOfRangeException"></exception>
+        private void CheckColumnIndex(int columnIndex)
+        {
+            if (columnIndex < 0 || columnIndex >= Head.Count)
+            {
+                throw new ArgumentOutOfRangeException(nameof(columnIndex));
+            }
+        }
+
         private void AddRow(int number, int length, IList<string> data, RowStatus status=RowStatus.ToAppend)
         {
-            var row = new Row(data, length, Head)
+            Rows.Add(CreateRow(number, length, data, status, FindKeyIndex()));
+        }
+
+        private Row CreateRow(int number, int length, IList<string> data, RowStatus status, int keyIndex)
+        {
+            var row = new Row(data, length, Head, valuePool)
             {
                 Status = status,
                 Number = number
             };
 
-            if (!string.IsNullOrWhiteSpace(KeyName))
+            if (keyIndex >= 0 && keyIndex < row.Cells.Count)
+            {
+                row.Key = row.Cells[keyIndex];
+            }
+
+            return row;
+        }
+
+        /// <returns>-1 if the sheet has no key column.</returns>
+        private int FindKeyIndex()
+        {
+            if (string.IsNullOrWhiteSpace(KeyName))
             {
-                row.Key = row.Cells.Find(cell => cell.Title == KeyName);
+                return -1;
             }
 
-            Rows.Add(row);
+            return Head.IndexOf(KeyName);
+        }
+
+        private string PoolValue(int columnIndex, string value)
+        {
+            return valuePool == null ? value : valuePool.Get(columnIndex, value);
         }
 
         /// <summary>
@@ -465,6 +1514,11 @@ namespace SynSys.GSpreadsheetEasyAccess.Data
 
         private int FindFirstRowNumber()
         {
+            if (FirstRowNumber > 0)
+            {
+                return FirstRowNumber;
+            }
+
             if (Mode == SheetMode.Head || Mode == SheetMode.HeadAndKey)
             {
                 return 2;
@@ -473,6 +1527,23 @@ namespace SynSys.GSpreadsheetEasyAccess.Data
             return 1;
         }
 
+        /// <summary>
+        /// Google appends rows after the last row of the whole sheet,
+        /// so rows appended to a window that ends earlier would get wrong numbers.
+        /// </summary>
+        /// <exception cref="InvalidOperationException"></exception>
+        private void CheckCanAppendRows()
+        {
+            if (LastRowNumber > 0)
+            {
+                throw new InvalidOperationException(
+                    $"Rows can't be appended to the window of rows {FirstRowNumber}-{LastRowNumber} " +
+                    "because it doesn't reach the end of the sheet. " +
+                    "Receive the sheet tail or a window up to the end of the sheet."
+                );
+            }
+        }
+
         private int FindNextRowNumber()
         {
             if (Rows.Count > 0)
@@ -481,7 +1552,7 @@ namespace SynSys.GSpreadsheetEasyAccess.Data
             }
             else
             {
-                return 1;
+                return FindFirstRowNumber();
             }
         }
 
@@ -497,19 +1568,68 @@ namespace SynSys.GSpreadsheetEasyAccess.Data
             }
         }
 
-        private IList<IList<object>> GetAppendRows()
+        /// <summary>
+        /// Estimated cost of deleting rows: each group of consecutive rows is a separate request
+        /// and shifts all rows below it.
+        /// </summary>
+        /// <param name="rowsToDelete">Rows in ascending order of numbers</param>
+        /// <param name="lastNumber">Number of the last row of the sheet at the moment of deletion</param>
+        private static long EstimateDeleteCost(List<Row> rowsToDelete, int lastNumber)
         {
-            var data = new List<IList<object>>();
+            long cost = 0;
+            int deletedBelow = 0;
 
-            foreach (var row in Rows)
+            // Groups are deleted from the end of the sheet, so rows deleted earlier are not shifted.
+            for (int i = rowsToDelete.Count - 1; i >= 0; i--)
+            {
+                bool isGroupEnd = i == rowsToDelete.Count - 1 || rowsToDelete[i + 1].Number - rowsToDelete[i].Number > 1;
+
+                if (isGroupEnd)
+                {
+                    cost += RangeCost + lastNumber - rowsToDelete[i].Number - deletedBelow;
+                }
+
+                deletedBelow++;
+            }
+
+            return cost;
+        }
+
+        /// <param name="rows">Rows in ascending order of numbers</param>
+        private static int CountRowGroups(List<Row> rows)
+        {
+            int count = 0;
+
+            for (int i = 0; i < rows.Count; i++)
             {
-                if (row.Status == RowStatus.ToAppend)
+                if (i == 0 || rows[i].Number - rows[i - 1].Number > 1)
                 {
-                    data.Add(row.GetData());
+                    count++;
                 }
             }
 
-            return data;
+            return count;
+        }
+
+        /// <exception cref="ArgumentException"></exception>
+        private static Row FindPatchedRow(Dictionary<int, Row> rows, int rowNumber)
+        {
+            if (!rows.TryGetValue(rowNumber, out Row row))
+            {
+                throw new ArgumentException($"Sheet does not contain the row {rowNumber}.", "patch");
+            }
+
+            return row;
+        }
+
+        private IList<object> GetRowData(Row row)
+        {
+            if (ColumnIndexes.Count == 0)
+            {
+                return row.GetData();
+            }
+
+            return row.GetData(ColumnIndexes);
         }
 
         private bool IsNotSameSheet(SheetModel otherSheet, out string failReason)
@@ -556,6 +1676,12 @@ namespace SynSys.GSpreadsheetEasyAccess.Data
                 return true;
             }
 
+            if (!ColumnIndexes.SequenceEqual(otherSheet.ColumnIndexes))
+            {
+                failReason = nameof(otherSheet.ColumnIndexes);
+                return true;
+            }
+
             failReason = string.Empty;
             return false;
         }
@@ -610,13 +1736,17 @@ namespace SynSys.GSpreadsheetEasyAccess.Data
             }
         }
 
-        private static void MergeRows(Row currentRow, Row otherRow)
+        private void MergeRows(Row currentRow, Row otherRow)
         {
             for (int j = 0; j < currentRow.Cells.Count; j++)
             {
-                if (currentRow.Cells[j].Value != otherRow.Cells[j].Value)
+                string otherValue = otherRow.Cells[j].Value;
+
+                // String equality checks references first,
+                // so equal pooled values are compared without comparing chars.
+                if (currentRow.Cells[j].Value != otherValue)
                 {
-                    currentRow.Cells[j].Value = otherRow.Cells[j].Value;
+                    currentRow.Cells[j].Value = PoolValue(j, otherValue);
                 }
             }
         }
@@ -0,0 +1,46 @@
+﻿using Newtonsoft.Json;
+using System.Collections.Generic;
+
+namespace SynSys.GSpreadsheetEasyAccess.Data
+{
+    /// <summary>
+    /// Represents the changes that turn one version of a sheet into another.
+    /// </summary>
+    /// <remarks>
+    /// The patch is created by the SheetModel.Diff method and applied by the SheetModel.ApplyPatch method.<br/>
+    /// Only changed cells are included, so the patch is much smaller than the whole sheet.
+    /// </remarks>
+    public class SheetPatch
+    {
+        /// <summary>
+        /// Changed cells of existing rows.
+        /// </summary>
+        [JsonProperty("edits")]
+        public List<CellEdit> CellEdits { get; internal set; } = new List<CellEdit>();
+
+        /// <summary>
+        /// Data of rows to add to the end of the sheet.
+        /// </summary>
+        [JsonProperty("append")]
+        public List<List<string>> AppendedRows { get; internal set; } = new List<List<string>>();
+
+        /// <summary>
+        /// Numbers of rows to delete.
+        /// </summary>
+        [JsonProperty("delete")]
+        public List<int> DeletedRowNumbers { get; internal set; } = new List<int>();
+
+        /// <summary>
+        /// Indicates that the patch contains no changes.
+        /// </summary>
+        [JsonIgnore]
+        public bool IsEmpty
+        {
+            get => CellEdits.Count == 0 && AppendedRows.Count == 0 && DeletedRowNumbers.Count == 0;
+        }
+
+
+        [JsonConstructor]
+        internal SheetPatch() { }
+    }
+}
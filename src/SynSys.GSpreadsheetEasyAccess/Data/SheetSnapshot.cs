@@ -0,0 +1,119 @@
+﻿using System;
+using System.Collections.Generic;
+using System.Linq;
+
+namespace SynSys.GSpreadsheetEasyAccess.Data
+{
+    /// <summary>
+    /// Represents an immutable copy of the sheet.
+    /// </summary>
+    /// <remarks>
+    /// A snapshot can be read by any number of threads without locks,
+    /// while the sheet itself continues to change.<br/>
+    /// Unchanged rows are not copied again, but shared with the previous snapshot.
+    /// </remarks>
+    public class SheetSnapshot
+    {
+        /// <summary>
+        /// Sheet Name.
+        /// </summary>
+        public string Title { get; }
+
+        /// <summary>
+        /// Google spreadsheet Id.
+        /// </summary>
+        public string SpreadsheetId { get; }
+
+        /// <summary>
+        /// Google spreadsheet sheet Id.
+        /// </summary>
+        public int Gid { get; }
+
+        /// <summary>
+        /// Spreadsheet name.
+        /// </summary>
+        public string SpreadsheetTitle { get; }
+
+        /// <summary>
+        /// Key column name.
+        /// </summary>
+        public string KeyName { get; }
+
+        /// <summary>
+        /// The mode by which work with the sheet is determined.
+        /// </summary>
+        public SheetMode Mode { get; }
+
+        /// <summary>
+        /// First row of the sheet.
+        /// </summary>
+        public IReadOnlyList<string> Head { get; }
+
+        /// <summary>
+        /// All rows of the sheet except for the head.
+        /// </summary>
+        public IReadOnlyList<RowSnapshot> Rows { get; }
+
+        /// <summary>
+        /// Sequence number of the snapshot for this sheet.
+        /// </summary>
+        /// <remarks>
+        /// Each following snapshot has a larger version.
+        /// </remarks>
+        public long Version { get; }
+
+        /// <summary>
+        /// Zero-based column index by title.
+        /// </summary>
+        /// <param name="title">Column title</param>
+        /// <returns>-1 if there is no such column.</returns>
+        public int GetColumnIndex(string title)
+        {
+            for (int i = 0; i < Head.Count; i++)
+            {
+                if (Head[i] == title)
+                {
+                    return i;
+                }
+            }
+
+            return -1;
+        }
+
+
+        /// <summary>
+        /// Copying the current state of the sheet.
+        /// </summary>
+        /// <param name="sheet">Sheet to copy</param>
+        /// <param name="previous">Previous snapshot of the same sheet whose head can be shared</param>
+        /// <param name="version"></param>
+        internal SheetSnapshot(SheetModel sheet, SheetSnapshot previous, long version)
+        {
+            Title = sheet.Title;
+            SpreadsheetId = sheet.SpreadsheetId;
+            Gid = sheet.Gid;
+            SpreadsheetTitle = sheet.SpreadsheetTitle;
+            KeyName = sheet.KeyName;
+            Mode = sheet.Mode;
+            Version = version;
+
+            if (previous != null && previous.Head.SequenceEqual(sheet.Head))
+            {
+                Head = previous.Head;
+            }
+            else
+            {
+                Head = Array.AsReadOnly(sheet.Head.ToArray());
+            }
+
+            var rows = new RowSnapshot[sheet.Rows.Count];
+
+            for (int i = 0; i < rows.Length; i++)
+            {
+                rows[i] = sheet.Rows[i].GetSnapshot();
+            }
+
+            Rows = Array.AsReadOnly(rows);
+        }
+    }
+}
@@ -0,0 +1,126 @@
+﻿using System.Collections.Generic;
+
+namespace SynSys.GSpreadsheetEasyAccess.Data
+{
+    /// <summary>
+    /// Represents a pool of cell values in which equal values of one column are stored as one string instance.
+    /// </summary>
+    /// <remarks>
+    /// Used for sheets with columns that contain few distinct values.
+    /// Cells with equal pooled values refer to the same string,
+    /// so their comparison is reduced to a reference check.<br/>
+    /// Each column has its own pool. A column with too many distinct values stops being pooled
+    /// and its pool is released, so columns of ids or timestamps don't retain memory.
+    /// </remarks>
+    internal class ValuePool
+    {
+        internal const int DefaultMaxDistinctValues = 4096;
+
+        /// <summary>
+        /// Number of values after which a column is checked for a low share of repeated values.
+        /// </summary>
+        private const int SampleSize = 1024;
+
+        private readonly int maxDistinctValues;
+        private readonly List<ColumnPool> columns = new List<ColumnPool>();
+
+        /// <summary>
+        /// Number of distinct values in the pools of all columns.
+        /// </summary>
+        internal int Count { get; private set; }
+
+
+        internal ValuePool() : this(DefaultMaxDistinctValues) { }
+
+        /// <param name="maxDistinctValues">Number of distinct values of a column after which it stops being pooled</param>
+        internal ValuePool(int maxDistinctValues)
+        {
+            this.maxDistinctValues = maxDistinctValues;
+        }
+
+        /// <summary>
+        /// Get the pooled instance of the value.
+        /// </summary>
+        /// <remarks>
+        /// If the pool of the column doesn't contain an equal value yet, the given value is added to the pool.
+        /// </remarks>
+        /// <param name="columnIndex">Zero-based index of the column of the value</param>
+        /// <param name="value"></param>
+        /// <returns>Instance equal to the given value.</returns>
+        internal string Get(int columnIndex, string value)
+        {
+            if (string.IsNullOrEmpty(value))
+            {
+                return value;
+            }
+
+            ColumnPool column = GetColumn(columnIndex);
+
+            if (column.IsStopped)
+            {
+                return value;
+            }
+
+            column.LookupCount++;
+
+            if (column.Values.TryGetValue(value, out string pooledValue))
+            {
+                return pooledValue;
+            }
+
+            column.Values.Add(value, value);
+            Count++;
+
+            if (IsHighCardinality(column))
+            {
+                Count -= column.Values.Count;
+                column.Values = null;
+                column.IsStopped = true;
+            }
+
+            return value;
+        }
+
+        /// <summary>
+        /// Indicates that values of the column are still pooled.
+        /// </summary>
+        /// <param name="columnIndex">Zero-based column index</param>
+        internal bool IsPooling(int columnIndex)
+        {
+            return columnIndex >= columns.Count || columns[columnIndex] == null || !columns[columnIndex].IsStopped;
+        }
+
+
+        private ColumnPool GetColumn(int columnIndex)
+        {
+            while (columns.Count <= columnIndex)
+            {
+                columns.Add(null);
+            }
+
+            if (columns[columnIndex] == null)
+            {
+                columns[columnIndex] = new ColumnPool();
+            }
+
+            return columns[columnIndex];
+        }
+
+        /// <summary>
+        /// A column is not worth pooling if it has too many distinct values
+        /// or if most of its values are not repeated.
+        /// </summary>
+        private bool IsHighCardinality(ColumnPool column)
+        {
+            return column.Values.Count > maxDistinctValues
+                || (column.LookupCount >= SampleSize && column.Values.Count * 2 > column.LookupCount);
+        }
+
+        private class ColumnPool
+        {
+            internal Dictionary<string, string> Values = new Dictionary<string, string>();
+            internal int LookupCount;
+            internal bool IsStopped;
+        }
+    }
+}
@@ -1,5 +1,21 @@
+from enum import Enum
+
 from SynSys.GSpreadsheetEasyAccess.Authentication import Principal
-from SynSys.GSpreadsheetEasyAccess.Data import SheetModel
+from SynSys.GSpreadsheetEasyAccess.Data import SheetModel, SheetPatch
+
+
+class ValueRenderMode(Enum):
+    """Determines how cell values are rendered when reading a Google spreadsheet sheet."""
+
+    Formatted = 1
+    """Values are read as they are displayed in the sheet,
+    according to the cell formatting and the spreadsheet locale.
+    """
+
+    Unformatted = 2
+    """Values are read without formatting.
+    Numbers use the invariant culture and dates are read as serial numbers.
+    """
 
 
 class GCPApplication(object):
@@ -10,6 +26,49 @@ class GCPApplication(object):
     Methods can only be used after successful authentication.
     """
 
+    @property
+    def ValueRenderMode(self):
+        """Determines how cell values are rendered when receiving sheets."""
+        return ValueRenderMode
+
+    @ValueRenderMode.setter
+    def ValueRenderMode(self, value):
+        # type: (ValueRenderMode) -> None
+        """Determines how cell values are rendered when receiving sheets."""
+        pass
+
+    @property
+    def PoolCellValues(self):
+        """Determines whether equal cell values of received sheets are stored as one string instance.
+
+        Recommended for large sheets with columns that contain few distinct values,
+        see SheetModel.EnableValuePool.
+        """
+        return bool()
+
+    @PoolCellValues.setter
+    def PoolCellValues(self, value):
+        # type: (bool) -> None
+        """Determines whether equal cell values of received sheets are stored as one string instance."""
+        pass
+
+    @property
+    def ReuseDeletedRows(self):
+        """Determines whether UpdateSheet writes appended rows into the slots of deleted rows
+        when this requires fewer operations than appending and deleting them separately.
+
+        The order of rows in the sheet changes: appended rows take the places of deleted rows.
+        Appended Row instances whose data was moved are removed from the SheetModel.
+        Rows are not reused in sheets received with only some of the columns.
+        """
+        return bool()
+
+    @ReuseDeletedRows.setter
+    def ReuseDeletedRows(self, value):
+        # type: (bool) -> None
+        """Determines whether UpdateSheet writes appended rows into the slots of deleted rows."""
+        pass
+
     def AuthenticateAs(self, principal):
         # type: (Principal) -> None
         """ To gain access to the Google Sheets API, you must be authenticated.
@@ -43,6 +102,7 @@ class GCPApplication(object):
         Raises:
             InvalidOperationException\n
             UserAccessDeniedException\n
+            OAuthSheetsScopeException\n
             SpreadsheetNotFoundException\n
             SheetExistsException
         """
@@ -67,6 +127,7 @@ class GCPApplication(object):
         Raises:
             InvalidOperationException\n
             UserAccessDeniedException\n
+            OAuthSheetsScopeException\n
             SpreadsheetNotFoundException\n
             InvalidSheetHeadException\n
             SheetExistsException
@@ -92,6 +153,7 @@ class GCPApplication(object):
         Raises:
             InvalidOperationException\n
             UserAccessDeniedException\n
+            OAuthSheetsScopeException\n
             SpreadsheetNotFoundException\n
             InvalidSheetHeadException\n
             SheetKeyNotFoundException\n
@@ -99,6 +161,72 @@ class GCPApplication(object):
         """
         return SheetModel()
 
+    def CreateSheetsWithHead(self, spreadsheetId, sheetTitles, head):
+        # type: (str, list[str], list[str]) -> list[SheetModel]
+        """ Creating several Google spreadsheet sheets with the same head in one request
+        and get their representations as instances of the SheetModel type.\n
+        After creating sheets, you can immediately work with them.\n
+        Either all sheets are created or none of them.
+
+        Args:
+            spreadsheetId (str):
+            sheetTitles (list[str]):
+            head (list[str]):
+
+        Returns:
+            SheetModels in the order of sheetTitles.\n
+            SheetModel is a list of Rows without first row.\n
+            First row is a header of sheet.\n
+            Each row has the same number of cells.\n
+            Each cell has a string value and title,
+            which matches the column heading for the given cell.
+
+        Raises:
+            InvalidOperationException\n
+            UserAccessDeniedException\n
+            OAuthSheetsScopeException\n
+            SpreadsheetNotFoundException\n
+            InvalidSheetHeadException\n
+            SheetExistsException\n
+            ArgumentNullException\n
+            ArgumentException
+        """
+        return [SheetModel()]
+
+    def CreateSheetsWithHeadAndKey(self, spreadsheetId, sheetTitles, head, keyName):
+        # type: (str, list[str], list[str], str) -> list[SheetModel]
+        """ Creating several Google spreadsheet sheets with the same head in one request
+        and get their representations as instances of the SheetModel type.\n
+        After creating sheets, you can immediately work with them.\n
+        Either all sheets are created or none of them.
+
+        Args:
+            spreadsheetId (str):
+            sheetTitles (list[str]):
+            head (list[str]):
+            keyName (str):
+
+        Returns:
+            SheetModels in the order of sheetTitles.\n
+            SheetModel is a list of Rows without first row.\n
+            First row is a header of sheet.\n
+            Each row has the same number of cells and has key column.\n
+            Each cell has a string value and title,
+            which matches the column heading for the given cell.
+
+        Raises:
+            InvalidOperationException\n
+            UserAccessDeniedException\n
+            OAuthSheetsScopeException\n
+            SpreadsheetNotFoundException\n
+            InvalidSheetHeadException\n
+            SheetKeyNotFoundException\n
+            SheetExistsException\n
+            ArgumentNullException\n
+            ArgumentException
+        """
+        return [SheetModel()]
+
     def GetSheet(self, *args):
         # type: (str | int) -> SheetModel
         """ Receiving data from a Google spreadsheet sheet as an instance of the SheetModel type.
@@ -111,6 +239,11 @@ class GCPApplication(object):
         or Args:
             spreadsheetId (str): Spreadsheet Id.
             sheetTitle (str): Spreadsheet sheet name.
+        or Args:
+            spreadsheetId (str): Spreadsheet Id.
+            sheet (int | str): Spreadsheet sheet Id or name.
+            firstRowNumber (int): Number of the first row of the window.
+            lastRowNumber (int): Number of the last row of the window.
 
         Returns:
             SheetModel is a list of Rows.\n
@@ -128,17 +261,28 @@ class GCPApplication(object):
         return SheetModel()
 
     def GetSheetWithHead(self, *args):
-        # type: (str | int) -> SheetModel
+        # type: (str | int | list[str]) -> SheetModel
         """ Receiving data from a Google spreadsheet sheet as an instance of the SheetModel type.
 
+        If columns are given, only the head and these columns are downloaded
+        and changes of the sheet are written back to the same columns.
+
         Args:
             uri (str): Full uri of spreadsheet sheet.
+            columns (list[str], optional): Titles of the required columns.
         or Args:
             spreadsheetId (str): Spreadsheet Id.
             gid (int): Spreadsheet sheet Id.
+            columns (list[str], optional): Titles of the required columns.
         or Args:
             spreadsheetId (str): Spreadsheet Id.
             sheetTitle (str): Spreadsheet sheet name.
+            columns (list[str], optional): Titles of the required columns.
+        or Args:
+            spreadsheetId (str): Spreadsheet Id.
+            sheet (int | str): Spreadsheet sheet Id or name.
+            firstRowNumber (int): Number of the first row of the window.
+            lastRowNumber (int): Number of the last row of the window.
 
         Returns:
             SheetModel is a list of Rows without first row.\n
@@ -154,24 +298,37 @@ class GCPApplication(object):
             SpreadsheetNotFoundException
             SheetNotFoundException
             EmptySheetException
+            InvalidSheetHeadException
         """
         return SheetModel()
 
     def GetSheetWithHeadAndKey(self, *args):
-        # type: (str | int) -> SheetModel
+        # type: (str | int | list[str]) -> SheetModel
         """ Receiving data from a Google spreadsheet sheet as an instance of the SheetModel type.
 
+        If columns are given, only the head, the key and these columns are downloaded
+        and changes of the sheet are written back to the same columns.
+
         Args:
             uri (str): Full uri of spreadsheet sheet.
             keyName (str): sheet key column.
+            columns (list[str], optional): Titles of the required columns.
         or Args:
             spreadsheetId (str): Spreadsheet Id.
             gid (int): Spreadsheet sheet Id.
             keyName (str): sheet key column.
+            columns (list[str], optional): Titles of the required columns.
         or Args:
             spreadsheetId (str): Spreadsheet Id.
             sheetTitle (str): Spreadsheet sheet name.
             keyName (str): sheet key column.
+            columns (list[str], optional): Titles of the required columns.
+        or Args:
+            spreadsheetId (str): Spreadsheet Id.
+            sheet (int | str): Spreadsheet sheet Id or name.
+            keyName (str): sheet key column.
+            firstRowNumber (int): Number of the first row of the window.
+            lastRowNumber (int): Number of the last row of the window.
 
         Returns:
             SheetModel is a list of Rows without first row.\n
@@ -188,29 +345,319 @@ class GCPApplication(object):
             SheetNotFoundException
             SheetKeyNotFoundException
             EmptySheetException
+            InvalidSheetHeadException
+        """
+        return SheetModel()
+
+    def GetSheetTail(self, spreadsheetId, sheet, lastKnownRowNumber):
+        # type: (str, int | str, int) -> SheetModel
+        """ Receiving rows following the given row from a Google spreadsheet sheet
+        as an instance of the SheetModel type.
+
+        Intended for sheets to which rows are only appended.\n
+        Only new rows are downloaded, their numbers match the row numbers
+        of the Google spreadsheet sheet.\n
+        If there are no new rows, the sheet is empty.
+
+        Args:
+            spreadsheetId (str): Spreadsheet Id.
+            sheet (int | str): Spreadsheet sheet Id or name.
+            lastKnownRowNumber (int): Number of the last row that was already received.
+
+        Returns:
+            SheetModel is a list of new Rows.\n
+            Header is absent.
+
+        Raises:
+            InvalidOperationException
+            InvalidApiKeyException
+            UserAccessDeniedException
+            SpreadsheetNotFoundException
+            SheetNotFoundException
+            ArgumentOutOfRangeException
+        """
+        return SheetModel()
+
+    def GetSheetWithHeadTail(self, spreadsheetId, sheet, lastKnownRowNumber):
+        # type: (str, int | str, int) -> SheetModel
+        """ Receiving rows following the given row from a Google spreadsheet sheet
+        as an instance of the SheetModel type.
+
+        Intended for sheets to which rows are only appended.\n
+        Only new rows are downloaded, their numbers match the row numbers
+        of the Google spreadsheet sheet.\n
+        If there are no new rows, the sheet is empty.
+
+        Args:
+            spreadsheetId (str): Spreadsheet Id.
+            sheet (int | str): Spreadsheet sheet Id or name.
+            lastKnownRowNumber (int): Number of the last row that was already received.
+
+        Returns:
+            SheetModel is a list of new Rows.\n
+            First row is a header of sheet.
+
+        Raises:
+            InvalidOperationException
+            InvalidApiKeyException
+            UserAccessDeniedException
+            SpreadsheetNotFoundException
+            SheetNotFoundException
+            EmptySheetException
+            ArgumentOutOfRangeException
+        """
+        return SheetModel()
+
+    def GetSheetWithHeadAndKeyTail(self, spreadsheetId, sheet, keyName, lastKnownRowNumber):
+        # type: (str, int | str, str, int) -> SheetModel
+        """ Receiving rows following the given row from a Google spreadsheet sheet
+        as an instance of the SheetModel type.
+
+        Intended for sheets to which rows are only appended.\n
+        Only new rows are downloaded, their numbers match the row numbers
+        of the Google spreadsheet sheet.\n
+        If there are no new rows, the sheet is empty.
+
+        Args:
+            spreadsheetId (str): Spreadsheet Id.
+            sheet (int | str): Spreadsheet sheet Id or name.
+            keyName (str): sheet key column.
+            lastKnownRowNumber (int): Number of the last row that was already received.
+
+        Returns:
+            SheetModel is a list of new Rows.\n
+            First row is a header of sheet.\n
+            Each row has key column.
+
+        Raises:
+            InvalidOperationException
+            InvalidApiKeyException
+            UserAccessDeniedException
+            SpreadsheetNotFoundException
+            SheetNotFoundException
+            SheetKeyNotFoundException
+            EmptySheetException
+            ArgumentOutOfRangeException
         """
         return SheetModel()
 
-    def UpdateSheet(self, sheet):
-        # type: (SheetModel) -> None
+    def GetSheets(self, sheets, maxDegreeOfParallelism):
+        # type: (list[str] | list[SheetAddress], int) -> list[SheetLoadResult]
+        """Receiving many sheets in parallel, possibly from different spreadsheets.
+
+        No more than maxDegreeOfParallelism sheets are received at the same time.
+        Requests rejected due to exceeding the quota are repeated with an increasing delay.\n
+        Results are returned as each sheet is received.\n
+        Exceptions of individual sheets don't stop loading and are returned
+        in SheetLoadResult.Exception.
+
+        Args:
+            sheets (list[str] | list[SheetAddress]): Full uris or locations of sheets.
+            maxDegreeOfParallelism (int): Maximum number of sheets received at the same time.
+
+        Returns:
+            One result for each sheet.
+
+        Raises:
+            InvalidOperationException\n
+            ArgumentNullException\n
+            ArgumentOutOfRangeException\n
+            ArgumentException: An uri is not a correct sheet uri or an address is null.
+        """
+        return [SheetLoadResult()]
+
+    def GetSheetsWithHead(self, sheets, maxDegreeOfParallelism):
+        # type: (list[str] | list[SheetAddress], int) -> list[SheetLoadResult]
+        """Receiving many sheets in parallel, possibly from different spreadsheets.
+
+        No more than maxDegreeOfParallelism sheets are received at the same time.
+        Requests rejected due to exceeding the quota are repeated with an increasing delay.\n
+        Results are returned as each sheet is received.\n
+        Exceptions of individual sheets don't stop loading and are returned
+        in SheetLoadResult.Exception.
+
+        Args:
+            sheets (list[str] | list[SheetAddress]): Full uris or locations of sheets.
+            maxDegreeOfParallelism (int): Maximum number of sheets received at the same time.
+
+        Returns:
+            One result for each sheet.
+
+        Raises:
+            InvalidOperationException\n
+            ArgumentNullException\n
+            ArgumentOutOfRangeException\n
+            ArgumentException: An uri is not a correct sheet uri or an address is null.
+        """
+        return [SheetLoadResult()]
+
+    def GetSheetsWithHeadAndKey(self, sheets, keyName, maxDegreeOfParallelism):
+        # type: (list[str] | list[SheetAddress], str, int) -> list[SheetLoadResult]
+        """Receiving many sheets in parallel, possibly from different spreadsheets.
+
+        No more than maxDegreeOfParallelism sheets are received at the same time.
+        Requests rejected due to exceeding the quota are repeated with an increasing delay.\n
+        Results are returned as each sheet is received.\n
+        Exceptions of individual sheets don't stop loading and are returned
+        in SheetLoadResult.Exception.
+
+        Args:
+            sheets (list[str] | list[SheetAddress]): Full uris or locations of sheets.
+            keyName (str): sheet key column.
+            maxDegreeOfParallelism (int): Maximum number of sheets received at the same time.
+
+        Returns:
+            One result for each sheet.
+
+        Raises:
+            InvalidOperationException\n
+            ArgumentNullException\n
+            ArgumentOutOfRangeException\n
+            ArgumentException: An uri is not a correct sheet uri or an address is null.
+        """
+        return [SheetLoadResult()]
+
+    def UpdateSheet(self, sheet, *args):
+        # type: (SheetModel, SheetPatch | int | IProgress) -> None
         """Update the Google spreadsheet sheet based on the modified instance of the SheetModel type.
 
         The method changes the data in the cells,
         adds rows to the end of the sheet and removes the selected rows.\n
-        All these actions are based on requests to Google.
+        All these actions are based on requests to Google.\n
+        If a patch is given, it is applied to the sheet model before updating.\n
+        Appended and changed rows are sent in chunks, by default of about 50000 cells
+        and up to 4 chunks of changed rows at the same time.
+        Rows of successfully sent chunks get the RowStatus.Original status,
+        so if the update fails, calling the method again sends only the remaining rows.
 
         Args:
             sheetModel (SheetModel): Google spreadsheet sheet model.
+        or Args:
+            sheetModel (SheetModel): Google spreadsheet sheet model.
+            patch (SheetPatch): Changes received by the SheetModel.Diff method.
+        or Args:
+            sheetModel (SheetModel): Google spreadsheet sheet model.
+            chunkCellCount (int): Maximum number of cells in one request. A row is never split.
+            maxConcurrentRequests (int): Maximum number of chunks of changed rows sent at the same time.
+            progress (IProgress[SheetUpdateProgress]): Receives the progress after each sent chunk. Can be None.
+
+        Raises:
+            InvalidOperationException\n
+            UserAccessDeniedException\n
+            OAuthSheetsScopeException\n
+            ArgumentNullException\n
+            ArgumentOutOfRangeException
+        """
+        return None
+
+    def CreateSheetAppender(self, sheet, *args):
+        # type: (SheetModel, int | TimeSpan) -> SheetAppender
+        """Creating a buffer of rows that are appended to the end of the Google spreadsheet sheet
+        in batches on a background thread.
+
+        By default the appender sends up to 500 rows per request at least every 5 seconds
+        and holds up to 10000 rows in the buffer.\n
+        The appender must be disposed to send the remaining rows.
+
+        Args:
+            sheet (SheetModel): Sheet to which rows are appended.
+        or Args:
+            sheet (SheetModel): Sheet to which rows are appended.
+            batchSize (int): Maximum number of rows in one request.
+            flushInterval (TimeSpan): Maximum time that a row waits in the buffer before sending.
+            capacity (int): Maximum number of rows in the buffer. Must not be less than batchSize.
+
+        Raises:
+            InvalidOperationException\n
+            UserAccessDeniedException\n
+            ArgumentNullException\n
+            ArgumentOutOfRangeException
+        """
+        return SheetAppender()
+
+    def AppendCsv(self, sheet, source, delimiter, skipFirstRow):
+        # type: (SheetModel, Stream | str, str, bool) -> int
+        """Appending rows from delimiter-separated text such as CSV or TSV
+        to the end of the Google spreadsheet sheet.
+
+        Rows are read and sent in chunks of about 50000 cells,
+        without creating Row and Cell instances, so the size of the text doesn't affect memory consumption.\n
+        The row size and the placement of values in columns are the same
+        as for rows added by the SheetModel.AddRow method.\n
+        Appended rows are not added to the SheetModel.
+        If sending a chunk fails, the previous chunks remain in the Google spreadsheet sheet.
+
+        Args:
+            sheet (SheetModel): Sheet to which rows are appended.
+            source (Stream | str): Stream or path to the file in UTF-8 or with a byte order mark.
+            delimiter (str): Value delimiter, for example CsvSerialization.Comma.
+            skipFirstRow (bool): Don't append the first row of the text, for example if it is the head.
 
         Returns:
-            SheetModel: Updated instance of SheetModel.
+            Number of appended rows.
 
         Raises:
             InvalidOperationException\n
             UserAccessDeniedException\n
             OAuthSheetsScopeException\n
+            ArgumentNullException\n
+            ArgumentException\n
+            IOException
         """
-        return None
+        return int()
+
+    def CreateSheetWatcher(self, sheet, versionMetadataKey, *args):
+        # type: (SheetModel, str, TimeSpan) -> SheetWatcher
+        """Creating a background check of the Google spreadsheet sheet for changes.
+
+        If a version metadata key is given, each check requests only the sheet metadata,
+        and the values are received only after the version stamp or the grid size has changed.
+        Writers must update the stamp by the UpdateSheetVersionStamp method.
+        Edits made without updating the stamp, for example by hand in the browser,
+        are not detected unless they change the grid size.\n
+        Without intervals checks are performed every 15 seconds to 5 minutes
+        depending on how often the sheet changes, and the key is required.\n
+        If None is passed as the key together with intervals,
+        all values are received on each check and compared by hash.
+        This detects all edits, but every check costs as much traffic and quota
+        as receiving the whole sheet, only creating the SheetModel is skipped.\n
+        The watcher must be disposed to stop checking.
+
+        Args:
+            sheet (SheetModel): Sheet to watch. The sheet itself is not changed by the watcher.
+            versionMetadataKey (str): Key of the developer metadata with the version stamp.
+        or Args:
+            sheet (SheetModel): Sheet to watch.
+            versionMetadataKey (str): Key of the developer metadata with the version stamp. Can be None.
+            minInterval (TimeSpan): Interval between checks after a change.
+            maxInterval (TimeSpan): Maximum interval between checks.
+
+        Raises:
+            InvalidOperationException\n
+            UserAccessDeniedException\n
+            ArgumentNullException\n
+            ArgumentException: The sheet contains only some of the rows or columns.\n
+            ArgumentOutOfRangeException\n
+            EmptySheetException\n
+            SheetKeyNotFoundException
+        """
+        return SheetWatcher()
+
+    def UpdateSheetVersionStamp(self, sheet, versionMetadataKey):
+        # type: (SheetModel, str) -> None
+        """Writing a new version stamp to the developer metadata of the Google spreadsheet sheet.
+
+        Used after updating the sheet so that watchers created with the same
+        version metadata key detect the change without receiving the values.
+
+        Raises:
+            InvalidOperationException\n
+            UserAccessDeniedException\n
+            OAuthSheetsScopeException\n
+            ArgumentNullException\n
+            SheetNotFoundException
+        """
+        pass
 
     def IsSheetExists(self, spreadsheetId, sheetTitle):
         # type: (str, str) -> bool
@@ -271,3 +718,292 @@ class HttpUtils(object):
             int: Returns -1 if there is no gid in uri.
         """
         return int()
+
+
+class TimeSpan(object):
+    pass
+
+
+class Stream(object):
+    pass
+
+
+class IProgress(object):
+    pass
+
+
+class SheetUpdateProgress(object):
+    """Represents the progress of updating a Google spreadsheet sheet.
+
+    Reported after each successfully sent chunk of appended or changed rows.
+    """
+
+    @property
+    def SentRowCount(self):
+        """Number of appended and changed rows that have already been sent."""
+        return int()
+
+    @property
+    def TotalRowCount(self):
+        """Number of appended and changed rows to send during this update."""
+        return int()
+
+
+class AppendBatchFailedEventArgs(object):
+    """Provides data for the SheetAppender.BatchFailed event."""
+
+    @property
+    def Rows(self):
+        """Rows that were not appended to the Google spreadsheet sheet."""
+        return [[object()]]
+
+    @property
+    def Exception(self):
+        """The reason why the rows were not appended."""
+        return Exception()
+
+
+class SheetAppender(object):
+    """Represents a buffer of rows that are appended to the end of a Google spreadsheet sheet
+    in batches on a background thread.
+
+    Rows are sent when the buffer contains BatchSize rows or when FlushInterval has passed
+    since the previous sending.\n
+    If the buffer is full, Append waits for free space and TryAppend drops the row.\n
+    Remaining rows are sent when the instance is disposed.\n
+    Appended rows are not added to the SheetModel.
+    """
+
+    BatchFailed = None
+    """Occurs when a batch of rows could not be appended to the Google spreadsheet sheet.
+    The handler receives AppendBatchFailedEventArgs.
+    """
+
+    @property
+    def BatchSize(self):
+        """Maximum number of rows in one request."""
+        return int()
+
+    @property
+    def FlushInterval(self):
+        """Maximum time that a row waits in the buffer before sending."""
+        return TimeSpan()
+
+    @property
+    def Capacity(self):
+        """Maximum number of rows in the buffer."""
+        return int()
+
+    @property
+    def BufferedRowCount(self):
+        """Number of rows waiting for sending."""
+        return int()
+
+    @property
+    def SentRowCount(self):
+        """Number of rows successfully appended to the Google spreadsheet sheet."""
+        return int()
+
+    @property
+    def FailedRowCount(self):
+        """Number of rows from batches that could not be appended."""
+        return int()
+
+    @property
+    def DroppedRowCount(self):
+        """Number of rows rejected by TryAppend because the buffer was full."""
+        return int()
+
+    def Append(self, data):
+        # type: (list[str]) -> None
+        """Adds a row to the buffer.
+
+        If the buffer is full, the method waits until the background thread frees up space.\n
+        The row size will be equal to the head size of the sheet.
+
+        Raises:
+            ObjectDisposedException
+        """
+        pass
+
+    def TryAppend(self, data):
+        # type: (list[str]) -> bool
+        """Adds a row to the buffer if it is not full.
+
+        If the buffer is full, the row is dropped and counted in DroppedRowCount.
+
+        Returns:
+            bool: True if the row was added to the buffer.
+
+        Raises:
+            ObjectDisposedException
+        """
+        return bool()
+
+    def Flush(self):
+        """Sends all buffered rows on the calling thread.
+
+        Raises:
+            ObjectDisposedException
+        """
+        pass
+
+    def Dispose(self):
+        """Stops the background thread and sends all remaining rows."""
+        pass
+
+
+class SheetChangedEventArgs(object):
+    """Provides data for the SheetWatcher.SheetChanged event."""
+
+    @property
+    def Patch(self):
+        """Changes that turn the previous state of the sheet into the new one.
+
+        None if the head of the sheet has changed,
+        since such a change can't be represented as changes of rows.
+        """
+        return SheetPatch()
+
+    @property
+    def Sheet(self):
+        """New state of the Google spreadsheet sheet."""
+        return SheetModel()
+
+
+class SheetWatchFailedEventArgs(object):
+    """Provides data for the SheetWatcher.PollFailed event."""
+
+    @property
+    def Exception(self):
+        """The reason why the sheet could not be checked."""
+        return Exception()
+
+
+class SheetWatcher(object):
+    """Represents a background check of a Google spreadsheet sheet for changes.
+
+    If a version metadata key is used, only the sheet metadata is requested on each check
+    and the values are received only after the version stamp has changed.
+    Edits that don't update the stamp are detected only if they change the grid size.\n
+    Otherwise, all values are received on each check and compared by hash,
+    so the sheet model is created only when the values have changed,
+    but each check receives the whole sheet.\n
+    The check interval doubles while the sheet doesn't change or the check fails,
+    up to MaxInterval, and returns to MinInterval after a change.\n
+    Events are raised on the background thread, the watcher can be disposed from their handlers.
+    """
+
+    SheetChanged = None
+    """Occurs when the values of the Google spreadsheet sheet have changed.
+    The handler receives SheetChangedEventArgs.
+    Exceptions of handlers are not caught and are not reported by the PollFailed event.
+    """
+
+    PollFailed = None
+    """Occurs when the sheet could not be checked.
+    The handler receives SheetWatchFailedEventArgs.
+    The watcher continues checking with an increased interval.
+    """
+
+    @property
+    def Sheet(self):
+        """Last received state of the Google spreadsheet sheet.
+
+        The instance is replaced after each change and must not be modified.
+        """
+        return SheetModel()
+
+    @property
+    def MinInterval(self):
+        """Interval between checks after a change."""
+        return TimeSpan()
+
+    @property
+    def MaxInterval(self):
+        """Maximum interval between checks."""
+        return TimeSpan()
+
+    @property
+    def CurrentInterval(self):
+        """Interval before the next check."""
+        return TimeSpan()
+
+    @property
+    def UsesVersionStamp(self):
+        """Indicates that changes are detected by the version stamp in the sheet metadata."""
+        return bool()
+
+    @property
+    def PollCount(self):
+        """Number of performed checks."""
+        return int()
+
+    @property
+    def FetchCount(self):
+        """Number of times the values of the sheet were received."""
+        return int()
+
+    def Dispose(self):
+        """Stops the background thread.
+
+        Waits for the current check to finish, unless it is called from an event handler.
+        """
+        pass
+
+
+class SheetAddress(object):
+    """Represents the location of one Google spreadsheet sheet.
+
+    The sheet is determined either by Gid or by Title.
+    """
+
+    def __init__(self, spreadsheetId, sheet):
+        # type: (str, int | str) -> None
+        """Initializes the address of the sheet determined by Gid or by Title."""
+        pass
+
+    @staticmethod
+    def FromUri(uri):
+        # type: (str) -> SheetAddress
+        """Get the address of the sheet from the full sheet uri."""
+        return SheetAddress(str(), int())
+
+    @property
+    def SpreadsheetId(self):
+        """Google spreadsheet Id."""
+        return str()
+
+    @property
+    def Gid(self):
+        """Google spreadsheet sheet Id. Equal to -1 if the sheet is determined by Title."""
+        return int()
+
+    @property
+    def Title(self):
+        """Sheet name. None if the sheet is determined by Gid."""
+        return str()
+
+
+class SheetLoadResult(object):
+    """Represents the result of receiving one sheet during bulk loading."""
+
+    @property
+    def Address(self):
+        """Location of the requested sheet."""
+        return SheetAddress(str(), int())
+
+    @property
+    def Sheet(self):
+        """Received sheet. None if the sheet could not be received."""
+        return SheetModel()
+
+    @property
+    def Exception(self):
+        """The reason why the sheet could not be received. None if the sheet was received."""
+        return Exception()
+
+    @property
+    def IsSuccess(self):
+        """Indicates that the sheet was received."""
+        return bool()
@@ -79,6 +79,80 @@ class Row(object):
         return Cell()
 
 
+class ColumnAggregate(object):
+    """Represents aggregated values of one numeric column of the sheet.
+
+    Only cells containing numbers are taken into account.
+    """
+
+    @property
+    def Count(self):
+        """Number of numeric cells in the column."""
+        return int()
+
+    @property
+    def Sum(self):
+        """Sum of numeric cells."""
+        return float()
+
+    @property
+    def Min(self):
+        """Minimum value. Equal to NaN if the column has no numbers."""
+        return float()
+
+    @property
+    def Max(self):
+        """Maximum value. Equal to NaN if the column has no numbers."""
+        return float()
+
+
+class CellEdit(object):
+    """Represents a change of one cell value in a SheetPatch."""
+
+    @property
+    def RowNumber(self):
+        """Number of the row in which the cell is located."""
+        return int()
+
+    @property
+    def Column(self):
+        """Zero-based index of the cell in the row."""
+        return int()
+
+    @property
+    def Value(self):
+        """New cell value."""
+        return str()
+
+
+class SheetPatch(object):
+    """Represents the changes that turn one version of a sheet into another.
+
+    The patch is created by the SheetModel.Diff method
+    and applied by the SheetModel.ApplyPatch method.
+    """
+
+    @property
+    def CellEdits(self):
+        """Changed cells of existing rows."""
+        return [CellEdit()]
+
+    @property
+    def AppendedRows(self):
+        """Data of rows to add to the end of the sheet."""
+        return [[str()]]
+
+    @property
+    def DeletedRowNumbers(self):
+        """Numbers of rows to delete."""
+        return [int()]
+
+    @property
+    def IsEmpty(self):
+        """Indicates that the patch contains no changes."""
+        return bool()
+
+
 class SheetMode(Enum):
     """An enumeration for a specific sheet filling.
 
@@ -95,6 +169,102 @@ class SheetMode(Enum):
     """Spreadsheet with head in one row and and key column."""
 
 
+class RowSnapshot(object):
+    """Represents an immutable copy of one row of the sheet.
+
+    The copy is shared between sheet snapshots while the row doesn't change.
+    """
+
+    @property
+    def Number(self):
+        """Number, not index!"""
+        return int()
+
+    @property
+    def Status(self):
+        """Row status at the time of the snapshot."""
+        return RowStatus
+
+    @property
+    def Values(self):
+        """Cell values in column order."""
+        return [str()]
+
+    @property
+    def Key(self):
+        """Key cell value. None if the sheet has no key."""
+        return str()
+
+
+class SheetSnapshot(object):
+    """Represents an immutable copy of the sheet.
+
+    A snapshot can be read by any number of threads without locks,
+    while the sheet itself continues to change.\n
+    Unchanged rows are not copied again, but shared with the previous snapshot.
+    """
+
+    @property
+    def Title(self):
+        """Sheet Name."""
+        return str()
+
+    @property
+    def SpreadsheetId(self):
+        """Google spreadsheet Id."""
+        return str()
+
+    @property
+    def Gid(self):
+        """Google spreadsheet sheet Id."""
+        return int()
+
+    @property
+    def SpreadsheetTitle(self):
+        """Spreadsheet name."""
+        return str()
+
+    @property
+    def KeyName(self):
+        """Key column name."""
+        return str()
+
+    @property
+    def Mode(self):
+        """The mode by which work with the sheet is determined."""
+        return SheetMode
+
+    @property
+    def Head(self):
+        """First row of the sheet."""
+        return [str()]
+
+    @property
+    def Rows(self):
+        """All rows of the sheet except for the head."""
+        return [RowSnapshot()]
+
+    @property
+    def Version(self):
+        """Sequence number of the snapshot for this sheet.
+
+        Each following snapshot has a larger version.
+        """
+        return int()
+
+    def GetColumnIndex(self, title):
+        # type: (str) -> int
+        """Zero-based column index by title.
+
+        Args:
+            title (str): Column title.
+
+        Returns:
+            -1 if there is no such column.
+        """
+        return int()
+
+
 class SheetModel(object):
     """The type represents one Google spreadsheet sheet."""
 
@@ -138,6 +308,36 @@ class SheetModel(object):
         """All rows included in this sheet except for the head."""
         return [Row()]
 
+    @property
+    def ColumnIndexes(self):
+        """Zero-based indexes of the Google spreadsheet sheet columns
+        that correspond to the Head, in ascending order.
+
+        The list is empty if the sheet was received with all columns.\n
+        Otherwise, the sheet contains only some of the columns
+        and changes are written back to these columns only.
+        """
+        return [int()]
+
+    @property
+    def FirstRowNumber(self):
+        """Number of the first Google spreadsheet sheet row included in this sheet.
+
+        Equal to 0 if the sheet was received with all rows.\n
+        Otherwise, the sheet contains only a window of rows and
+        all row numbers remain absolute for the Google spreadsheet sheet.
+        """
+        return int()
+
+    @property
+    def LastRowNumber(self):
+        """Number of the last Google spreadsheet sheet row included in the window of rows.
+
+        Equal to 0 if the sheet contains all rows up to the end of the Google spreadsheet sheet.\n
+        Otherwise, there may be rows after the window, so rows can't be appended to the sheet.
+        """
+        return int()
+
     @property
     def IsEmpty(self):
         """Indicates that there are no rows in the sheet.
@@ -146,6 +346,23 @@ class SheetModel(object):
         """
         return bool()
 
+    @property
+    def IsValuePoolEnabled(self):
+        """Indicates that equal cell values of the sheet are stored as one string instance.
+
+        Pooling is not saved to JSON, so it has to be enabled again after deserialization.
+        """
+        return bool()
+
+    @property
+    def LatestSnapshot(self):
+        """The last snapshot published by the PublishSnapshot method.
+
+        The property can be read from any thread without locks.\n
+        None if no snapshot has been published yet.
+        """
+        return SheetSnapshot()
+
     def AddRow(self, *args):
         """ Adds row to the end of the sheet.
 
@@ -157,6 +374,28 @@ class SheetModel(object):
             No args for add empty row.
         or Args:
             data (list[str]): Data to compose a row.
+
+        Raises:
+            InvalidOperationException: The sheet is a window of rows that doesn't reach the end of the sheet.
+        """
+        pass
+
+    def AddRows(self, rowsData):
+        # type: (list[list[str]] | Array[str]) -> None
+        """Adds rows to the end of the sheet.
+
+        Each row is composed in the same way as by the AddRow method,
+        but the next row number and the key column are found once for all rows.
+
+        Args:
+            rowsData (list[list[str]]): Data to compose rows.
+        or Args:
+            values (Array[str]): Two-dimensional block of values, string[,].
+                The first dimension corresponds to rows, the second to columns.
+
+        Raises:
+            ArgumentNullException
+            InvalidOperationException: The sheet is a window of rows that doesn't reach the end of the sheet.
         """
         pass
 
@@ -211,6 +450,225 @@ class SheetModel(object):
         """
         pass
 
+    def EnableValuePool(self):
+        """Store equal cell values of the sheet as one string instance.
+
+        Reduces memory for sheets with columns that contain few distinct values,
+        such as statuses, categories or TRUE/FALSE.\n
+        Each column is pooled separately. A column with many distinct values, such as ids or timestamps,
+        stops being pooled, so its values are not retained by the pool.\n
+        Values of existing cells are pooled immediately,
+        values of rows added later are pooled when the rows are added.\n
+        Values assigned to the Cell.Value property are not pooled.\n
+        Row statuses don't change.
+        """
+        pass
+
+    def TakeSnapshot(self):
+        # type: () -> SheetSnapshot
+        """Create an immutable copy of the current state of the sheet.
+
+        Only rows changed since the previous snapshot are copied,
+        the rest are shared with it.\n
+        The method must be called from the thread which changes the sheet.
+        """
+        return SheetSnapshot()
+
+    def PublishSnapshot(self):
+        # type: () -> SheetSnapshot
+        """Create a snapshot of the current state of the sheet and make it available
+        to other threads through the LatestSnapshot property.
+
+        The method must be called from the thread which changes the sheet.\n
+        Readers that have already received the previous snapshot continue to use it.
+
+        Returns:
+            Published snapshot.
+        """
+        return SheetSnapshot()
+
+    def Diff(self, other):
+        # type: (SheetModel) -> SheetPatch
+        """Get changes that turn this sheet into another version of the same sheet.
+
+        Rows are matched by number.\n
+        Rows of this sheet that are missing or have RowStatus.ToDelete in the other sheet are deleted.\n
+        Rows of the other sheet that are missing in this sheet are appended.\n
+        Rows with RowStatus.ToAppend are matched only with rows with the same status,
+        so rows that are already pending for appending in this sheet are not appended again.\n
+        For the remaining rows only changed cells are included in the patch.
+
+        Args:
+            other (SheetModel): Same SheetModel.
+
+        Returns:
+            Changes to apply to this sheet by the ApplyPatch method.
+
+        Raises:
+            ArgumentNullException
+            ArgumentException: Raise if other sheet not same.
+        """
+        return SheetPatch()
+
+    def ApplyPatch(self, patch):
+        # type: (SheetPatch) -> None
+        """Apply changes received by the Diff method.
+
+        Cells are changed as if their values were assigned,
+        rows are deleted by the DeleteRow method and appended by the AddRow method,
+        so rows get the same statuses as with manual changes.
+
+        Args:
+            patch (SheetPatch): Changes of this sheet.
+
+        Raises:
+            ArgumentNullException
+            ArgumentException: The patch refers to a row that is not in the sheet.
+            ArgumentOutOfRangeException: The patch refers to a cell that is not in the row.
+            InvalidOperationException: The patch appends rows to a window of rows
+                that doesn't reach the end of the sheet.
+        """
+        pass
+
+    def ToArray(self):
+        # type: () -> Array[str]
+        """Get all cell values of the sheet as one block.
+
+        The first dimension of the array corresponds to rows, the second to columns of the head.\n
+        Rows are included regardless of their status.\n
+        Useful for scripts, since the whole sheet is received in one call
+        instead of a call for each cell.
+
+        Returns:
+            Two-dimensional array string[,] of Rows.Count rows and Head.Count columns.
+        """
+        return [[str()]]
+
+    def GetColumn(self, column):
+        # type: (str | int) -> Array[str]
+        """Get column values.
+
+        Args:
+            column (str | int): Column title or zero-based column index.
+
+        Returns:
+            One value for each row of the sheet.
+
+        Raises:
+            InvalidSheetHeadException
+            ArgumentOutOfRangeException
+        """
+        return [str()]
+
+    def GetDoubleColumn(self, column):
+        # type: (str | int) -> list[float]
+        """Get column values as a vector of numbers.
+
+        Values are parsed using the invariant culture,
+        so the sheet should be received with ValueRenderMode.Unformatted.\n
+        Empty and non-numeric cells are represented as NaN.
+
+        Args:
+            column (str | int): Column title or zero-based column index.
+
+        Raises:
+            InvalidSheetHeadException
+            ArgumentOutOfRangeException
+        """
+        return [float()]
+
+    def GetLongColumn(self, column):
+        # type: (str | int) -> list[int]
+        """Get column values as a vector of integers.
+
+        Empty cells are represented as 0.
+
+        Args:
+            column (str | int): Column title or zero-based column index.
+
+        Raises:
+            InvalidSheetHeadException
+            ArgumentOutOfRangeException
+            FormatException: The column contains a value that is not an integer.
+        """
+        return [int()]
+
+    def AggregateColumn(self, column):
+        # type: (str | int) -> ColumnAggregate
+        """Calculate count, sum, minimum and maximum of the numeric column.
+
+        Args:
+            column (str | int): Column title or zero-based column index.
+
+        Raises:
+            InvalidSheetHeadException
+            ArgumentOutOfRangeException
+        """
+        return ColumnAggregate()
+
+    def SetValues(self, firstRowNumber, firstColumn, values):
+        # type: (int, int, Array[str]) -> None
+        """Assign values to a rectangular block of cells.
+
+        The first dimension of the array corresponds to rows, the second to columns.\n
+        Row statuses change in the same way as when assigning the Cell.Value property,
+        but only for rows in which at least one value has actually changed.
+
+        Args:
+            firstRowNumber (int): Number of the row of the upper left cell of the block.
+            firstColumn (int): Zero-based index of the column of the upper left cell of the block.
+            values (Array[str]): Two-dimensional block of values, string[,].
+
+        Raises:
+            ArgumentNullException
+            ArgumentOutOfRangeException: The block doesn't fit into the sheet.
+        """
+        pass
+
+    def SetColumn(self, column, values):
+        # type: (str | int, list[str]) -> None
+        """Assign values to the column.
+
+        Values are assigned one for each row starting from the first row of the sheet.\n
+        Row statuses change in the same way as when assigning the Cell.Value property,
+        but only for rows in which the value has actually changed.
+
+        Args:
+            column (str | int): Column title or zero-based column index.
+            values (list[str]): No more values than rows in the sheet.
+
+        Raises:
+            InvalidSheetHeadException
+            ArgumentOutOfRangeException
+            ArgumentNullException
+            ArgumentException: There are more values than rows.
+        """
+        pass
+
+    def SetDoubleColumn(self, column, values):
+        # type: (str | int, Array[float]) -> None
+        """Assign numbers to the column.
+
+        Numbers are written using the invariant culture, NaN is written as an empty cell,
+        so the values are read back by the GetDoubleColumn method.\n
+        Values are assigned in the same way as by the SetColumn method.
+
+        Args:
+            column (str | int): Column title or zero-based column index.
+            values (Array[float]): No more values than rows in the sheet, double[].
+
+        Raises:
+            InvalidSheetHeadException
+            ArgumentOutOfRangeException
+            ArgumentNullException
+            ArgumentException: There are more values than rows.
+        """
+        pass
+
+
+class Array(object):
+    pass
+
 
 class Formatting(object):
     pass
@@ -232,11 +690,106 @@ class JsonSerialization(object):
         return str()
 
     @staticmethod
-    def DeserializeSheet(jsonSheet):
-        # type: (str) -> SheetModel
+    def DeserializeSheet(jsonSheet, poolValues=False):
+        # type: (str, bool) -> SheetModel
         """Deserializes JSON to an instance SheetModel.
 
+        Values are pooled as each row is read,
+        so duplicate values are released during deserialization rather than after it.
+
+        Args:
+            jsonSheet (str):
+            poolValues (bool): Store equal cell values as one string instance,
+                see SheetModel.EnableValuePool.
+
         Returns:
             Deserialized object from string JSON.
         """
         return SheetModel()
+
+    @staticmethod
+    def SerializePatch(patch, formatting):
+        # type: (SheetPatch, Formatting) -> str
+        """Serializes sheet changes to JSON using the selected formatting.
+
+        Returns:
+            The string representation of the object in the format JSON.
+        """
+        return str()
+
+    @staticmethod
+    def DeserializePatch(jsonPatch):
+        # type: (str) -> SheetPatch
+        """Deserializes JSON to an instance SheetPatch.
+
+        Returns:
+            Deserialized object from string JSON.
+        """
+        return SheetPatch()
+
+
+class Stream(object):
+    pass
+
+
+class CsvSerialization(object):
+    """Provides methods for reading and writing sheet rows
+    as delimiter-separated text such as CSV or TSV.
+
+    Quoting follows RFC 4180: values containing the delimiter, quotes or line breaks
+    are enclosed in double quotes and double quotes inside them are doubled.\n
+    Text is read and written in chunks, so the size of the stream doesn't affect memory consumption.
+    """
+
+    Comma = ','
+    """Delimiter of CSV files."""
+
+    Tab = '\t'
+    """Delimiter of TSV files."""
+
+    @staticmethod
+    def ReadRows(stream, delimiter):
+        # type: (Stream, str) -> list[list[str]]
+        """Reads rows from delimiter-separated text one by one.
+
+        Rows are read lazily while the result is being enumerated,
+        so it can be passed directly to the SheetModel.AddRows method.\n
+        The first row of the text is returned like any other row. Blank lines are skipped.\n
+        The encoding is detected by the byte order mark, UTF-8 is used by default.
+        The stream is not closed.\n
+        Each enumeration reads from the current position of the stream,
+        so the position must be reset to read the text again.
+
+        Args:
+            stream (Stream):
+            delimiter (str): Value delimiter, for example CsvSerialization.Comma.
+
+        Returns:
+            Values of each row.
+
+        Raises:
+            ArgumentNullException
+            ArgumentException: The delimiter is a quote or a line break.
+            FormatException: A quoted value is not closed before the end of the text.
+        """
+        return [[str()]]
+
+    @staticmethod
+    def WriteSheet(sheet, stream, delimiter):
+        # type: (SheetModel, Stream, str) -> None
+        """Writes the sheet as delimiter-separated text in UTF-8.
+
+        The head is written first unless the sheet has SheetMode.Simple.\n
+        Rows with RowStatus.ToDelete are not written.\n
+        Rows are separated by CRLF. The stream is not closed.
+
+        Args:
+            sheet (SheetModel):
+            stream (Stream):
+            delimiter (str): Value delimiter, for example CsvSerialization.Comma.
+
+        Raises:
+            ArgumentNullException
+            ArgumentException: The delimiter is a quote or a line break.
+        """
+        pass
@@ -0,0 +1,162 @@
+﻿using Microsoft.VisualStudio.TestTools.UnitTesting;
+using SynSys.GSpreadsheetEasyAccess.Data;
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using System.Text;
+
+namespace SynSys.GSpreadsheetEasyAccess.Tests
+{
+    [TestClass]
+    public class CsvSerializationTests
+    {
+        /// <summary>
+        /// Значения в кавычках могут содержать разделитель, кавычки и переносы строк.
+        /// </summary>
+        [TestMethod]
+        public void ReadRows_QuotedValues()
+        {
+            // arrange
+            string text = "a,\"b, \"\"c\"\"\",\r\n\"multi\nline\",d\n";
+            var stream = new MemoryStream(Encoding.UTF8.GetBytes(text));
+
+            // act
+            List<IList<string>> rows = CsvSerialization.ReadRows(stream, CsvSerialization.Comma).ToList();
+
+            // assert
+            Assert.AreEqual(2, rows.Count);
+            CollectionAssert.AreEqual(new[] { "a", "b, \"c\"", "" }, rows[0].ToArray());
+            CollectionAssert.AreEqual(new[] { "multi\nline", "d" }, rows[1].ToArray());
+        }
+
+        /// <summary>
+        /// Записанный лист читается обратно без потери значений, удаляемые строки не записываются.
+        /// </summary>
+        [TestMethod]
+        public void WriteSheet_ReadRowsReturnsSameValues()
+        {
+            // arrange
+            var sheet = new SheetModel
+            {
+                Mode = SheetMode.Head,
+                Title = "TestTitle",
+                SpreadsheetId = "0000000000",
+                SpreadsheetTitle = "TestSpreadsheetTitle"
+            };
+            sheet.Fill(new List<IList<object>>()
+            {
+                new List<object>() { "Head 1", "Head 2" },
+                new List<object>() { "tab\tvalue", "\"quoted\"" },
+                new List<object>() { "deleted", "row" },
+            });
+            sheet.DeleteRow(sheet.Rows[1]);
+            var stream = new MemoryStream();
+
+            // act
+            CsvSerialization.WriteSheet(sheet, stream, CsvSerialization.Tab);
+            stream.Position = 0;
+            List<IList<string>> rows = CsvSerialization.ReadRows(stream, CsvSerialization.Tab).ToList();
+
+            // assert
+            Assert.AreEqual(2, rows.Count);
+            CollectionAssert.AreEqual(sheet.Head, rows[0].ToList());
+            CollectionAssert.AreEqual(new[] { "tab\tvalue", "\"quoted\"" }, rows[1].ToArray());
+        }
+
+        /// <summary>
+        /// Пустые строки текста пропускаются, пустое значение в кавычках остаётся строкой.
+        /// </summary>
+        [TestMethod]
+        public void ReadRows_SkipsBlankLines()
+        {
+            // arrange
+            string text = "a,b\r\n\r\n\nc,d\n\"\"\n\n";
+            var stream = new MemoryStream(Encoding.UTF8.GetBytes(text));
+
+            // act
+            List<IList<string>> rows = CsvSerialization.ReadRows(stream, CsvSerialization.Comma).ToList();
+
+            // assert
+            Assert.AreEqual(3, rows.Count);
+            CollectionAssert.AreEqual(new[] { "a", "b" }, rows[0].ToArray());
+            CollectionAssert.AreEqual(new[] { "c", "d" }, rows[1].ToArray());
+            CollectionAssert.AreEqual(new[] { "" }, rows[2].ToArray());
+        }
+
+        /// <summary>
+        /// Незакрытые кавычки в конце текста приводят к исключению с номером строки их начала.
+        /// </summary>
+        [TestMethod]
+        public void ReadRows_UnterminatedQuote_Throws()
+        {
+            // arrange
+            string text = "a,b\r\n\"multi\nline\",c\nd,\"open\nvalue";
+            var stream = new MemoryStream(Encoding.UTF8.GetBytes(text));
+
+            // act
+            var exception = Assert.ThrowsException<FormatException>(
+                () => CsvSerialization.ReadRows(stream, CsvSerialization.Comma).ToList()
+            );
+
+            // assert
+            StringAssert.Contains(exception.Message, "line 4");
+        }
+
+        /// <summary>
+        /// Пустые ячейки листа из одного столбца не теряются при записи и чтении.
+        /// </summary>
+        [TestMethod]
+        public void WriteSheet_OneColumnWithEmptyCells_ReadRowsReturnsAllRows()
+        {
+            // arrange
+            var sheet = new SheetModel
+            {
+                Mode = SheetMode.Head,
+                Title = "TestTitle",
+                SpreadsheetId = "0000000000",
+                SpreadsheetTitle = "TestSpreadsheetTitle"
+            };
+            sheet.Fill(new List<IList<object>>()
+            {
+                new List<object>() { "Head 1" },
+                new List<object>() { "a" },
+                new List<object>() { "" },
+                new List<object>() { "b" },
+            });
+            var stream = new MemoryStream();
+
+            // act
+            CsvSerialization.WriteSheet(sheet, stream, CsvSerialization.Comma);
+            stream.Position = 0;
+            List<IList<string>> rows = CsvSerialization.ReadRows(stream, CsvSerialization.Comma).ToList();
+
+            // assert
+            Assert.AreEqual(4, rows.Count);
+            CollectionAssert.AreEqual(new[] { "a" }, rows[1].ToArray());
+            CollectionAssert.AreEqual(new[] { "" }, rows[2].ToArray());
+            CollectionAssert.AreEqual(new[] { "b" }, rows[3].ToArray());
+        }
+
+        /// <summary>
+        /// Результат можно перечислить повторно после возврата позиции потока.
+        /// </summary>
+        [TestMethod]
+        public void ReadRows_EnumeratedAgain_ReadsFromStreamPosition()
+        {
+            // arrange
+            var stream = new MemoryStream(Encoding.UTF8.GetBytes("a,b\r\nc,d\r\n"));
+            IEnumerable<IList<string>> rows = CsvSerialization.ReadRows(stream, CsvSerialization.Comma);
+
+            // act
+            int firstCount = rows.Count();
+            stream.Position = 0;
+            List<IList<string>> secondRows = rows.ToList();
+
+            // assert
+            Assert.AreEqual(2, firstCount);
+            Assert.AreEqual(2, secondRows.Count);
+            CollectionAssert.AreEqual(new[] { "c", "d" }, secondRows[1].ToArray());
+        }
+    }
+}
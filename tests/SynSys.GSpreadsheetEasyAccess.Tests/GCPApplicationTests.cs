@@ -0,0 +1,128 @@
+﻿using Google.Apis.Sheets.v4.Data;
+using Microsoft.VisualStudio.TestTools.UnitTesting;
+using SynSys.GSpreadsheetEasyAccess.Application;
+using System;
+using System.Collections.Generic;
+using System.Linq;
+
+namespace SynSys.GSpreadsheetEasyAccess.Tests
+{
+    [TestClass]
+    public class GCPApplicationTests
+    {
+        GCPApplication app;
+
+        [TestInitialize]
+        public void Init()
+        {
+            app = new GCPApplication();
+        }
+
+        /// <summary>
+        /// Некорректный uri в середине списка сразу приводит к исключению,
+        /// а не обрывает загрузку листов без ошибки.
+        /// </summary>
+        [TestMethod]
+        public void GetSheets_InvalidUriInMiddle_ThrowsImmediately()
+        {
+            // arrange
+            var uris = new List<string>()
+            {
+                "https://docs.google.com/spreadsheets/d/abc/edit#gid=0",
+                "https://docs.google.com/spreadsheets/d/abc/edit#gid=99999999999",
+                "https://docs.google.com/spreadsheets/d/abc/edit#gid=1",
+            };
+
+            // assert
+            Assert.ThrowsException<ArgumentException>(() => app.GetSheets(uris, 2));
+            Assert.ThrowsException<ArgumentException>(
+                () => app.GetSheetsWithHead(new List<string>() { uris[0], null, uris[2] }, 2)
+            );
+        }
+
+        /// <summary>
+        /// Запросы добавления листов идут первыми, за ними запись шапки в каждый лист.
+        /// Столбцов у листа с шапкой не меньше, чем у листа по умолчанию.
+        /// </summary>
+        [TestMethod]
+        public void CreateAddSheetsRequestBody_WithHead()
+        {
+            // arrange
+            var titles = new List<string>() { "First", "Second" };
+            var gids = new List<int>() { 11, 22 };
+            var head = new List<string>() { "Head 1", "Head 2" };
+
+            // act
+            BatchUpdateSpreadsheetRequest body = GCPApplication.CreateAddSheetsRequestBody(titles, gids, head);
+
+            // assert
+            Assert.AreEqual(4, body.Requests.Count);
+
+            for (int i = 0; i < titles.Count; i++)
+            {
+                SheetProperties properties = body.Requests[i].AddSheet.Properties;
+                Assert.AreEqual(gids[i], properties.SheetId);
+                Assert.AreEqual(titles[i], properties.Title);
+                Assert.AreEqual(26, properties.GridProperties.ColumnCount);
+                Assert.AreEqual(1, properties.GridProperties.FrozenRowCount);
+
+                UpdateCellsRequest updateCells = body.Requests[titles.Count + i].UpdateCells;
+                Assert.AreEqual(gids[i], updateCells.Start.SheetId);
+                CollectionAssert.AreEqual(
+                    head,
+                    updateCells.Rows[0].Values.Select(cell => cell.UserEnteredValue.StringValue).ToList()
+                );
+            }
+        }
+
+        /// <summary>
+        /// Листы без шапки не замораживают строки, а широкая шапка помещается в лист целиком.
+        /// </summary>
+        [TestMethod]
+        public void CreateAddSheetsRequestBody_ColumnCount()
+        {
+            // arrange
+            var titles = new List<string>() { "First" };
+            var gids = new List<int>() { 11 };
+            List<string> wideHead = Enumerable.Range(1, 30).Select(i => $"Head {i}").ToList();
+
+            // act
+            BatchUpdateSpreadsheetRequest withoutHead = GCPApplication.CreateAddSheetsRequestBody(titles, gids, null);
+            BatchUpdateSpreadsheetRequest withWideHead = GCPApplication.CreateAddSheetsRequestBody(titles, gids, wideHead);
+
+            // assert
+            Assert.AreEqual(1, withoutHead.Requests.Count);
+            Assert.AreEqual(26, withoutHead.Requests[0].AddSheet.Properties.GridProperties.ColumnCount);
+            Assert.AreEqual(0, withoutHead.Requests[0].AddSheet.Properties.GridProperties.FrozenRowCount);
+            Assert.AreEqual(30, withWideHead.Requests[0].AddSheet.Properties.GridProperties.ColumnCount);
+        }
+
+        /// <summary>
+        /// При повторе запроса новые gid не совпадают с gid существующих листов и друг с другом.
+        /// </summary>
+        [TestMethod]
+        public void GenerateSheetGids_AvoidsExistingSheetGids()
+        {
+            // arrange
+            var spreadsheet = new Spreadsheet()
+            {
+                Sheets = new List<Sheet>()
+                {
+                    new Sheet() { Properties = new SheetProperties() { SheetId = 0 } },
+                    new Sheet() { Properties = new SheetProperties() { SheetId = 5 } },
+                    new Sheet() { Properties = new SheetProperties() },
+                }
+            };
+
+            // act
+            HashSet<int> existingGids = GCPApplication.GetSheetGids(spreadsheet);
+            List<int> gids = GCPApplication.GenerateSheetGids(100, existingGids);
+
+            // assert
+            CollectionAssert.AreEquivalent(new[] { 0, 5 }, existingGids.ToArray());
+            Assert.AreEqual(100, gids.Count);
+            Assert.AreEqual(100, gids.Distinct().Count());
+            Assert.IsTrue(gids.TrueForAll(gid => gid > 0 && !existingGids.Contains(gid)));
+        }
+    }
+}
@@ -0,0 +1,133 @@
+﻿using Microsoft.VisualStudio.TestTools.UnitTesting;
+using SynSys.GSpreadsheetEasyAccess.Application;
+using SynSys.GSpreadsheetEasyAccess.Data;
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Threading;
+
+namespace SynSys.GSpreadsheetEasyAccess.Tests
+{
+    [TestClass]
+    public class SheetAppenderTests
+    {
+        SheetModel sheet;
+
+        [TestInitialize]
+        public void Init()
+        {
+            sheet = new SheetModel
+            {
+                Mode = SheetMode.Head,
+                Title = "TestTitle",
+                SpreadsheetId = "0000000000",
+                SpreadsheetTitle = "TestSpreadsheetTitle"
+            };
+
+            sheet.Fill(new List<IList<object>>()
+            {
+                new List<object>() { "Head 1", "Head 2" },
+            });
+        }
+
+        /// <summary>
+        /// Тест проверяет отправку всех строк при освобождении.<br/>
+        /// Строки должны отправляться пакетами не больше BatchSize
+        /// и иметь размер заголовка листа.
+        /// </summary>
+        [TestMethod]
+        public void Dispose_SendsAllRowsInBatches()
+        {
+            // arrange
+            var batches = new List<IList<IList<object>>>();
+            var appender = new SheetAppender(sheet, rows => batches.Add(rows), 2, TimeSpan.FromHours(1), 10);
+
+            // act
+            appender.Append(new List<string>() { "1" });
+            appender.Append(new List<string>() { "2", "2" });
+            appender.Append(new List<string>() { "3", "3", "3" });
+            appender.Dispose();
+
+            // assert
+            Assert.AreEqual(3, appender.SentRowCount);
+            Assert.IsTrue(batches.All(batch => batch.Count <= 2));
+            Assert.IsTrue(batches.SelectMany(batch => batch).All(row => row.Count == 2));
+        }
+
+        /// <summary>
+        /// Тест проверяет учёт строк из пакетов, которые не удалось отправить.
+        /// </summary>
+        [TestMethod]
+        public void Flush_ReportsFailedBatch()
+        {
+            // arrange
+            var failedRows = 0;
+            var appender = new SheetAppender(
+                sheet,
+                rows => throw new InvalidOperationException(),
+                10,
+                TimeSpan.FromHours(1),
+                10
+            );
+            appender.BatchFailed += (sender, e) => failedRows += e.Rows.Count;
+
+            // act
+            appender.Append(new List<string>() { "1" });
+            appender.Flush();
+            appender.Dispose();
+
+            // assert
+            Assert.AreEqual(1, failedRows);
+            Assert.AreEqual(1, appender.FailedRowCount);
+        }
+
+        /// <summary>
+        /// Тест проверяет освобождение из обработчика BatchFailed, который вызывается в фоновом потоке.<br/>
+        /// Dispose не должен ожидать завершения собственного потока.
+        /// </summary>
+        [TestMethod]
+        public void Dispose_FromBatchFailedHandler_DoesNotDeadlock()
+        {
+            // arrange
+            var disposed = new ManualResetEventSlim(false);
+            var appender = new SheetAppender(
+                sheet,
+                rows => throw new InvalidOperationException(),
+                2,
+                TimeSpan.FromHours(1),
+                10
+            );
+            appender.BatchFailed += (sender, e) =>
+            {
+                appender.Dispose();
+                disposed.Set();
+            };
+
+            // act
+            appender.Append(new List<string>() { "1" });
+            appender.Append(new List<string>() { "2" });
+            bool isDisposed = disposed.Wait(TimeSpan.FromSeconds(10));
+
+            // assert
+            Assert.IsTrue(isDisposed);
+            Assert.AreEqual(2, appender.FailedRowCount);
+            Assert.ThrowsException<ObjectDisposedException>(() => appender.Append(new List<string>() { "3" }));
+        }
+
+        /// <summary>
+        /// После освобождения Flush сообщает об освобождении, а не об ошибке буфера.
+        /// </summary>
+        [TestMethod]
+        public void Flush_AfterDispose_ThrowsObjectDisposedException()
+        {
+            // arrange
+            var appender = new SheetAppender(sheet, rows => { }, 2, TimeSpan.FromHours(1), 10);
+            appender.Append(new List<string>() { "1" });
+            appender.Dispose();
+
+            // assert
+            Assert.AreEqual(1, appender.SentRowCount);
+            Assert.ThrowsException<ObjectDisposedException>(() => appender.Flush());
+        }
+    }
+}
@@ -155,5 +155,639 @@ namespace SynSys.GSpreadsheetEasyAccess.Tests
                 $"\nactual: {changeRow.Status}"
             );
         }
+
+        /// <summary>
+        /// Тест проверяет преобразование неформатированных значений при заполнении листа.<br/>
+        /// Числа и логические значения должны стать строками в инвариантной культуре.
+        /// </summary>
+        [TestMethod]
+        public void Fill_UnformattedValues()
+        {
+            // arrange
+            var data = new List<IList<object>>()
+            {
+                new List<object>() { "Name", "Amount", "Done" },
+                new List<object>() { "a", 1234.5, true },
+                new List<object>() { "b", 42L, false },
+            };
+
+            var typedSheet = new SheetModel { Mode = SheetMode.Head };
+
+            // act
+            typedSheet.Fill(data);
+
+            // assert
+            CollectionAssert.AreEqual(
+                new[] { "1234.5", "42" },
+                typedSheet.Rows.Select(r => r.Cells[1].Value).ToList()
+            );
+            CollectionAssert.AreEqual(
+                new[] { "TRUE", "FALSE" },
+                typedSheet.Rows.Select(r => r.Cells[2].Value).ToList()
+            );
+        }
+
+        /// <summary>
+        /// Тест проверяет агрегаты числовой колонки.<br/>
+        /// Пустые и нечисловые ячейки не должны учитываться.
+        /// </summary>
+        [TestMethod]
+        public void AggregateColumn_SkipNotNumericCells()
+        {
+            // arrange
+            sheet.AddRow(new List<string>() { "1", "", "" });
+            sheet.AddRow(new List<string>() { "-2.5", "", "" });
+            sheet.AddRow(new List<string>() { "10", "", "" });
+
+            // act
+            ColumnAggregate aggregate = sheet.AggregateColumn("Head 1");
+
+            // assert
+            Assert.AreEqual(3, aggregate.Count);
+            Assert.AreEqual(8.5, aggregate.Sum);
+            Assert.AreEqual(-2.5, aggregate.Min);
+            Assert.AreEqual(10.0, aggregate.Max);
+        }
+
+        /// <summary>
+        /// Тест проверяет данные добавляемых строк листа с частью колонок.<br/>
+        /// Значения должны попасть в исходные колонки, остальные ячейки должны быть null.
+        /// </summary>
+        [TestMethod]
+        public void GetAppendRowsData_SelectedColumns()
+        {
+            // arrange
+            var projectedSheet = new SheetModel { Mode = SheetMode.Head };
+            projectedSheet.SelectColumns(
+                new List<object>() { "A", "B", "C", "D" },
+                new[] { "D", "B" }
+            );
+            projectedSheet.Fill(new List<IList<object>>()
+            {
+                new List<object>() { "B", "D" },
+                new List<object>() { "b1", "d1" },
+            });
+
+            // act
+            projectedSheet.AddRow(new List<string>() { "b2", "d2" });
+            var appendRows = projectedSheet.GetAppendRowsData();
+
+            // assert
+            CollectionAssert.AreEqual(new[] { 1, 3 }, projectedSheet.ColumnIndexes);
+            CollectionAssert.AreEqual(
+                new object[] { null, "b2", null, "d2" },
+                appendRows[0].ToList()
+            );
+        }
+
+        /// <summary>
+        /// Тест проверяет нумерацию строк при заполнении окна строк.<br/>
+        /// Номера должны совпадать с номерами строк в Google таблице,
+        /// в том числе у добавляемых строк и после перенумерации.
+        /// </summary>
+        [TestMethod]
+        public void Fill_RowWindowKeepsAbsoluteNumbers()
+        {
+            // arrange
+            var windowSheet = new SheetModel { Mode = SheetMode.Head };
+
+            // act
+            windowSheet.Fill(
+                new List<object>() { "Head 1", "Head 2" },
+                new List<IList<object>>()
+                {
+                    new List<object>() { "a", "b" },
+                    new List<object>() { "c" },
+                },
+                101
+            );
+            windowSheet.AddRow();
+            windowSheet.Rows[0].Status = RowStatus.ToDelete;
+            windowSheet.ClearDeletedRows();
+            windowSheet.RenumberRows();
+
+            // assert
+            CollectionAssert.AreEqual(
+                new[] { 101, 102 },
+                windowSheet.Rows.Select(r => r.Number).ToList()
+            );
+        }
+
+        /// <summary>
+        /// Тест проверяет применение изменений, полученных сравнением двух версий листа.<br/>
+        /// Изменённая строка должна получить статус RowStatus.ToChange,
+        /// удалённая RowStatus.ToDelete, а новая строка должна добавиться.
+        /// </summary>
+        [TestMethod]
+        public void ApplyPatch_DiffWithChangedSheet()
+        {
+            // arrange
+            var otherSheet = new SheetModel
+            {
+                Mode = sheet.Mode,
+                KeyName = sheet.KeyName,
+                Gid = sheet.Gid,
+                Title = sheet.Title,
+                SpreadsheetId = sheet.SpreadsheetId,
+                SpreadsheetTitle = sheet.SpreadsheetTitle
+            };
+            otherSheet.Fill(new List<IList<object>>()
+            {
+                new List<object>() { "Head 1", "Head 2", "Head 3" },
+                new List<object>() { "qwer", "changed", "op[]" },
+                new List<object>() { "asdf", "ghjk", "l;'" },
+            });
+            otherSheet.DeleteRow(otherSheet.Rows[1]);
+            otherSheet.AddRow(new List<string>() { "new" });
+
+            SheetPatch patch = sheet.Diff(otherSheet);
+
+            // act
+            sheet.ApplyPatch(patch);
+
+            // assert
+            Assert.AreEqual(1, patch.CellEdits.Count);
+            Assert.AreEqual("changed", sheet.Rows[0].Cells[1].Value);
+            Assert.AreEqual(RowStatus.ToChange, sheet.Rows[0].Status);
+            Assert.AreEqual(RowStatus.ToDelete, sheet.Rows[1].Status);
+            Assert.AreEqual(RowStatus.ToAppend, sheet.Rows[2].Status);
+            Assert.AreEqual("new", sheet.Rows[2].Cells[0].Value);
+        }
+
+        /// <summary>
+        /// Неизменённые строки разделяются между снимками, изменённые копируются заново.
+        /// </summary>
+        [TestMethod]
+        public void PublishSnapshot_SharesUnchangedRows()
+        {
+            // arrange
+            SheetSnapshot first = sheet.PublishSnapshot();
+            sheet.Rows[0].Cells[1].Value = "changed";
+
+            // act
+            SheetSnapshot second = sheet.PublishSnapshot();
+
+            // assert
+            Assert.AreSame(second, sheet.LatestSnapshot);
+            Assert.IsTrue(second.Version > first.Version);
+            Assert.AreSame(first.Head, second.Head);
+            Assert.AreSame(first.Rows[1], second.Rows[1]);
+            Assert.AreNotSame(first.Rows[0], second.Rows[0]);
+            Assert.AreEqual("tyui", first.Rows[0][1]);
+            Assert.AreEqual("changed", second.Rows[0][1]);
+        }
+
+        /// <summary>
+        /// Одинаковые значения ячеек хранятся одним экземпляром строки, статусы строк не меняются.
+        /// </summary>
+        [TestMethod]
+        public void EnableValuePool_EqualValuesShareInstance()
+        {
+            // arrange
+            sheet.AddRow(new List<string>() { new string('q', 1) + "wer" });
+            sheet.AddRow(new List<string>() { new string('q', 1) + "wer" });
+
+            // act
+            sheet.EnableValuePool();
+
+            // assert
+            Assert.IsTrue(sheet.IsValuePoolEnabled);
+            Assert.AreSame(sheet.Rows[2].Cells[0].Value, sheet.Rows[3].Cells[0].Value);
+            Assert.AreSame(sheet.Rows[0].Cells[0].Value, sheet.Rows[2].Cells[0].Value);
+            Assert.AreEqual(RowStatus.Original, sheet.Rows[0].Status);
+            Assert.AreEqual(RowStatus.ToAppend, sheet.Rows[2].Status);
+        }
+
+        /// <summary>
+        /// Статус меняется только у строк, в которых значения действительно изменились.
+        /// </summary>
+        [TestMethod]
+        public void SetValues_ChangesStatusOfChangedRowsOnly()
+        {
+            // arrange
+            var values = new string[,]
+            {
+                { "tyui", "op[]" },
+                { "changed", "l;'" },
+            };
+
+            // act
+            sheet.SetValues(2, 1, values);
+
+            // assert
+            Assert.AreEqual(RowStatus.Original, sheet.Rows[0].Status);
+            Assert.AreEqual(RowStatus.ToChange, sheet.Rows[1].Status);
+            Assert.AreEqual("changed", sheet.Rows[1].Cells[1].Value);
+        }
+
+        /// <summary>
+        /// Добавленные пакетом строки нумеруются подряд и получают ключевую ячейку.
+        /// </summary>
+        [TestMethod]
+        public void AddRows_NumbersRowsAndFindsKey()
+        {
+            // arrange
+            var rowsData = new List<IList<string>>()
+            {
+                new List<string>() { "key 1" },
+                new List<string>() { "key 2", "value" },
+            };
+
+            // act
+            sheet.AddRows(rowsData);
+
+            // assert
+            Assert.AreEqual(4, sheet.Rows.Count);
+            Assert.AreEqual(4, sheet.Rows[2].Number);
+            Assert.AreEqual(5, sheet.Rows[3].Number);
+            Assert.AreEqual("key 2", sheet.Rows[3].Key.Value);
+            Assert.AreEqual(RowStatus.ToAppend, sheet.Rows[3].Status);
+            Assert.AreEqual(3, sheet.Rows[3].Cells.Count);
+        }
+
+        /// <summary>
+        /// Строки делятся на части не больше заданного числа ячеек, строка целиком попадает в одну часть.
+        /// </summary>
+        [TestMethod]
+        public void GetRowChunks_SplitByCellCount()
+        {
+            // arrange
+            sheet.AddRow(new List<string>() { "1" });
+            sheet.AddRow(new List<string>() { "2" });
+            sheet.AddRow(new List<string>() { "3" });
+
+            // act
+            List<List<Row>> chunks = sheet.GetRowChunks(RowStatus.ToAppend, 7);
+
+            // assert
+            Assert.AreEqual(2, chunks.Count);
+            Assert.AreEqual(2, chunks[0].Count);
+            Assert.AreEqual(1, chunks[1].Count);
+            Assert.AreEqual("3", chunks[1][0].Cells[0].Value);
+        }
+
+        /// <summary>
+        /// Значения листа выгружаются блоком и загружаются обратно тем же блоком.
+        /// </summary>
+        [TestMethod]
+        public void ToArray_AddRowsReturnsSameValues()
+        {
+            // arrange
+            string[,] values = sheet.ToArray();
+
+            // act
+            sheet.AddRows(values);
+
+            // assert
+            Assert.AreEqual(2, values.GetLength(0));
+            Assert.AreEqual(3, values.GetLength(1));
+            Assert.AreEqual("l;'", values[1, 2]);
+            Assert.AreEqual(4, sheet.Rows.Count);
+            CollectionAssert.AreEqual(sheet.GetColumn(1).Take(2).ToArray(), sheet.GetColumn("Head 2").Skip(2).ToArray());
+        }
+
+        /// <summary>
+        /// Числа записываются в инвариантной культуре и читаются обратно, NaN записывается пустой ячейкой.
+        /// </summary>
+        [TestMethod]
+        public void SetDoubleColumn_GetDoubleColumnReturnsSameValues()
+        {
+            // arrange
+            var values = new double[] { 1.5, double.NaN };
+
+            // act
+            sheet.SetDoubleColumn("Head 3", values);
+
+            // assert
+            Assert.AreEqual("1.5", sheet.Rows[0].Cells[2].Value);
+            Assert.AreEqual(string.Empty, sheet.Rows[1].Cells[2].Value);
+            CollectionAssert.AreEqual(values, sheet.GetDoubleColumn("Head 3"));
+        }
+
+        /// <summary>
+        /// Добавленная строка записывается на место удалённой строки вместо добавления и удаления.
+        /// </summary>
+        [TestMethod]
+        public void PlanRowReuse_WritesAppendedRowIntoDeletedRow()
+        {
+            // arrange
+            sheet.DeleteRow(sheet.Rows[0]);
+            sheet.AddRow(new List<string>() { "zxcv", "bnm,", "./" });
+
+            // act
+            bool isReused = sheet.PlanRowReuse();
+
+            // assert
+            Assert.IsTrue(isReused);
+            Assert.AreEqual(2, sheet.Rows.Count);
+            Assert.AreEqual(RowStatus.ToChange, sheet.Rows[0].Status);
+            Assert.AreEqual("zxcv", sheet.Rows[0].Cells[0].Value);
+            Assert.AreEqual("./", sheet.Rows[0].Cells[2].Value);
+            Assert.AreEqual(2, sheet.Rows[0].Number);
+            Assert.AreEqual(3, sheet.Rows[1].Number);
+        }
+
+        /// <summary>
+        /// В строках простого листа разной длины записываются все добавляемые значения,
+        /// а лишние ячейки удалённой строки очищаются.
+        /// </summary>
+        [TestMethod]
+        public void PlanRowReuse_DifferentRowLengths()
+        {
+            // arrange
+            var simpleSheet = new SheetModel { Mode = SheetMode.Simple };
+            simpleSheet.Fill(new List<IList<object>>()
+            {
+                new List<object>() { "a1", "a2" },
+                new List<object>() { "b1", "b2" },
+                new List<object>() { "c1", "c2" },
+            });
+            simpleSheet.DeleteRow(simpleSheet.Rows[0]);
+            simpleSheet.DeleteRow(simpleSheet.Rows[1]);
+            simpleSheet.AddRow(new List<string>() { "d1", "d2" });
+            simpleSheet.AddRow(new List<string>() { "e1", "e2" });
+            Row longRow = simpleSheet.Rows[3];
+            longRow.Cells.Add(new Cell("d3", string.Empty, longRow));
+            simpleSheet.Rows[4].Cells.RemoveAt(1);
+
+            // act
+            bool isReused = simpleSheet.PlanRowReuse();
+
+            // assert
+            Assert.IsTrue(isReused);
+            Assert.AreEqual(3, simpleSheet.Rows.Count);
+            CollectionAssert.AreEqual(new[] { "d1", "d2", "d3" }, simpleSheet.Rows[0].Cells.Select(cell => cell.Value).ToArray());
+            CollectionAssert.AreEqual(new[] { "e1", "" }, simpleSheet.Rows[1].Cells.Select(cell => cell.Value).ToArray());
+            Assert.AreEqual(RowStatus.ToChange, simpleSheet.Rows[0].Status);
+            Assert.AreEqual(RowStatus.ToChange, simpleSheet.Rows[1].Status);
+        }
+
+        /// <summary>
+        /// В листе с частью столбцов строки не переиспользуются,
+        /// так как неполученные столбцы сохранили бы значения удалённой строки.
+        /// </summary>
+        [TestMethod]
+        public void PlanRowReuse_SelectedColumns_NotReused()
+        {
+            // arrange
+            var projectedSheet = new SheetModel { Mode = SheetMode.Head };
+            projectedSheet.SelectColumns(
+                new List<object>() { "A", "B", "C", "D" },
+                new[] { "D", "B" }
+            );
+            projectedSheet.Fill(new List<IList<object>>()
+            {
+                new List<object>() { "B", "D" },
+                new List<object>() { "b1", "d1" },
+                new List<object>() { "b2", "d2" },
+            });
+            projectedSheet.DeleteRow(projectedSheet.Rows[0]);
+            projectedSheet.AddRow(new List<string>() { "b3", "d3" });
+
+            // act
+            bool isReused = projectedSheet.PlanRowReuse();
+
+            // assert
+            Assert.IsFalse(isReused);
+            Assert.AreEqual(3, projectedSheet.Rows.Count);
+            Assert.AreEqual(RowStatus.ToDelete, projectedSheet.Rows[0].Status);
+            Assert.AreEqual("b1", projectedSheet.Rows[0].Cells[0].Value);
+            Assert.AreEqual(RowStatus.ToAppend, projectedSheet.Rows[2].Status);
+        }
+
+        /// <summary>
+        /// Если очистка лишних ячеек дороже сдвига строк, добавление и удаление выполняются отдельно.
+        /// </summary>
+        [TestMethod]
+        public void PlanRowReuse_CheaperSeparately_NotReused()
+        {
+            // arrange
+            var wideSheet = new SheetModel { Mode = SheetMode.Simple };
+            wideSheet.Fill(new List<IList<object>>()
+            {
+                Enumerable.Range(0, 300).Select(i => (object)$"a{i}").ToList(),
+                Enumerable.Range(0, 300).Select(i => (object)$"b{i}").ToList(),
+            });
+            wideSheet.DeleteRow(wideSheet.Rows[1]);
+            wideSheet.AddRow(new List<string>() { "c0" });
+            wideSheet.Rows[2].Cells.RemoveRange(1, 299);
+
+            // act
+            bool isReused = wideSheet.PlanRowReuse();
+
+            // assert
+            Assert.IsFalse(isReused);
+            Assert.AreEqual(3, wideSheet.Rows.Count);
+            Assert.AreEqual(RowStatus.ToDelete, wideSheet.Rows[1].Status);
+            Assert.AreEqual("b0", wideSheet.Rows[1].Cells[0].Value);
+            Assert.AreEqual(RowStatus.ToAppend, wideSheet.Rows[2].Status);
+        }
+
+        /// <summary>
+        /// После переиспользования строки числовой столбец возвращает числа добавленной строки,
+        /// а не ранее разобранные числа удалённой строки.
+        /// </summary>
+        [TestMethod]
+        public void PlanRowReuse_GetDoubleColumn_ReturnsAppendedNumbers()
+        {
+            // arrange
+            var typedSheet = new SheetModel { Mode = SheetMode.Head };
+            typedSheet.Fill(new List<IList<object>>()
+            {
+                new List<object>() { "Name", "Amount" },
+                new List<object>() { "a", 1.5 },
+                new List<object>() { "b", 2.5 },
+            });
+            typedSheet.GetDoubleColumn("Amount");
+            typedSheet.DeleteRow(typedSheet.Rows[0]);
+            typedSheet.AddRow(new List<string>() { "c", "7" });
+
+            // act
+            typedSheet.PlanRowReuse();
+
+            // assert
+            CollectionAssert.AreEqual(new[] { 7, 2.5 }, typedSheet.GetDoubleColumn("Amount"));
+        }
+
+        /// <summary>
+        /// Числа неформатированного листа сохраняются при заполнении и не разбираются повторно.
+        /// </summary>
+        [TestMethod]
+        public void GetDoubleColumn_KeepsUnformattedNumbers()
+        {
+            // arrange
+            var typedSheet = new SheetModel { Mode = SheetMode.Head };
+            typedSheet.Fill(new List<IList<object>>()
+            {
+                new List<object>() { "Name", "Amount" },
+                new List<object>() { "a", 0.1 + 0.2 },
+                new List<object>() { "b", "" },
+            });
+
+            // act
+            double[] numbers = typedSheet.Rows[0].GetNumbers();
+            double[] column = typedSheet.GetDoubleColumn("Amount");
+
+            // assert
+            Assert.AreSame(numbers, typedSheet.Rows[0].GetNumbers());
+            Assert.AreEqual(0.1 + 0.2, column[0]);
+            Assert.IsTrue(double.IsNaN(column[1]));
+        }
+
+        /// <summary>
+        /// Изменение ячейки сбрасывает сохранённые числа строки.
+        /// </summary>
+        [TestMethod]
+        public void GetDoubleColumn_CellChanged_ReturnsNewValue()
+        {
+            // arrange
+            sheet.Rows[0].Cells[1].Value = "1";
+            double[] before = sheet.GetDoubleColumn(1);
+
+            // act
+            sheet.Rows[0].Cells[1].Value = "2";
+            sheet.SetColumn(2, new List<string>() { "3", "4" });
+
+            // assert
+            Assert.AreEqual(1.0, before[0]);
+            Assert.AreEqual(2.0, sheet.GetDoubleColumn(1)[0]);
+            CollectionAssert.AreEqual(new[] { 3.0, 4.0 }, sheet.GetDoubleColumn(2));
+            CollectionAssert.AreEqual(new long[] { 3, 4 }, sheet.GetLongColumn(2));
+        }
+
+        /// <summary>
+        /// В окно строк, которое не доходит до конца листа, нельзя добавлять строки,
+        /// потому что Google добавит их после последней строки всего листа.
+        /// </summary>
+        [TestMethod]
+        public void AddRow_WindowNotReachingSheetEnd_Throws()
+        {
+            // arrange
+            var windowSheet = new SheetModel { Mode = SheetMode.Head };
+            windowSheet.Fill(
+                new List<object>() { "Head 1", "Head 2" },
+                new List<IList<object>>()
+                {
+                    new List<object>() { "a", "b" },
+                },
+                101,
+                150
+            );
+
+            // assert
+            Assert.ThrowsException<System.InvalidOperationException>(() => windowSheet.AddRow());
+            Assert.ThrowsException<System.InvalidOperationException>(
+                () => windowSheet.AddRows(new List<IList<string>>() { new List<string>() { "c", "d" } })
+            );
+            Assert.AreEqual(1, windowSheet.Rows.Count);
+            Assert.AreEqual(150, windowSheet.LastRowNumber);
+        }
+
+        /// <summary>
+        /// Строки, которые уже ожидают добавления в исходном листе, не добавляются повторно,
+        /// а их изменения переносятся как изменения ячеек.
+        /// </summary>
+        [TestMethod]
+        public void ApplyPatch_PendingAppendedRows_NotDuplicated()
+        {
+            // arrange
+            var otherSheet = new SheetModel
+            {
+                Mode = sheet.Mode,
+                KeyName = sheet.KeyName,
+                Gid = sheet.Gid,
+                Title = sheet.Title,
+                SpreadsheetId = sheet.SpreadsheetId,
+                SpreadsheetTitle = sheet.SpreadsheetTitle
+            };
+            otherSheet.Fill(new List<IList<object>>()
+            {
+                new List<object>() { "Head 1", "Head 2", "Head 3" },
+                new List<object>() { "qwer", "tyui", "op[]" },
+                new List<object>() { "asdf", "ghjk", "l;'" },
+            });
+            sheet.AddRow(new List<string>() { "new" });
+            otherSheet.AddRow(new List<string>() { "new", "edited" });
+
+            SheetPatch patch = sheet.Diff(otherSheet);
+
+            // act
+            sheet.ApplyPatch(patch);
+
+            // assert
+            Assert.AreEqual(0, patch.AppendedRows.Count);
+            Assert.AreEqual(3, sheet.Rows.Count);
+            Assert.AreEqual(RowStatus.ToAppend, sheet.Rows[2].Status);
+            Assert.AreEqual("edited", sheet.Rows[2].Cells[1].Value);
+        }
+
+        /// <summary>
+        /// После цикла обновления листа неизменённые строки сохраняют свои снимки.
+        /// </summary>
+        [TestMethod]
+        public void PublishSnapshot_AfterUpdateCycle_SharesUntouchedRows()
+        {
+            // arrange
+            SheetSnapshot first = sheet.PublishSnapshot();
+            sheet.Rows[0].Cells[1].Value = "changed";
+
+            // act
+            sheet.ClearDeletedRows();
+            sheet.RenumberRows();
+            sheet.ResetRowStatuses();
+            SheetSnapshot second = sheet.PublishSnapshot();
+
+            // assert
+            Assert.AreSame(first.Rows[1], second.Rows[1]);
+            Assert.AreNotSame(first.Rows[0], second.Rows[0]);
+            Assert.AreEqual(RowStatus.Original, second.Rows[0].Status);
+            Assert.AreEqual("changed", second.Rows[0][1]);
+        }
+
+        /// <summary>
+        /// Колонка с небольшим числом различных значений хранит их одним экземпляром,
+        /// а колонка с уникальными значениями перестаёт объединяться и не удерживает их в пуле.
+        /// </summary>
+        [TestMethod]
+        public void ValuePool_StopsPoolingHighCardinalityColumn()
+        {
+            // arrange
+            var pool = new ValuePool(100);
+            var statuses = new List<string>();
+
+            // act
+            for (int i = 0; i < 1000; i++)
+            {
+                pool.Get(0, "id" + i);
+                statuses.Add(pool.Get(1, i % 2 == 0 ? new string('o', 1) + "pen" : new string('c', 1) + "losed"));
+            }
+
+            // assert
+            Assert.IsFalse(pool.IsPooling(0));
+            Assert.IsTrue(pool.IsPooling(1));
+            Assert.AreEqual(2, pool.Count);
+            Assert.AreSame(statuses[0], statuses[998]);
+            Assert.AreSame(statuses[1], statuses[999]);
+        }
+
+        /// <summary>
+        /// При десериализации с объединением значений одинаковые значения столбца хранятся одним экземпляром.
+        /// </summary>
+        [TestMethod]
+        public void DeserializeSheet_PoolValues_EqualValuesShareInstance()
+        {
+            // arrange
+            sheet.Rows[1].Cells[1].Value = "tyui";
+            string json = JsonSerialization.SerializeSheet(sheet, Newtonsoft.Json.Formatting.None);
+
+            // act
+            SheetModel deserializedSheet = JsonSerialization.DeserializeSheet(json, true);
+
+            // assert
+            Assert.IsTrue(deserializedSheet.IsValuePoolEnabled);
+            Assert.AreEqual("tyui", deserializedSheet.Rows[1].Cells[1].Value);
+            Assert.AreSame(deserializedSheet.Rows[0].Cells[1].Value, deserializedSheet.Rows[1].Cells[1].Value);
+            Assert.AreEqual(RowStatus.ToChange, deserializedSheet.Rows[1].Status);
+        }
     }
 }
@@ -0,0 +1,171 @@
+﻿using Microsoft.VisualStudio.TestTools.UnitTesting;
+using SynSys.GSpreadsheetEasyAccess.Application;
+using SynSys.GSpreadsheetEasyAccess.Data;
+using System;
+using System.Collections.Generic;
+using System.Threading;
+
+namespace SynSys.GSpreadsheetEasyAccess.Tests
+{
+    [TestClass]
+    public class SheetWatcherTests
+    {
+        IList<IList<object>> data;
+
+        [TestInitialize]
+        public void Init()
+        {
+            data = new List<IList<object>>()
+            {
+                new List<object>() { "Head 1", "Head 2" },
+                new List<object>() { "qwer", "tyui" },
+            };
+        }
+
+        /// <summary>
+        /// Без изменений значения не приводят к событию, а интервал проверки увеличивается.
+        /// </summary>
+        [TestMethod]
+        public void Poll_UnchangedValuesIncreaseInterval()
+        {
+            // arrange
+            int changedCount = 0;
+
+            using (SheetWatcher watcher = CreateWatcher(null))
+            {
+                watcher.SheetChanged += (sender, e) => changedCount++;
+
+                // act
+                watcher.Poll();
+
+                // assert
+                Assert.AreEqual(0, changedCount);
+                Assert.AreEqual(TimeSpan.FromHours(2), watcher.CurrentInterval);
+            }
+        }
+
+        /// <summary>
+        /// Изменённое значение передаётся подписчикам в виде изменений строк.
+        /// </summary>
+        [TestMethod]
+        public void Poll_ChangedValueRaisesSheetChanged()
+        {
+            // arrange
+            SheetChangedEventArgs args = null;
+
+            using (SheetWatcher watcher = CreateWatcher(null))
+            {
+                watcher.SheetChanged += (sender, e) => args = e;
+                data[1][1] = "changed";
+
+                // act
+                watcher.Poll();
+
+                // assert
+                Assert.IsNotNull(args);
+                Assert.AreEqual(1, args.Patch.CellEdits.Count);
+                Assert.AreEqual("changed", args.Patch.CellEdits[0].Value);
+                Assert.AreSame(args.Sheet, watcher.Sheet);
+            }
+        }
+
+        /// <summary>
+        /// Пока метка версии не изменилась, значения листа не запрашиваются.
+        /// </summary>
+        [TestMethod]
+        public void Poll_SameVersionStampDoesNotFetchValues()
+        {
+            // arrange
+            using (SheetWatcher watcher = CreateWatcher(() => "1"))
+            {
+                data[1][1] = "changed";
+
+                // act
+                watcher.Poll();
+
+                // assert
+                Assert.AreEqual(1, watcher.FetchCount);
+                Assert.AreEqual("tyui", watcher.Sheet.Rows[0].Cells[1].Value);
+            }
+        }
+
+        /// <summary>
+        /// Исключение подписчика SheetChanged не выдаётся за неудачную проверку листа.
+        /// </summary>
+        [TestMethod]
+        public void Poll_SheetChangedHandlerThrows_PollFailedNotRaised()
+        {
+            // arrange
+            int failedCount = 0;
+
+            using (SheetWatcher watcher = CreateWatcher(null))
+            {
+                watcher.SheetChanged += (sender, e) => throw new InvalidOperationException();
+                watcher.PollFailed += (sender, e) => failedCount++;
+                data[1][1] = "changed";
+
+                // assert
+                Assert.ThrowsException<InvalidOperationException>(() => watcher.Poll());
+                Assert.AreEqual(0, failedCount);
+                Assert.AreEqual("changed", watcher.Sheet.Rows[0].Cells[1].Value);
+            }
+        }
+
+        /// <summary>
+        /// Освобождение наблюдателя из обработчика PollFailed не приводит к взаимоблокировке.
+        /// </summary>
+        [TestMethod]
+        public void Dispose_FromPollFailedHandler_DoesNotDeadlock()
+        {
+            // arrange
+            int fetchCount = 0;
+            var disposed = new ManualResetEventSlim(false);
+            var watcher = new SheetWatcher(
+                null,
+                () => fetchCount++ == 0 ? data : throw new InvalidOperationException(),
+                CreateSheet,
+                TimeSpan.FromMilliseconds(10),
+                TimeSpan.FromMilliseconds(10)
+            );
+            watcher.PollFailed += (sender, e) =>
+            {
+                watcher.Dispose();
+                disposed.Set();
+            };
+
+            // act
+            bool isDisposed = disposed.Wait(TimeSpan.FromSeconds(10));
+
+            // assert
+            Assert.IsTrue(isDisposed);
+            Assert.AreEqual(1, watcher.PollCount);
+        }
+
+
+        private SheetWatcher CreateWatcher(Func<string> getVersionStamp)
+        {
+            return new SheetWatcher(
+                getVersionStamp,
+                () => data,
+                CreateSheet,
+                TimeSpan.FromHours(1),
+                TimeSpan.FromHours(4)
+            );
+        }
+
+        private static SheetModel CreateSheet(IList<IList<object>> data)
+        {
+            var sheet = new SheetModel
+            {
+                Mode = SheetMode.Head,
+                Title = "TestTitle",
+                SpreadsheetId = "0000000000",
+                SpreadsheetTitle = "TestSpreadsheetTitle"
+            };
+
+            sheet.Fill(data);
+
+            return sheet;
+        }
+    }
+}
@@ -0,0 +1,83 @@
+﻿using Google.Apis.Sheets.v4.Data;
+using Microsoft.VisualStudio.TestTools.UnitTesting;
+using SynSys.GSpreadsheetEasyAccess.Application;
+using SynSys.GSpreadsheetEasyAccess.Data;
+using System.Collections.Generic;
+using System.Linq;
+
+namespace SynSys.GSpreadsheetEasyAccess.Tests
+{
+    [TestClass]
+    public class ValueRangeConverterTests
+    {
+        SheetModel sheet;
+
+        [TestInitialize]
+        public void Init()
+        {
+            sheet = new SheetModel
+            {
+                Mode = SheetMode.Head,
+                Title = "Test 'Title'",
+                SpreadsheetId = "0000000000",
+                SpreadsheetTitle = "TestSpreadsheetTitle"
+            };
+            sheet.Fill(new List<IList<object>>()
+            {
+                new List<object>() { "Head 1", "Head 2" },
+                new List<object>() { "a", "1" },
+                new List<object>() { "b", "2" },
+                new List<object>() { "c", "3" },
+                new List<object>() { "d", "4" },
+            });
+        }
+
+        /// <summary>
+        /// Строки с последовательными номерами объединяются в один диапазон,
+        /// диапазон начинается с номера первой строки группы, а название листа экранируется.
+        /// </summary>
+        [TestMethod]
+        public void ToChangeValueRanges_GroupsConsecutiveRows()
+        {
+            // arrange
+            sheet.Rows[0].Cells[1].Value = "10";
+            sheet.Rows[1].Cells[1].Value = "20";
+            sheet.Rows[3].Cells[1].Value = "40";
+            List<Row> rows = sheet.Rows.FindAll(row => row.Status == RowStatus.ToChange);
+
+            // act
+            IList<ValueRange> valueRanges = ValueRangeConverter.ToChangeValueRanges(sheet, rows);
+
+            // assert
+            Assert.AreEqual(2, valueRanges.Count);
+            Assert.AreEqual("'Test ''Title'''!A2", valueRanges[0].Range);
+            Assert.AreEqual("'Test ''Title'''!A5", valueRanges[1].Range);
+            CollectionAssert.AreEqual(new object[] { "a", "10" }, valueRanges[0].Values[0].ToArray());
+            CollectionAssert.AreEqual(new object[] { "b", "20" }, valueRanges[0].Values[1].ToArray());
+            Assert.AreEqual(1, valueRanges[1].Values.Count);
+            CollectionAssert.AreEqual(new object[] { "d", "40" }, valueRanges[1].Values[0].ToArray());
+        }
+
+        /// <summary>
+        /// Добавляемые строки передаются по порядку и без диапазона,
+        /// так как их место определяет запрос добавления.
+        /// </summary>
+        [TestMethod]
+        public void ToAppendValueRange_ContainsRowsInOrder()
+        {
+            // arrange
+            sheet.AddRow(new List<string>() { "e", "5" });
+            sheet.AddRow(new List<string>() { "f", "6" });
+            List<Row> rows = sheet.Rows.FindAll(row => row.Status == RowStatus.ToAppend);
+
+            // act
+            ValueRange valueRange = ValueRangeConverter.ToAppendValueRange(sheet, rows);
+
+            // assert
+            Assert.IsNull(valueRange.Range);
+            Assert.AreEqual(2, valueRange.Values.Count);
+            CollectionAssert.AreEqual(new object[] { "e", "5" }, valueRange.Values[0].ToArray());
+            CollectionAssert.AreEqual(new object[] { "f", "6" }, valueRange.Values[1].ToArray());
+        }
+    }
+}